@@ -2,6 +2,33 @@
 SmartHeatZones - Multi-zone heating controller
 Version: 1.9.1
 
+NEW in v1.10.0 (in development):
+- BoilerManager reads its tuning (piggyback concurrency) from common settings
+- Shared ZoneEventDispatcher created next to the BoilerManager
+- Shared OutdoorTemperatureService attached to the common outdoor sensor
+- Common settings updates applied in place, followed by one batched evaluation
+- One batched evaluation of all zones when Home Assistant has started
+- Pre-heat store (learned heat-up rates) loaded once before the first zone
+- Common settings entry sets up the sensor platform (system sensors fed by
+  the BoilerManager); the BoilerManager is created by whichever entry loads first
+- Heating time tracker (on-time accumulators, "heating_time" store) shared by
+  the zone and boiler duration sensors
+- Runtime state store ("runtime"): zone heating flags, filtered temperatures
+  and the commanded boiler state, restored by the startup pass
+- Zones wait for a readiness event of the common settings entry instead of
+  raising ConfigEntryNotReady (no retry backoff after a reboot); zone setup
+  timing is logged
+- Zone options updates applied to the running zone entity in place; the entry
+  is reloaded only when the temperature sensor changed or the zone is not loaded
+- Diagnostics platform (diagnostics.py); a deleted zone's latency histograms
+  are dropped from the shared metrics
+- A deleted zone's stored runtime state, learned heat-up rates and heating
+  time totals are removed, and its counters dropped (a new zone with the same
+  name starts clean)
+- The BoilerManager's reconciliation sweep and pending timers, the heating
+  time and counter timers are stopped and the relay queue's state
+  subscriptions released when the last entry unloads
+
 CHANGELOG v1.9.1 (BUGFIX)
 - Fixed: Removing the outdoor temperature sensor is not removed from settings
 
@@ -38,25 +65,44 @@ NEW in v1.6.0:
 - Entry ordering (common settings first)
 """
 
+import asyncio
 import logging
 from homeassistant.core import HomeAssistant
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.start import async_at_started
 
 from .const import (
     DOMAIN,
     PLATFORMS,
+    COMMON_PLATFORMS,
     DATA_BOILER_MAIN,
+    DATA_RELAY_QUEUE,
     DATA_ACTIVE_ZONES,
     DATA_ENTRIES,
     DATA_COMMON_SETTINGS,
+    DATA_DISPATCHER,
+    DATA_OUTDOOR_TEMP,
+    DATA_PREHEAT_STORE,
+    DATA_HEATING_TIME,
+    DATA_RUNTIME_STORE,
+    DATA_COUNTERS,
+    DATA_COMMON_READY,
+    DATA_SETUP_STARTED,
+    COMMON_SETTINGS_WAIT_TIMEOUT,
     CONF_IS_COMMON_SETTINGS,
+    CONF_OUTDOOR_SENSOR,
     COMMON_SETTINGS_TITLE,
     ERR_NO_COMMON_SETTINGS,
     ERR_CANNOT_DELETE_COMMON,
     LOG_PREFIX,
 )
 from .boiler_manager import BoilerManager
+from .dispatcher import ZoneEventDispatcher
+from .heating_time import HeatingTimeTracker
+from .metrics import get_metrics
+from .outdoor import OutdoorTemperatureService
+from .storage import ZoneDataStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -71,6 +117,44 @@ def _get_common_settings_entry(hass: HomeAssistant):
             return entry
     return None
 
+def _get_common_settings_data(entry: ConfigEntry) -> dict:
+    """Common settings values (options if available, otherwise data)."""
+    return entry.options if entry.options else entry.data
+
+def _get_common_ready(hass: HomeAssistant) -> asyncio.Event:
+    """Readiness event of the common settings entry (zones wait on it)."""
+    return hass.data[DOMAIN].setdefault(DATA_COMMON_READY, asyncio.Event())
+
+def _get_boiler_manager(hass: HomeAssistant) -> BoilerManager:
+    """Shared BoilerManager (created on first use)."""
+    if DATA_BOILER_MAIN not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_BOILER_MAIN] = BoilerManager(hass)
+        _LOGGER.debug("%s BoilerManager instance created", LOG_PREFIX)
+        # Zones added during startup are evaluated together once HA has started
+        async_at_started(hass, hass.data[DOMAIN][DATA_BOILER_MAIN].async_startup_evaluation)
+    else:
+        _LOGGER.debug("%s Reusing existing BoilerManager instance", LOG_PREFIX)
+    return hass.data[DOMAIN][DATA_BOILER_MAIN]
+
+async def _async_setup_runtime_store(hass: HomeAssistant):
+    """Runtime state store (restart without re-actuation), shared with the BoilerManager."""
+    if DATA_RUNTIME_STORE in hass.data[DOMAIN]:
+        return
+    store = ZoneDataStore(hass, "runtime")
+    await store.async_load()
+    _get_boiler_manager(hass).attach_runtime_store(store)
+    hass.data[DOMAIN][DATA_RUNTIME_STORE] = store
+
+async def _async_setup_heating_time(hass: HomeAssistant):
+    """Shared heating time tracker (zone and boiler on-time accumulators)."""
+    if DATA_HEATING_TIME in hass.data[DOMAIN]:
+        return
+    store = ZoneDataStore(hass, "heating_time")
+    await store.async_load()
+    tracker = HeatingTimeTracker(hass, store)
+    tracker.attach_boiler(_get_boiler_manager(hass))
+    hass.data[DOMAIN][DATA_HEATING_TIME] = tracker
+
 def _count_zone_entries(hass: HomeAssistant) -> int:
     """Count non-common-settings entries (zones)."""
     count = 0
@@ -97,14 +181,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     # Initialize domain data structure
     hass.data.setdefault(DOMAIN, {})
+    setup_started = hass.loop.time()
+    hass.data[DOMAIN].setdefault(DATA_SETUP_STARTED, setup_started)
 
     # Common settings entry
     if is_common:
         hass.data[DOMAIN][DATA_COMMON_SETTINGS] = entry
         _LOGGER.info("%s Common settings registered", LOG_PREFIX)
-        
-        # Common settings don't create climate entities, just store config
-        # No platform setup needed
+
+        _get_boiler_manager(hass).configure(_get_common_settings_data(entry))
+        await _async_setup_runtime_store(hass)
+        await _async_setup_heating_time(hass)
+
+        # NEW v1.10.0: options changes are applied in place (no zone reloads)
+        entry.async_on_unload(entry.add_update_listener(async_common_settings_updated))
+
+        # Common settings don't create climate entities - only the system
+        # sensors (active zones, boiler status) fed by the BoilerManager
+        await hass.config_entries.async_forward_entry_setups(entry, COMMON_PLATFORMS)
+
+        # NEW v1.10.0: release the zones waiting for the common settings
+        _get_common_ready(hass).set()
         return True
 
     # Zone entry - validate common settings exist
@@ -116,12 +213,44 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         )
         raise ConfigEntryNotReady(ERR_NO_COMMON_SETTINGS)
 
+    # NEW v1.10.0: the common settings entry may still be loading - wait for it
+    # instead of failing (ConfigEntryNotReady would put the zone on retry backoff)
+    common_ready = _get_common_ready(hass)
+    if not common_ready.is_set():
+        _LOGGER.debug("%s Zone '%s' waiting for common settings", LOG_PREFIX, entry.title)
+        try:
+            async with asyncio.timeout(COMMON_SETTINGS_WAIT_TIMEOUT):
+                await common_ready.wait()
+        except TimeoutError as err:
+            raise ConfigEntryNotReady(ERR_NO_COMMON_SETTINGS) from err
+    waited = hass.loop.time() - setup_started
+
     # Initialize BoilerManager (shared singleton)
-    if DATA_BOILER_MAIN not in hass.data[DOMAIN]:
-        hass.data[DOMAIN][DATA_BOILER_MAIN] = BoilerManager(hass)
-        _LOGGER.debug("%s BoilerManager instance created", LOG_PREFIX)
-    else:
-        _LOGGER.debug("%s Reusing existing BoilerManager instance", LOG_PREFIX)
+    _get_boiler_manager(hass).configure(_get_common_settings_data(common_entry))
+
+    # Shared event dispatcher (one state listener per entity for all zones)
+    if DATA_DISPATCHER not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_DISPATCHER] = ZoneEventDispatcher(hass)
+        _LOGGER.debug("%s Event dispatcher created", LOG_PREFIX)
+
+    # Shared outdoor temperature service (adaptive hysteresis band)
+    if DATA_OUTDOOR_TEMP not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_OUTDOOR_TEMP] = OutdoorTemperatureService(
+            hass, hass.data[DOMAIN][DATA_DISPATCHER]
+        )
+    hass.data[DOMAIN][DATA_OUTDOOR_TEMP].configure(
+        _get_common_settings_data(common_entry).get(CONF_OUTDOOR_SENSOR)
+    )
+
+    # Learned heat-up rates (predictive pre-heat)
+    if DATA_PREHEAT_STORE not in hass.data[DOMAIN]:
+        preheat_store = ZoneDataStore(hass, "preheat")
+        await preheat_store.async_load()
+        hass.data[DOMAIN][DATA_PREHEAT_STORE] = preheat_store
+
+    # Runtime state (restore after restart) + heating time accumulators (duration sensors)
+    await _async_setup_runtime_store(hass)
+    await _async_setup_heating_time(hass)
 
     # Active zones collection
     hass.data[DOMAIN].setdefault(DATA_ACTIVE_ZONES, set())
@@ -131,21 +260,56 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     hass.data[DOMAIN][DATA_ENTRIES][entry_id] = entry
     _LOGGER.debug("%s Registered zone entry: %s", LOG_PREFIX, entry.title)
 
-    # Load climate platform for zones
+    # Load climate + sensor (heating time) platforms for zones
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    _LOGGER.info("%s %s – climate platform initialized", LOG_PREFIX, entry.title)
+    _LOGGER.info(
+        "%s %s – climate and sensor platforms initialized in %.2fs (%.2fs waiting for common settings, "
+        "%.2fs after integration setup started)",
+        LOG_PREFIX, entry.title, hass.loop.time() - setup_started, waited,
+        hass.loop.time() - hass.data[DOMAIN][DATA_SETUP_STARTED]
+    )
 
     # Update listener for options changes
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_zone_options_updated))
     _LOGGER.debug("%s Update listener registered for %s", LOG_PREFIX, entry.title)
 
     return True
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry):
-    """Reload entry when options change."""
-    _LOGGER.info("%s Reloading entry due to options update: %s", LOG_PREFIX, entry.title)
-    await hass.config_entries.async_reload(entry.entry_id)
+async def async_zone_options_updated(hass: HomeAssistant, entry: ConfigEntry):
+    """Zone options changed: apply to the running entity, reload only if required."""
+    zone_data = entry.options if entry.options else entry.data
+    boiler_manager = hass.data.get(DOMAIN, {}).get(DATA_BOILER_MAIN)
+    zone_entity = boiler_manager.get_zone_entity(entry.title) if boiler_manager else None
+
+    reason = zone_entity.options_reload_reason(zone_data) if zone_entity else "zone entity not loaded"
+    if reason:
+        _LOGGER.info("%s Reloading entry due to options update: %s (%s)", LOG_PREFIX, entry.title, reason)
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    changed = await zone_entity.async_apply_zone_options(zone_data)
+    if not changed:
+        _LOGGER.debug("%s Options update for %s - nothing changed", LOG_PREFIX, entry.title)
+
+
+async def async_common_settings_updated(hass: HomeAssistant, entry: ConfigEntry):
+    """Common settings changed: apply to shared services and zones, then one batched pass."""
+    settings = _get_common_settings_data(entry)
+    domain_data = hass.data.get(DOMAIN, {})
+    boiler_manager = domain_data.get(DATA_BOILER_MAIN)
+    if boiler_manager is None:
+        # No zones yet - nothing to apply
+        return
+
+    _LOGGER.info("%s Common settings updated - applying to all zones", LOG_PREFIX)
+    boiler_manager.configure(settings)
+    if DATA_OUTDOOR_TEMP in domain_data:
+        domain_data[DATA_OUTDOOR_TEMP].configure(settings.get(CONF_OUTDOOR_SENSOR))
+    for zone_entity in boiler_manager.get_zone_entities():
+        zone_entity.apply_common_settings(settings)
+
+    await boiler_manager.async_evaluate_all("Common settings updated")
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
@@ -155,10 +319,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     is_common = entry.data.get(CONF_IS_COMMON_SETTINGS, False)
 
     if is_common:
-        # Common settings unload - just cleanup
+        # Common settings unload - system sensors + cleanup
+        unload_ok = await hass.config_entries.async_unload_platforms(entry, COMMON_PLATFORMS)
         hass.data[DOMAIN].pop(DATA_COMMON_SETTINGS, None)
+        _get_common_ready(hass).clear()
         _LOGGER.info("%s Common settings unloaded", LOG_PREFIX)
-        return True
+        _stop_if_last_entry(hass, entry)
+        return unload_ok
 
     # Zone unload
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -175,9 +342,47 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         _LOGGER.debug("%s No active zones remain.", LOG_PREFIX)
 
     _LOGGER.info("%s %s – zone entry unloaded", LOG_PREFIX, entry.title)
+    _stop_if_last_entry(hass, entry)
     return unload_ok
 
 
+def _stop_if_last_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """NEW v1.10.0: no entry left loaded - stop the shared timers and release the relay subscriptions."""
+    if any(
+        other.entry_id != entry.entry_id and other.state is ConfigEntryState.LOADED
+        for other in hass.config_entries.async_entries(DOMAIN)
+    ):
+        return
+    domain_data = hass.data.get(DOMAIN, {})
+    if DATA_BOILER_MAIN in domain_data:
+        domain_data[DATA_BOILER_MAIN].shutdown()
+    if DATA_RELAY_QUEUE in domain_data:
+        domain_data[DATA_RELAY_QUEUE].shutdown()
+    if DATA_HEATING_TIME in domain_data:
+        domain_data[DATA_HEATING_TIME].shutdown()
+    if DATA_COUNTERS in domain_data:
+        domain_data[DATA_COUNTERS].shutdown()
+    _LOGGER.debug("%s Last entry unloaded - shared timers stopped", LOG_PREFIX)
+
+
+async def _async_remove_zone_data(hass: HomeAssistant, zone: str):
+    """NEW v1.10.0: forget a deleted zone's stored state and counters."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_COUNTERS in domain_data:
+        domain_data[DATA_COUNTERS].remove_zone(zone)
+    if DATA_HEATING_TIME in domain_data:
+        domain_data[DATA_HEATING_TIME].remove_zone(zone)
+    else:
+        await ZoneDataStore(hass, "heating_time").async_remove(zone)
+    for data_key, store_name in ((DATA_RUNTIME_STORE, "runtime"), (DATA_PREHEAT_STORE, "preheat")):
+        if data_key in domain_data:
+            domain_data[data_key].remove(zone)
+        else:
+            # Integration not loaded: update the file directly
+            await ZoneDataStore(hass, store_name).async_remove(zone)
+    _LOGGER.debug("%s Stored data of %s removed", LOG_PREFIX, zone)
+
+
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Entry removal - with deletion protection for common settings."""
     is_common = entry.data.get(CONF_IS_COMMON_SETTINGS, False)
@@ -203,6 +408,8 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
         else:
             if DATA_ENTRIES in domain_data:
                 domain_data[DATA_ENTRIES].pop(entry.entry_id, None)
+            get_metrics(hass).remove_zone(entry.title)
+            await _async_remove_zone_data(hass, entry.title)
             if DATA_ACTIVE_ZONES in domain_data:
                 zones = domain_data[DATA_ACTIVE_ZONES]
                 domain_data[DATA_ACTIVE_ZONES] = {z for z in zones if not z.startswith(entry.title)}
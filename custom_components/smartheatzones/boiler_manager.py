@@ -2,6 +2,36 @@
 SmartHeatZones - Boiler Manager
 Version: 1.9.1
 
+NEW in v1.10.0 (in development):
+- Piggyback fan-out runs concurrently, bounded by the piggyback concurrency setting
+- Re-entrant turn_on calls during the fan-out are collapsed into one
+- Fan-out duration reported in get_boiler_state()
+- Coalescing boiler command queue: a stop waits for the coalesce window and is
+  cancelled by a new demand inside it (starts are not delayed by the window),
+  minimum on/off times are enforced, avoided starts are counted
+- Batched whole-house evaluation (async_evaluate_all): one pass over an
+  array-backed snapshot of all zones, one consolidated set of relay and
+  boiler commands (outdoor jumps, common settings updates, startup)
+- Listener callbacks (async_add_listener) fired only when the set of heating
+  zones or the boiler state changes - feeds the system sensors
+- Runtime state restore: commanded boiler state persisted; at startup the
+  heating zones and the boiler are adopted from the live relay states when
+  they match the stored demand - no redundant switch commands after a restart
+- Zones added while Home Assistant is running get their first evaluation in
+  one batched pass (request_first_evaluation); startup timing is logged
+- Boiler call, batched switch call and piggyback fan-out durations recorded
+  in the control loop metrics
+- Boiler starts and piggyback fan-outs counted per hour / day (diagnostic
+  counter sensors)
+- Batched relay commands go through the shared relay command queue
+  (confirmed, retried); a zone whose relays all failed to switch on is left
+  off and does not request the boiler
+- Reconciliation sweep every RELAY_CHECK_INTERVAL: every zone's desired relay
+  state, the heating zone set and the boiler are compared with the state
+  machine in one pass; drift is corrected with batched commands and counted
+- shutdown() cancels the sweep and the pending timers when the last entry
+  unloads; the sweep restarts with the next zone
+
 CHANGELOG v1.9.1 (BUGFIX)
 - Fixed: Removing the outdoor temperature sensor is not removed from settings
 
@@ -14,16 +44,45 @@ NEW in v1.8.1:
 - Piggyback heating: When boiler turns on, all zones with temp < target turn on immediately
 """
 
+import asyncio
 import logging
-from typing import Optional, TYPE_CHECKING
-from homeassistant.core import HomeAssistant
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, Optional, TYPE_CHECKING
+from homeassistant.core import HomeAssistant, CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
     DATA_BOILER_MAIN,
     DATA_ACTIVE_ZONES,
+    DATA_SETUP_STARTED,
+    CONF_BOILER_MAIN,
+    CONF_PIGGYBACK_CONCURRENCY,
+    CONF_BOILER_COALESCE_WINDOW,
+    CONF_BOILER_MIN_ON_TIME,
+    CONF_BOILER_MIN_OFF_TIME,
+    DEFAULT_PIGGYBACK_CONCURRENCY,
+    DEFAULT_BOILER_COALESCE_WINDOW,
+    DEFAULT_BOILER_MIN_ON_TIME,
+    DEFAULT_BOILER_MIN_OFF_TIME,
+    RELAY_CHECK_INTERVAL,
+    STORE_KEY_BOILER,
+    ZONE_EVALUATION_BATCH_DELAY,
     LOG_PREFIX,
 )
+from .control import ZoneSnapshot
+from .counters import (
+    COUNTER_BOILER_STARTS,
+    COUNTER_DRIFT_CORRECTIONS,
+    COUNTER_PIGGYBACK_ACTIVATIONS,
+    get_counters,
+)
+from .dispatcher import parse_binary
+from .metrics import METRIC_BOILER_CALL, METRIC_PIGGYBACK_FANOUT, METRIC_RECONCILE_SWEEP, get_metrics
+from .relay_queue import get_relay_queue
+from .storage import ZoneDataStore
+from .trace import OUTCOME_ON
 
 if TYPE_CHECKING:
     from .climate import SmartHeatZoneClimate
@@ -38,7 +97,7 @@ class BoilerManager:
     Feladata:
       - közös kazán relé kezelése (pl. switch.shelly_2pm_relay_1)
       - aktív zónák számlálása
-      - redundáns kapcsolások elkerülése
+      - redundáns kapcsolások elkerülése (parancssor: összevonás + min. be/ki idő)
       - piggyback heating: más zónák bekapcsolása amikor a kazán már megy
     """
 
@@ -47,8 +106,75 @@ class BoilerManager:
         self._boiler_entity_id: Optional[str] = None
         self._active_zones: set[str] = set()
         self._zone_entities: dict[str, "SmartHeatZoneClimate"] = {}
+        self._metrics = get_metrics(hass)
+        self._counters = get_counters(hass)
+        self._relay_queue = get_relay_queue(hass)
+
+        # Piggyback fan-out (v1.10.0)
+        self._piggyback_concurrency = DEFAULT_PIGGYBACK_CONCURRENCY
+        self._piggyback_in_progress = False
+        self._piggyback_joined: set[str] = set()
+        self._last_piggyback_duration_ms: Optional[float] = None
+        self._last_piggyback_zone_count = 0
+
+        # Boiler command queue (v1.10.0)
+        self._coalesce_window = DEFAULT_BOILER_COALESCE_WINDOW
+        self._min_on_time = DEFAULT_BOILER_MIN_ON_TIME
+        self._min_off_time = DEFAULT_BOILER_MIN_OFF_TIME
+        self._boiler_on = False  # last commanded state
+        self._boiler_changed_at: Optional[float] = None  # loop time of last switch
+        self._pending_command: Optional[CALLBACK_TYPE] = None
+        self._last_requesting_zone: Optional[str] = None
+        self._boiler_starts = 0
+        self._avoided_starts = 0
+        self._boiler_on_since: Optional[datetime] = None
+
+        # State listeners - system sensors (v1.10.0)
+        self._listeners: list[Callable[[], None]] = []
+
+        # Runtime state store - restart without re-actuation (v1.10.0)
+        self._runtime_store: Optional[ZoneDataStore] = None
+
+        # Batched evaluation (v1.10.0)
+        self._batch_lock = asyncio.Lock()
+        self._last_batch: Optional[dict] = None
+        self._pending_first_evaluation: set[str] = set()
+        self._first_evaluation_timer: Optional[CALLBACK_TYPE] = None
+
+        # Desired vs. actual reconciliation (v1.10.0)
+        self._reconcile_unsub: Optional[CALLBACK_TYPE] = None
+        self._started = False  # startup evaluation done (Home Assistant running)
+        self._reconcile_running = False
+        self._drift_corrections = 0
+        self._last_reconcile: Optional[dict] = None
+
         _LOGGER.info("%s BoilerManager initialized", LOG_PREFIX)
 
+    def configure(self, settings: dict):
+        """Közös beállítások alkalmazása (common settings entry data/options)."""
+        self._piggyback_concurrency = max(
+            1, int(settings.get(CONF_PIGGYBACK_CONCURRENCY, DEFAULT_PIGGYBACK_CONCURRENCY))
+        )
+        self._coalesce_window = float(
+            settings.get(CONF_BOILER_COALESCE_WINDOW, DEFAULT_BOILER_COALESCE_WINDOW)
+        )
+        self._min_on_time = float(settings.get(CONF_BOILER_MIN_ON_TIME, DEFAULT_BOILER_MIN_ON_TIME))
+        self._min_off_time = float(settings.get(CONF_BOILER_MIN_OFF_TIME, DEFAULT_BOILER_MIN_OFF_TIME))
+
+        boiler_entity = settings.get(CONF_BOILER_MAIN)
+        if boiler_entity and boiler_entity != self._boiler_entity_id:
+            if self._boiler_entity_id:
+                _LOGGER.warning(
+                    "%s Boiler entity changed from %s → %s",
+                    LOG_PREFIX, self._boiler_entity_id, boiler_entity
+                )
+            self._boiler_entity_id = boiler_entity
+        _LOGGER.debug(
+            "%s BoilerManager configured: piggyback_concurrency=%d | window=%.0fs | min_on=%.0fs | min_off=%.0fs",
+            LOG_PREFIX, self._piggyback_concurrency, self._coalesce_window,
+            self._min_on_time, self._min_off_time
+        )
+
     # --------------------------------------------------------------------------
     # Alapműveletek
     # --------------------------------------------------------------------------
@@ -56,13 +182,39 @@ class BoilerManager:
     def register_zone_entity(self, zone_name: str, entity: "SmartHeatZoneClimate"):
         """Register a zone climate entity for piggyback heating."""
         self._zone_entities[zone_name] = entity
+        if self._started:
+            # First zone after shutdown(): sweep again
+            self._start_reconcile()
         _LOGGER.debug("%s Zone entity registered: %s", LOG_PREFIX, zone_name)
+        self._notify_listeners()
 
     def unregister_zone_entity(self, zone_name: str):
         """Unregister a zone climate entity."""
         if zone_name in self._zone_entities:
             del self._zone_entities[zone_name]
             _LOGGER.debug("%s Zone entity unregistered: %s", LOG_PREFIX, zone_name)
+            self._notify_listeners()
+
+    def attach_runtime_store(self, store: ZoneDataStore):
+        """Store for the commanded boiler state (restored at startup)."""
+        self._runtime_store = store
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call `update_callback` when heating zones or the boiler state change."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener():
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _notify_listeners(self):
+        for update_callback in list(self._listeners):
+            update_callback()
 
     async def register_boiler(self, entity_id: str):
         """Kazán főkapcsoló regisztrálása."""
@@ -82,26 +234,390 @@ class BoilerManager:
             await self.register_boiler(entity_id)
 
         was_off = len(self._active_zones) == 0
-        self._active_zones.add(zone)
+        if zone not in self._active_zones:
+            self._active_zones.add(zone)
+            self._notify_listeners()
+
+        if self._piggyback_in_progress:
+            # Re-entrant request from a piggybacking zone - boiler is already on,
+            # the joined zones are reported once when the fan-out completes
+            self._piggyback_joined.add(zone)
+            return
+
         _LOGGER.debug("%s Zone '%s' requested boiler ON (active_zones=%d)", LOG_PREFIX, zone, len(self._active_zones))
 
         if was_off:
-            # Boiler is turning on - physically turn it on
-            await self._call_boiler_service("turn_on")
-            # Trigger piggyback heating for all other zones
-            await self._trigger_piggyback_heating(initiating_zone=zone)
+            await self._request_boiler(zone)
 
     async def turn_off(self, entity_id: Optional[str], zone: str):
         """Kazán kikapcsolása zónából."""
         if zone in self._active_zones:
             self._active_zones.remove(zone)
+            self._notify_listeners()
 
         _LOGGER.debug("%s Zone '%s' released boiler (active_zones=%d)", LOG_PREFIX, zone, len(self._active_zones))
 
         # Ha nincs több aktív zóna, akkor kapcsoljuk ki a kazánt
         if not self._active_zones:
+            await self._request_boiler(zone)
+
+    # --------------------------------------------------------------------------
+    # Kazán parancssor (v1.10.0)
+    # --------------------------------------------------------------------------
+
+    async def _request_boiler(self, zone: str):
+        """
+        Queue a boiler command matching the current demand.
+
+        A stop waits for the coalesce window and a new demand inside it cancels
+        the stop, so a zone flapping around its hysteresis edge does not toggle
+        the burner. Starts are not delayed by the window. Minimum on/off times
+        stretch the delay when the last switch was recent.
+        """
+        demand = bool(self._active_zones)
+
+        if demand == self._boiler_on:
+            # Demand returned to the commanded state before the queued command ran
+            if self._cancel_pending_command():
+                self._avoided_starts += 1
+                _LOGGER.info(
+                    "%s Boiler command coalesced - flap by '%s' absorbed (avoided starts=%d)",
+                    LOG_PREFIX, zone, self._avoided_starts
+                )
+            return
+
+        self._last_requesting_zone = zone
+        if self._pending_command is not None:
+            # Same command already queued
+            return
+
+        delay = self._command_delay(demand)
+        if delay <= 0:
+            await self._flush_boiler_command()
+            return
+
+        _LOGGER.debug(
+            "%s Boiler %s queued for %.1fs (requested by '%s')",
+            LOG_PREFIX, "ON" if demand else "OFF", delay, zone
+        )
+        self._pending_command = async_call_later(self.hass, delay, self._flush_boiler_command)
+
+    def _command_delay(self, demand: bool) -> float:
+        """Seconds to wait before the next boiler command may be sent."""
+        delay = 0.0 if demand else self._coalesce_window
+        if self._boiler_changed_at is not None:
+            elapsed = self.hass.loop.time() - self._boiler_changed_at
+            min_time = self._min_on_time if self._boiler_on else self._min_off_time
+            delay = max(delay, min_time - elapsed)
+        return delay
+
+    def _cancel_pending_command(self) -> bool:
+        """Cancel the queued boiler command. Returns True if one was pending."""
+        if self._pending_command is None:
+            return False
+        self._pending_command()
+        self._pending_command = None
+        return True
+
+    async def _flush_boiler_command(self, _now=None):
+        """Send the queued boiler command (single service call)."""
+        self._pending_command = None
+        demand = bool(self._active_zones)
+        if demand == self._boiler_on:
+            return
+
+        self._boiler_on = demand
+        self._boiler_changed_at = self.hass.loop.time()
+        self._boiler_on_since = dt_util.utcnow() if demand else None
+        if self._runtime_store is not None:
+            self._runtime_store.set(STORE_KEY_BOILER, {"on": demand})
+        self._notify_listeners()
+
+        if demand:
+            self._boiler_starts += 1
+            self._counters.increment(STORE_KEY_BOILER, COUNTER_BOILER_STARTS)
+            # Boiler is turning on - physically turn it on
+            await self._call_boiler_service("turn_on")
+            # Trigger piggyback heating for all other zones
+            await self._trigger_piggyback_heating(initiating_zone=self._last_requesting_zone)
+        else:
             await self._call_boiler_service("turn_off")
 
+    # --------------------------------------------------------------------------
+    # Batched whole-house evaluation (v1.10.0)
+    # --------------------------------------------------------------------------
+
+    async def async_evaluate_all(self, reason: str, zone_names: Optional[Iterable[str]] = None):
+        """
+        Evaluate all (or the given) zones in one pass.
+
+        The zones are captured in a ZoneSnapshot, decided together, and the
+        resulting relay changes are sent as one switch.turn_on and one
+        switch.turn_off call, followed by a single boiler request.
+        """
+        async with self._batch_lock:
+            if zone_names is None:
+                zones = list(self._zone_entities.values())
+            else:
+                zones = [self._zone_entities[name] for name in zone_names if name in self._zone_entities]
+            if not zones:
+                return
+
+            started = self.hass.loop.time()
+            snapshot = ZoneSnapshot([zone.snapshot_row() for zone in zones])
+            outcomes, reasons = snapshot.decide()
+
+            # (zone, reason) pairs whose heating state changes
+            changed_on: list[tuple["SmartHeatZoneClimate", str]] = []
+            changed_off: list[tuple["SmartHeatZoneClimate", str]] = []
+            for i, zone in enumerate(zones):
+                outcome = snapshot.outcome(outcomes[i])
+                if zone.apply_batch_decision(outcome, reasons[i], snapshot.target[i], snapshot.hysteresis[i]):
+                    (changed_on if outcome == OUTCOME_ON else changed_off).append((zone, reasons[i]))
+
+            relays_on = [relay for zone, _ in changed_on for relay in zone.relay_entities]
+            relays_off = [relay for zone, _ in changed_off for relay in zone.relay_entities]
+            on_results, off_results = await asyncio.gather(
+                self._relay_queue.async_switch(relays_on, True),
+                self._relay_queue.async_switch(relays_off, False),
+            )
+
+            initiating_zone = None
+            for zone, zone_reason in changed_on:
+                relays_ok = zone.finish_batch_switch(on_results, zone_reason)
+                if zone.boiler_entity and relays_ok:
+                    if self._boiler_entity_id is None:
+                        await self.register_boiler(zone.boiler_entity)
+                    self._active_zones.add(zone.name)
+                    initiating_zone = initiating_zone or zone.name
+            for zone, zone_reason in changed_off:
+                zone.finish_batch_switch(off_results, zone_reason)
+                self._active_zones.discard(zone.name)
+            if changed_on or changed_off:
+                self._notify_listeners()
+
+            self._last_batch = {
+                "reason": reason,
+                "zones": len(zones),
+                "switched_on": len(changed_on),
+                "switched_off": len(changed_off),
+                "duration_ms": round((self.hass.loop.time() - started) * 1000, 1),
+            }
+            _LOGGER.info(
+                "%s Batched evaluation (%s): %d zones, %d on, %d off in %.0f ms",
+                LOG_PREFIX, reason, len(zones), len(changed_on), len(changed_off),
+                self._last_batch["duration_ms"]
+            )
+
+        if changed_on or changed_off:
+            await self._request_boiler(initiating_zone or "batch")
+
+    async def async_startup_evaluation(self, _hass=None):
+        """Home Assistant started: evaluate every zone in one batched pass."""
+        self._restore_runtime_state()
+        await self.async_evaluate_all("Home Assistant started")
+        # Boiler left on without demand (or the other way round) is corrected here
+        await self._request_boiler("startup")
+
+        self._started = True
+        self._start_reconcile()
+
+        setup_started = self.hass.data.get(DOMAIN, {}).get(DATA_SETUP_STARTED)
+        if setup_started is not None:
+            _LOGGER.info(
+                "%s Startup: %d zones under control %.2fs after integration setup started",
+                LOG_PREFIX, len(self._zone_entities), self.hass.loop.time() - setup_started
+            )
+
+    @callback
+    def request_first_evaluation(self, zone: str):
+        """Zone added while running: evaluated with the others added in the same window."""
+        self._pending_first_evaluation.add(zone)
+        if self._first_evaluation_timer is None:
+            self._first_evaluation_timer = async_call_later(
+                self.hass, ZONE_EVALUATION_BATCH_DELAY, self.async_run_first_evaluation
+            )
+
+    async def async_run_first_evaluation(self, _now=None):
+        """Evaluate the zones waiting for their first evaluation (now)."""
+        if self._first_evaluation_timer is not None:
+            self._first_evaluation_timer()
+            self._first_evaluation_timer = None
+        zones, self._pending_first_evaluation = self._pending_first_evaluation, set()
+        if zones:
+            await self.async_evaluate_all("Zones added", zones)
+
+    # --------------------------------------------------------------------------
+    # Desired vs. actual reconciliation (v1.10.0)
+    # --------------------------------------------------------------------------
+
+    @callback
+    def _start_reconcile(self):
+        if self._reconcile_unsub is None:
+            self._reconcile_unsub = async_track_time_interval(
+                self.hass, self.async_reconcile, timedelta(seconds=RELAY_CHECK_INTERVAL)
+            )
+
+    @callback
+    def shutdown(self):
+        """Last entry unloaded: stop the sweep and drop the pending timers."""
+        if self._reconcile_unsub is not None:
+            self._reconcile_unsub()
+            self._reconcile_unsub = None
+        if self._cancel_pending_command():
+            _LOGGER.debug("%s Pending boiler command dropped on unload", LOG_PREFIX)
+        if self._first_evaluation_timer is not None:
+            self._first_evaluation_timer()
+            self._first_evaluation_timer = None
+        self._pending_first_evaluation.clear()
+        _LOGGER.debug("%s BoilerManager stopped", LOG_PREFIX)
+
+    async def async_reconcile(self, _now=None):
+        """
+        Compare the commanded state with the state machine and correct drift.
+
+        One pass over all zones: relays whose state differs from their zone's
+        heating flag (missed events, failed commands), zones missing from or
+        left in the heating zone set (e.g. removed while heating) and a boiler
+        switch that differs from the commanded state. Relays are corrected
+        with one turn_on and one turn_off call. Skipped while a batched
+        evaluation or a piggyback fan-out is in progress, and zones with a
+        relay command in flight are left out entirely (relays and demand) -
+        those settle the state themselves, the next sweep checks the result.
+        """
+        if self._reconcile_running or self._batch_lock.locked() or self._piggyback_in_progress:
+            return
+        self._reconcile_running = True
+        try:
+            await self._async_reconcile()
+        finally:
+            self._reconcile_running = False
+
+    async def _async_reconcile(self):
+        started = self.hass.loop.time()
+
+        # Desired relay states (a relay shared by zones is on if any of them heats)
+        desired: dict[str, bool] = {}
+        relay_zones: dict[str, list[str]] = {}
+        pending: set[str] = set()  # zones whose relay command is in flight: settled by the command
+        for name, zone in self._zone_entities.items():
+            if self._relay_queue.is_pending(zone.relay_entities):
+                pending.add(name)
+                continue
+            for relay in zone.relay_entities:
+                desired[relay] = desired.get(relay, False) or zone.is_heating
+                relay_zones.setdefault(relay, []).append(name)
+
+        relays_on, relays_off = [], []
+        for relay, on in desired.items():
+            actual = parse_binary(self.hass.states.get(relay))
+            if actual is None or actual == on:
+                continue
+            (relays_on if on else relays_off).append(relay)
+
+        # Heating zone set (boiler demand); relays first - a zone joins only once its relays are settled
+        heating = {
+            name for name, zone in self._zone_entities.items()
+            if zone.is_heating and zone.boiler_entity and name not in pending
+        }
+        zones_added = sorted(heating - self._active_zones)
+        zones_dropped = sorted(self._active_zones - heating - pending)
+
+        # Boiler switch vs. commanded state (a queued command will set it anyway)
+        boiler_drift = False
+        if self._boiler_entity_id and self._pending_command is None:
+            actual = parse_binary(self.hass.states.get(self._boiler_entity_id))
+            boiler_drift = actual is not None and actual != self._boiler_on
+
+        self._metrics.observe(METRIC_RECONCILE_SWEEP, (self.hass.loop.time() - started) * 1000)
+        drift = len(relays_on) + len(relays_off) + len(zones_added) + len(zones_dropped) + int(boiler_drift)
+        if not drift:
+            return
+
+        self._drift_corrections += drift
+        self._last_reconcile = {
+            "at": dt_util.utcnow().isoformat(),
+            "relays_on": sorted(relays_on),
+            "relays_off": sorted(relays_off),
+            "zones_added": zones_added,
+            "zones_dropped": zones_dropped,
+            "boiler": ("turn_on" if self._boiler_on else "turn_off") if boiler_drift else None,
+        }
+        _LOGGER.warning(
+            "%s Drift corrected: relays on=%s off=%s | heating zones +%s -%s | boiler %s",
+            LOG_PREFIX, sorted(relays_on), sorted(relays_off), zones_added, zones_dropped,
+            self._last_reconcile["boiler"] or "OK"
+        )
+        for relay in relays_on + relays_off:
+            for name in relay_zones[relay]:
+                self._counters.increment(name, COUNTER_DRIFT_CORRECTIONS)
+        if zones_added or zones_dropped or boiler_drift:
+            self._counters.increment(
+                STORE_KEY_BOILER, COUNTER_DRIFT_CORRECTIONS, len(zones_added) + len(zones_dropped) + int(boiler_drift)
+            )
+
+        if relays_on or relays_off:
+            await asyncio.gather(
+                self._relay_queue.async_switch(relays_on, True),
+                self._relay_queue.async_switch(relays_off, False),
+            )
+
+        if zones_added or zones_dropped:
+            self._active_zones = heating | (self._active_zones & pending)
+            self._notify_listeners()
+            # Demand changed: goes through the command queue (coalescing, min on/off time)
+            await self._request_boiler("reconcile")
+        if boiler_drift and self._pending_command is None and bool(self._active_zones) == self._boiler_on:
+            # Re-send the commanded state unless the demand change above already did
+            if parse_binary(self.hass.states.get(self._boiler_entity_id)) != self._boiler_on:
+                await self._call_boiler_service("turn_on" if self._boiler_on else "turn_off")
+
+    # --------------------------------------------------------------------------
+    # Runtime state restore (v1.10.0)
+    # --------------------------------------------------------------------------
+
+    def restore_zone_demand(self, zone: str):
+        """A zone adopted its running relays after a restart - count it without a boiler request."""
+        if zone not in self._active_zones:
+            self._active_zones.add(zone)
+            self._notify_listeners()
+
+    def _restore_runtime_state(self):
+        """
+        Adopt the live heating state instead of re-sending it.
+
+        Zones whose stored heating state matches their live relays take it
+        over; the commanded boiler state follows the live boiler switch. All
+        entities are loaded at this point (Home Assistant has started).
+        """
+        restored = [
+            name for name, zone in self._zone_entities.items()
+            if zone.restore_runtime_state()
+        ]
+        for name in restored:
+            if self._zone_entities[name].boiler_entity:
+                self._active_zones.add(name)
+
+        boiler_state = self.hass.states.get(self._boiler_entity_id) if self._boiler_entity_id else None
+        stored = self._runtime_store.get(STORE_KEY_BOILER) if self._runtime_store is not None else None
+        if boiler_state is not None and boiler_state.state in ("on", "off"):
+            live_on = boiler_state.state == "on"
+            if stored is not None and bool(stored.get("on")) != live_on:
+                _LOGGER.warning(
+                    "%s Boiler is %s but was commanded %s before the restart",
+                    LOG_PREFIX, boiler_state.state, "on" if stored.get("on") else "off"
+                )
+            self._boiler_on = live_on
+            if live_on:
+                self._boiler_changed_at = self.hass.loop.time()
+                self._boiler_on_since = boiler_state.last_changed
+
+        _LOGGER.info(
+            "%s Runtime state restored: %d heating zones adopted %s, boiler %s",
+            LOG_PREFIX, len(restored), sorted(restored), "ON" if self._boiler_on else "OFF"
+        )
+        self._notify_listeners()
+
     # --------------------------------------------------------------------------
     # Piggyback heating
     # --------------------------------------------------------------------------
@@ -112,17 +628,55 @@ class BoilerManager:
 
         When boiler turns on, all zones should check if current_temp < target_temp
         and turn on immediately without hysteresis or waiting for sensor update.
+        The zones are checked concurrently, at most `piggyback_concurrency` at a time.
         """
+        zones = [
+            zone_entity for zone_name, zone_entity in self._zone_entities.items()
+            if zone_name != initiating_zone
+        ]
+        if not zones:
+            return
+
         _LOGGER.info(
-            "%s Piggyback heating triggered by zone '%s' - checking all zones",
-            LOG_PREFIX, initiating_zone
+            "%s Piggyback heating triggered by zone '%s' - checking %d zones",
+            LOG_PREFIX, initiating_zone, len(zones)
         )
 
-        for zone_name, zone_entity in self._zone_entities.items():
-            if zone_name != initiating_zone:
-                # Trigger piggyback check in other zones
+        semaphore = asyncio.Semaphore(self._piggyback_concurrency)
+
+        async def _check(zone_entity: "SmartHeatZoneClimate"):
+            async with semaphore:
                 await zone_entity.check_piggyback_heating()
 
+        self._counters.increment(STORE_KEY_BOILER, COUNTER_PIGGYBACK_ACTIVATIONS)
+        self._piggyback_in_progress = True
+        self._piggyback_joined = set()
+        started = self.hass.loop.time()
+        try:
+            results = await asyncio.gather(
+                *(_check(zone_entity) for zone_entity in zones),
+                return_exceptions=True,
+            )
+        finally:
+            self._piggyback_in_progress = False
+
+        self._last_piggyback_duration_ms = (self.hass.loop.time() - started) * 1000
+        self._last_piggyback_zone_count = len(zones)
+        self._metrics.observe(METRIC_PIGGYBACK_FANOUT, self._last_piggyback_duration_ms)
+
+        for zone_entity, result in zip(zones, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "%s Piggyback check failed in zone '%s': %s",
+                    LOG_PREFIX, zone_entity.name, result
+                )
+
+        _LOGGER.info(
+            "%s Piggyback fan-out done: %d/%d zones joined in %.0f ms %s",
+            LOG_PREFIX, len(self._piggyback_joined), len(zones),
+            self._last_piggyback_duration_ms, sorted(self._piggyback_joined)
+        )
+
     # --------------------------------------------------------------------------
     # Segédfüggvények
     # --------------------------------------------------------------------------
@@ -133,6 +687,7 @@ class BoilerManager:
             _LOGGER.warning("%s No boiler entity configured", LOG_PREFIX)
             return
 
+        started = self.hass.loop.time()
         try:
             await self.hass.services.async_call(
                 "switch",
@@ -143,21 +698,65 @@ class BoilerManager:
             _LOGGER.info("%s Boiler relay %s → %s", LOG_PREFIX, self._boiler_entity_id, action.upper())
         except Exception as e:
             _LOGGER.error("%s Boiler relay control failed: %s", LOG_PREFIX, e)
+        finally:
+            self._metrics.observe(METRIC_BOILER_CALL, (self.hass.loop.time() - started) * 1000)
 
     # --------------------------------------------------------------------------
     # Állapot lekérdezés és debug
     # --------------------------------------------------------------------------
 
+    def get_zone_entities(self) -> list["SmartHeatZoneClimate"]:
+        """Registered zone climate entities."""
+        return list(self._zone_entities.values())
+
+    def get_zone_entity(self, zone_name: str) -> Optional["SmartHeatZoneClimate"]:
+        """Registered zone climate entity by zone name."""
+        return self._zone_entities.get(zone_name)
+
+    def relays_heated_by_others(self, zone_name: str) -> set[str]:
+        """Relays kept on by heating zones other than `zone_name` (shared relays)."""
+        return {
+            relay
+            for name, zone in self._zone_entities.items()
+            if name != zone_name and zone.is_heating
+            for relay in zone.relay_entities
+        }
+
     def get_active_zones(self) -> list[str]:
         """Aktív fűtési zónák listája."""
         return list(self._active_zones)
 
+    def get_zone_count(self) -> int:
+        """Registered zone count."""
+        return len(self._zone_entities)
+
+    @property
+    def boiler_on(self) -> bool:
+        """Last commanded boiler state."""
+        return self._boiler_on
+
+    @property
+    def boiler_on_since(self) -> Optional[datetime]:
+        """UTC time the boiler was last switched on (None while off)."""
+        return self._boiler_on_since
+
     def get_boiler_state(self) -> dict:
         """Kazán státusz JSON formátumban."""
         return {
             "boiler_entity": self._boiler_entity_id,
             "active_zones": list(self._active_zones),
             "active_count": len(self._active_zones),
+            "piggyback_concurrency": self._piggyback_concurrency,
+            "last_piggyback_duration_ms": self._last_piggyback_duration_ms,
+            "last_piggyback_zones": self._last_piggyback_zone_count,
+            "boiler_on": self._boiler_on,
+            "boiler_on_since": self._boiler_on_since.isoformat() if self._boiler_on_since else None,
+            "command_pending": self._pending_command is not None,
+            "boiler_starts": self._boiler_starts,
+            "avoided_starts": self._avoided_starts,
+            "last_batch": self._last_batch,
+            "drift_corrections": self._drift_corrections,
+            "last_reconcile": self._last_reconcile,
         }
 
     def __repr__(self):
@@ -3,6 +3,55 @@ SmartHeatZones - Climate Platform
 Version: 1.9.1 (HA 2025.10+ compatible)
 Author: forreggbor
 
+NEW in v1.10.0 (in development):
+- Zone relays are switched concurrently with a per-call timeout; the boiler is
+  requested only after at least one relay has actually switched
+- State subscriptions go through the shared ZoneEventDispatcher (one HA listener
+  per entity, parsed once); subscriptions are released on entity removal
+- Outdoor temperature and adaptive hysteresis band come from the shared
+  OutdoorTemperatureService; effective hysteresis is an O(1) lookup
+- Schedule compiled once into a minutes-of-day table; a single point-in-time
+  timer fires at the next block transition (replaces 15-minute polling)
+- Event-sourced door/window and relay state cache (bitmasks): open-door and
+  relay checks are O(1); cache verified against the state machine on add
+- Coalesced state writes (at most one per event-loop iteration) and cached
+  extra_state_attributes, rebuilt only when one of their inputs changes
+- Control decisions recorded in a bounded per-zone trace (dump_decision_trace
+  service); hot-path logging is lazy and guarded
+- Per-zone sensor deadband and minimum evaluation interval (trailing-edge
+  deferred evaluation); overheat protection still checks every reading
+- Optional sensor filter (EMA / rolling median) in front of the current
+  temperature; raw reading exposed and used for overheat protection
+- Batched evaluation support (snapshot rows / batch decisions for the
+  BoilerManager whole-house pass); common settings applied in place;
+  startup evaluation deferred to one batched pass
+- Predictive pre-heat: heat-up rate learned from the zone's own heating
+  periods (outdoor temperature as covariate), persisted; the next block's
+  setpoint starts early enough to be reached on time
+- Heating transitions (including manual relay overrides) feed the shared
+  heating time tracker behind the zone duration sensors
+- Runtime state (heating flag, last filtered temperature) persisted with
+  debounced writes; after a restart or reload the zone adopts relays that are
+  already in the stored state instead of switching them again, and the
+  sensor filter starts from the stored value
+- Zone options applied in place (schedule, heating mode, thermostat type /
+  offset, deadband, filter, pre-heat, door and relay lists with
+  resubscription); only a temperature sensor change needs an entry reload
+- Every listener, timer and service registration of the zone is tracked in a
+  SubscriptionRegistry and released together on removal; subscriptions left
+  behind by a previous instance of the zone are detected and purged; live
+  listener / timer counts in the diagnostics
+- Sensor event → evaluation latency and relay service call durations recorded
+  in the control loop metrics; diagnostics() snapshot for the diagnostics
+  download
+- Evaluations, relay commands, piggyback activations, overheat trips and
+  manual overrides counted per hour / day (diagnostic counter sensors)
+- Relays switched through the shared relay command queue: commands are
+  confirmed against the relay state events and retried, relays already in
+  the target state are not commanded; relay events of queued commands are
+  not mistaken for manual overrides; heating is not reported on when no
+  relay could be switched on
+
 CHANGELOG v1.9.1 (BUGFIX)
 - Fixed: Removing the outdoor temperature sensor is not removed from settings
 
@@ -38,8 +87,10 @@ FIXES in 1.5.1:
 - Auto HEAT restart when temp drops below target
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Any, Optional
 
 from homeassistant.components.climate import (
@@ -51,15 +102,19 @@ from homeassistant.const import (
     ATTR_TEMPERATURE,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_state_change_event, async_track_time_interval
+from homeassistant.core import HomeAssistant, CoreState, ServiceResponse, SupportsResponse, callback
+from homeassistant.helpers import entity_platform
+from homeassistant.helpers.event import async_call_later, async_track_point_in_time
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
     DATA_BOILER_MAIN,
     DATA_ACTIVE_ZONES,
     DATA_COMMON_SETTINGS,
+    DATA_DISPATCHER,
+    DATA_OUTDOOR_TEMP,
     CONF_SENSOR,
     CONF_ZONE_RELAYS,
     CONF_DOOR_SENSORS,
@@ -67,6 +122,11 @@ from .const import (
     CONF_HEATING_MODE,
     CONF_THERMOSTAT_TYPE,
     CONF_TEMP_OFFSET,
+    CONF_SENSOR_DEADBAND,
+    CONF_MIN_EVAL_INTERVAL,
+    CONF_SENSOR_FILTER,
+    CONF_FILTER_WINDOW,
+    CONF_PREHEAT_ENABLED,
     CONF_BOILER_MAIN,
     CONF_HYSTERESIS,
     CONF_OVERHEAT_PROTECTION,
@@ -78,6 +138,15 @@ from .const import (
     DEFAULT_HEATING_MODE,
     DEFAULT_THERMOSTAT_TYPE,
     DEFAULT_TEMP_OFFSET,
+    DEFAULT_SENSOR_DEADBAND,
+    DEFAULT_MIN_EVAL_INTERVAL,
+    DEFAULT_SENSOR_FILTER,
+    DEFAULT_FILTER_WINDOW,
+    DEFAULT_PREHEAT_ENABLED,
+    DATA_PREHEAT_STORE,
+    DATA_HEATING_TIME,
+    DATA_RUNTIME_STORE,
+    PREHEAT_RECHECK_MINUTES,
     HEATING_MODE_RADIATOR,
     HEATING_MODE_UNDERFLOOR,
     THERMOSTAT_TYPE_WALL,
@@ -89,14 +158,42 @@ from .const import (
     PRESET_AWAY,
     PRESET_MODES,
     PRESET_TEMPERATURES,
-    ADAPTIVE_HYSTERESIS_MULTIPLIERS,
+    DIAGNOSTICS_TRACE_RECORDS,
+    SERVICE_DUMP_DECISION_TRACE,
     LOG_PREFIX,
     ERR_OVERHEAT,
 )
+from .dispatcher import KIND_BINARY, KIND_TEMPERATURE, parse_temperature
+from .control import (
+    FLAG_FORCE_OFF,
+    FLAG_NO_TEMP,
+    FLAG_UNDERFLOOR,
+    decide_heating,
+)
+from .counters import (
+    COUNTER_EVALUATIONS,
+    COUNTER_MANUAL_OVERRIDES,
+    COUNTER_OVERHEAT_TRIPS,
+    COUNTER_PIGGYBACK_ACTIVATIONS,
+    COUNTER_RELAY_COMMANDS,
+    get_counters,
+)
+from .filters import create_filter
+from .metrics import METRIC_EVENT_TO_DECISION, SENSOR_EVENT_FIRED, get_metrics
+from .preheat import HeatRateModel, HeatingSession
+from .registry import CATEGORY_SERVICE, CATEGORY_STATE, CATEGORY_TIMER, SubscriptionRegistry
+from .relay_queue import RELAY_CONFIRMED, RELAY_SKIPPED, RELAY_SUPERSEDED, get_relay_queue
+from .schedule import CompiledSchedule
+from .trace import DecisionTrace, OUTCOME_HOLD, OUTCOME_OFF, OUTCOME_ON, OUTCOME_SKIP
 
 
 _LOGGER = logging.getLogger(__name__)
 
+# Zone timers in the subscription registry
+TIMER_SCHEDULE = "schedule"
+TIMER_PREHEAT = "preheat"
+TIMER_DEFERRED_EVALUATION = "deferred_evaluation"
+
 
 def _get_common_settings(hass: HomeAssistant) -> dict:
     """Get common settings from DATA_COMMON_SETTINGS entry."""
@@ -130,6 +227,11 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
     thermostat_type = zone_data.get(CONF_THERMOSTAT_TYPE, DEFAULT_THERMOSTAT_TYPE)
     temp_offset = zone_data.get(CONF_TEMP_OFFSET, DEFAULT_TEMP_OFFSET)
     schedule = zone_data.get(CONF_SCHEDULE, [])
+    sensor_deadband = zone_data.get(CONF_SENSOR_DEADBAND, DEFAULT_SENSOR_DEADBAND)
+    min_eval_interval = zone_data.get(CONF_MIN_EVAL_INTERVAL, DEFAULT_MIN_EVAL_INTERVAL)
+    sensor_filter = zone_data.get(CONF_SENSOR_FILTER, DEFAULT_SENSOR_FILTER)
+    filter_window = zone_data.get(CONF_FILTER_WINDOW, DEFAULT_FILTER_WINDOW)
+    preheat_enabled = zone_data.get(CONF_PREHEAT_ENABLED, DEFAULT_PREHEAT_ENABLED)
     
     if not schedule:
         _LOGGER.warning(
@@ -168,10 +270,24 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
         overheat_temp=overheat_temp,
         outdoor_sensor=outdoor_sensor,
         adaptive_hysteresis_enabled=adaptive_hyst,
+        sensor_deadband=sensor_deadband,
+        min_eval_interval=min_eval_interval,
+        sensor_filter=sensor_filter,
+        filter_window=filter_window,
+        preheat_enabled=preheat_enabled,
     )
     async_add_entities([entity])
     _LOGGER.info("%s Climate entity created for %s", LOG_PREFIX, name)
 
+    # NEW v1.10.0: decision trace dump (shared by all zone platforms)
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_DUMP_DECISION_TRACE,
+        {},
+        "async_dump_decision_trace",
+        supports_response=SupportsResponse.ONLY,
+    )
+
 
 class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
     """Zone thermostat entity v1.6.0."""
@@ -202,6 +318,11 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
         overheat_temp: float,
         outdoor_sensor: Optional[str],
         adaptive_hysteresis_enabled: bool,
+        sensor_deadband: float = DEFAULT_SENSOR_DEADBAND,
+        min_eval_interval: float = DEFAULT_MIN_EVAL_INTERVAL,
+        sensor_filter: str = DEFAULT_SENSOR_FILTER,
+        filter_window: int = DEFAULT_FILTER_WINDOW,
+        preheat_enabled: bool = DEFAULT_PREHEAT_ENABLED,
     ):
         """Initialize zone thermostat."""
         self.hass = hass
@@ -217,6 +338,27 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
         self._door_sensors = door_sensors or []
         self._schedule = schedule or []
 
+        # NEW v1.10.0: event-sourced state cache (one bit per door / relay)
+        self._door_bits = {door: 1 << i for i, door in enumerate(self._door_sensors)}
+        self._relay_bits = {relay: 1 << i for i, relay in enumerate(self._relay_entities)}
+        self._door_open_mask = 0
+        self._relay_on_mask = 0
+
+        self._compiled_schedule = CompiledSchedule(self._schedule)
+
+        # NEW v1.10.0: sensor deadband / evaluation rate limit
+        self._sensor_deadband = float(sensor_deadband)
+        self._min_eval_interval = float(min_eval_interval)
+        self._last_eval_at: Optional[float] = None
+        self._last_eval_temp: Optional[float] = None
+        self._eval_stats = {"evaluated": 0, "skipped_deadband": 0, "skipped_rate_limit": 0}
+
+        # NEW v1.10.0: optional sensor filter (None = raw readings)
+        self._sensor_filter_type = sensor_filter
+        self._filter_window = filter_window
+        self._filter = create_filter(sensor_filter, filter_window)
+        self._raw_temp = None
+
         # Common settings (from common entry)
         self._boiler_entity = boiler_entity
         self._base_hysteresis = hysteresis
@@ -230,15 +372,50 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
         self._hvac_mode = HVACMode.HEAT
         self._is_heating = False
         self._preset_mode = PRESET_AUTO
-        self._schedule_tracker = None
         self._outdoor_temp = None
+        self._hyst_multiplier = 1.0  # pushed by OutdoorTemperatureService
+        self._last_relay_result: Optional[dict] = None
+        self._trace = DecisionTrace()
+
+        # NEW v1.10.0: coalesced state writes / attribute cache
+        self._state_write_pending = False
+        self._zone_removed = False
+        self._attrs_key: Optional[tuple] = None
+        self._attrs_cache: dict = {}
+        self._registry = SubscriptionRegistry(name)  # listeners / timers / registrations
+        self._metrics = get_metrics(hass)
+        self._counters = get_counters(hass)
+        self._relay_queue = get_relay_queue(hass)
         self._boiler = hass.data[DOMAIN][DATA_BOILER_MAIN]
+        self._dispatcher = hass.data[DOMAIN][DATA_DISPATCHER]
+        self._outdoor_service = hass.data[DOMAIN][DATA_OUTDOOR_TEMP]
+
+        # NEW v1.10.0: predictive pre-heat (learning runs even when disabled)
+        self._preheat_enabled = preheat_enabled
+        self._preheat_store = hass.data[DOMAIN][DATA_PREHEAT_STORE]
+        self._heat_model = HeatRateModel.from_dict(self._preheat_store.get(name))
+        self._heat_session: Optional[HeatingSession] = None
+        self._preheat_block = None  # next ScheduleBlock while pre-heating
+
+        # NEW v1.10.0: on-time accumulators (zone heating time sensors)
+        self._heating_time = hass.data[DOMAIN][DATA_HEATING_TIME]
+
+        # NEW v1.10.0: runtime state across restarts (heating flag, filtered temp)
+        self._runtime_store = hass.data[DOMAIN][DATA_RUNTIME_STORE]
+        self._runtime_saved: Optional[tuple] = None
+        stored_runtime = self._runtime_store.get(name) or {}
+        if self._filter is not None and stored_runtime.get("temp") is not None:
+            # Filter continues from the last filtered value instead of a cold start
+            self._filter.update(float(stored_runtime["temp"]))
 
         _LOGGER.info(
             "%s [%s] Initialized | Mode=%s | Preset=%s | Overheat=%.1f°C",
             LOG_PREFIX, self.name, self._heating_mode, self._preset_mode, self._overheat_temp
         )
 
+        for error in self._compiled_schedule.errors:
+            _LOGGER.warning("%s [%s] Invalid schedule block: %s", LOG_PREFIX, self.name, error)
+
         if self._schedule and self._preset_mode == PRESET_AUTO:
             self._apply_current_schedule_block()
 
@@ -246,8 +423,17 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
         """Entity added to Home Assistant."""
         await super().async_added_to_hass()
 
+        # Subscriptions of a previous instance of this zone must not survive it
+        leaked = self._dispatcher.release_zone(self.name)
+        if leaked:
+            _LOGGER.warning(
+                "%s [%s] %d leaked subscriptions of a previous zone instance released",
+                LOG_PREFIX, self.name, leaked
+            )
+
         # Register with boiler manager for piggyback heating
         self._boiler.register_zone_entity(self.name, self)
+        self._registry.track(CATEGORY_SERVICE, "boiler", lambda: self._boiler.unregister_zone_entity(self.name))
         _LOGGER.debug("%s [%s] Registered with boiler manager", LOG_PREFIX, self.name)
 
         # State restoration
@@ -267,71 +453,147 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
 
         # Temperature sensor tracking
         if self._sensor_entity_id:
-            async_track_state_change_event(
-                self.hass,
-                [self._sensor_entity_id],
-                self._sensor_changed,
-            )
+            self._subscribe(self._sensor_entity_id, KIND_TEMPERATURE, self._sensor_changed)
 
-            sensor_state = self.hass.states.get(self._sensor_entity_id)
-            if sensor_state and sensor_state.state not in ["unavailable", "unknown", "none"]:
-                try:
-                    self._current_temp = float(sensor_state.state)
-                    _LOGGER.info("%s [%s] Initial temp: %.2f°C", LOG_PREFIX, self.name, self._current_temp)
-                except (ValueError, TypeError):
-                    pass
+            self._raw_temp = parse_temperature(self.hass.states.get(self._sensor_entity_id))
+            self._current_temp = self._filtered(self._raw_temp)
+            if self._current_temp is not None:
+                _LOGGER.info("%s [%s] Initial temp: %.2f°C", LOG_PREFIX, self.name, self._current_temp)
 
         # Event-based relay monitoring
         if self._relay_entities:
             for relay_id in self._relay_entities:
-                async_track_state_change_event(
-                    self.hass,
-                    [relay_id],
-                    self._relay_state_changed,
-                )
+                self._subscribe(relay_id, KIND_BINARY, self._relay_state_changed)
             _LOGGER.info(
                 "%s [%s] Event-based relay monitoring enabled for %d relays",
                 LOG_PREFIX, self.name, len(self._relay_entities)
             )
 
-        # Outdoor sensor tracking
-        if self._outdoor_sensor and self._adaptive_hysteresis_enabled:
-            async_track_state_change_event(
-                self.hass,
-                [self._outdoor_sensor],
-                self._outdoor_sensor_changed,
-            )
-
-            outdoor_state = self.hass.states.get(self._outdoor_sensor)
-            if outdoor_state and outdoor_state.state not in ["unavailable", "unknown", "none"]:
-                try:
-                    self._outdoor_temp = float(outdoor_state.state)
-                    _LOGGER.info("%s [%s] Outdoor temp: %.2f°C", LOG_PREFIX, self.name, self._outdoor_temp)
-                except (ValueError, TypeError):
-                    pass
+        # Outdoor temperature (shared service pushes the hysteresis band)
+        if self._sync_outdoor_registration():
+            if self._outdoor_temp is not None:
+                _LOGGER.info("%s [%s] Outdoor temp: %.2f°C", LOG_PREFIX, self.name, self._outdoor_temp)
 
         # Door/window sensors
         for door in self._door_sensors:
-            async_track_state_change_event(
-                self.hass,
-                [door],
-                self._door_changed,
-            )
+            self._subscribe(door, KIND_BINARY, self._door_changed)
+
+        # Seed the door/relay cache from the state machine (subscriptions are live)
+        corrected = self._verify_state_cache()
+        _LOGGER.debug(
+            "%s [%s] State cache seeded: %d open doors, relay mask=%s (%d corrections)",
+            LOG_PREFIX, self.name, bin(self._door_open_mask).count("1"),
+            bin(self._relay_on_mask), corrected
+        )
 
-        # Schedule tracker
+        # Schedule tracker (timer at the next block transition)
         if self._schedule and self._preset_mode == PRESET_AUTO:
-            self._schedule_tracker = async_track_time_interval(
-                self.hass,
-                self._check_schedule,
-                timedelta(minutes=15)
-            )
+            self._schedule_next_transition()
             _LOGGER.debug("%s [%s] Schedule tracker enabled", LOG_PREFIX, self.name)
 
-        await self._evaluate_heating()
+        # NEW v1.10.0: during Home Assistant startup all zones are evaluated
+        # together by the BoilerManager batched pass (runtime state restored
+        # there); zones added later are batched with the others added with them
+        if self.hass.state == CoreState.running:
+            if self.restore_runtime_state() and self._boiler_entity:
+                self._boiler.restore_zone_demand(self.name)
+            self._boiler.request_first_evaluation(self.name)
+        else:
+            _LOGGER.debug("%s [%s] First evaluation deferred to startup pass", LOG_PREFIX, self.name)
+
+    def restore_runtime_state(self) -> bool:
+        """
+        Adopt running relays after a restart / reload.
+
+        If the stored heating state was ON and the relays are live ON, the zone
+        takes over the heating state without switching anything. Returns True
+        if the zone was restored as heating.
+        """
+        stored = self._runtime_store.get(self.name)
+        if not stored or not stored.get("heating") or self._is_heating or not self._relay_entities:
+            return False
+
+        # Live relay states (at startup the relay integrations may load after us)
+        self._verify_state_cache()
+        if self._relay_on_mask != (1 << len(self._relay_entities)) - 1:
+            _LOGGER.debug("%s [%s] Stored heating state not restored - relays are not on", LOG_PREFIX, self.name)
+            return False
+
+        self._is_heating = True
+        self._heating_time.set_on(self.name, True)
+        _LOGGER.info("%s [%s] Heating state restored - relays already ON, no commands sent", LOG_PREFIX, self.name)
+        self._schedule_state_write()
+        return True
+
+    def _save_runtime_state(self):
+        """Persist heating flag + filtered temperature (debounced store write)."""
+        current = round(self._current_temp, 2) if self._current_temp is not None else None
+        state = (self._is_heating, current)
+        if state == self._runtime_saved:
+            return
+        self._runtime_saved = state
+        self._runtime_store.set(self.name, {"heating": self._is_heating, "temp": current})
+
+    def _subscribe(self, entity_id: str, kind: str, handler):
+        """Subscribe to an entity via the shared dispatcher (released on removal)."""
+        if not self._registry.active(CATEGORY_STATE, (entity_id, handler)):
+            self._registry.track(
+                CATEGORY_STATE, (entity_id, handler),
+                self._dispatcher.subscribe(entity_id, kind, self.name, handler)
+            )
+
+    def _unsubscribe(self, entity_id: str, handler):
+        self._registry.release(CATEGORY_STATE, (entity_id, handler))
+
+    @callback
+    def _release_registry(self):
+        """Release every listener / timer / registration; report anything left behind."""
+        released = self._registry.release_all()
+        leaked = self._dispatcher.release_zone(self.name)
+        if leaked:
+            _LOGGER.warning(
+                "%s [%s] %d dispatcher subscriptions were not tracked - released (leak)",
+                LOG_PREFIX, self.name, leaked
+            )
+        _LOGGER.debug("%s [%s] Released %d listeners / timers", LOG_PREFIX, self.name, released)
+
+    @property
+    def subscription_counts(self) -> dict[str, int]:
+        """Live handles of the zone per category (state / timer / service)."""
+        return self._registry.counts()
+
+    def _verify_state_cache(self) -> int:
+        """
+        Compare the door/relay cache against the state machine.
+
+        The cache is corrected from the state machine; returns the number of
+        bits that differed.
+        """
+        door_mask = 0
+        for door, bit in self._door_bits.items():
+            state = self.hass.states.get(door)
+            if state and state.state == "on":
+                door_mask |= bit
+
+        relay_mask = 0
+        for relay, bit in self._relay_bits.items():
+            state = self.hass.states.get(relay)
+            if state and state.state == "on":
+                relay_mask |= bit
+
+        mismatches = (
+            bin(door_mask ^ self._door_open_mask).count("1")
+            + bin(relay_mask ^ self._relay_on_mask).count("1")
+        )
+        self._door_open_mask = door_mask
+        self._relay_on_mask = relay_mask
+        return mismatches
 
     async def async_will_remove_from_hass(self):
-        """Entity removal - unregister from boiler manager."""
-        self._boiler.unregister_zone_entity(self.name)
+        """Entity removal - release listeners, timers and the boiler manager registration."""
+        self._zone_removed = True
+        self._release_registry()
+        self._heating_time.set_on(self.name, False)
         _LOGGER.debug("%s [%s] Unregistered from boiler manager", LOG_PREFIX, self.name)
         await super().async_will_remove_from_hass()
 
@@ -372,23 +634,28 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
             return
 
         # Check door/window sensors
-        for door in self._door_sensors:
-            state = self.hass.states.get(door)
-            if state and state.state == "on":
-                _LOGGER.debug(
-                    "%s [%s] Piggyback skipped - door/window open",
-                    LOG_PREFIX, self.name
-                )
-                return
+        if self._door_open_mask:
+            _LOGGER.debug(
+                "%s [%s] Piggyback skipped - door/window open",
+                LOG_PREFIX, self.name
+            )
+            return
+
+        if self._raw_overheated():
+            return
 
         # Simple check: current < target (NO hysteresis)
         adjusted_target = self._get_adjusted_target_temp()
 
         if self._current_temp < adjusted_target:
+            self._trace.record(
+                self._current_temp, self._target_temp, adjusted_target, 0.0, OUTCOME_ON, "Piggyback"
+            )
             _LOGGER.info(
                 "%s [%s] PIGGYBACK HEATING! Current=%.2f°C < Adjusted Target=%.2f°C → Turning ON",
                 LOG_PREFIX, self.name, self._current_temp, adjusted_target
             )
+            self._counters.increment(self.name, COUNTER_PIGGYBACK_ACTIVATIONS)
             await self._set_heating(True, reason="Piggyback heating (boiler already running)")
         else:
             _LOGGER.debug(
@@ -400,103 +667,125 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
     # EVENT-BASED RELAY MONITORING
     # ==================================================================================
 
-    @callback
-    async def _relay_state_changed(self, event):
+    async def _relay_state_changed(self, entity_id: str, is_on: Optional[bool], was_on: Optional[bool]):
         """Instant relay state change detection (event-based)."""
-        new_state = event.data.get("new_state")
-        old_state = event.data.get("old_state")
+        bit = self._relay_bits.get(entity_id, 0)
+        if is_on:
+            self._relay_on_mask |= bit
+        else:
+            self._relay_on_mask &= ~bit
 
-        if not new_state or not old_state:
+        if is_on is None or was_on is None or is_on == was_on:
+            return
+        if self._relay_queue.is_pending(self._relay_entities):
+            # Our own command in progress (relays of a zone do not switch at the same instant)
             return
 
-        if new_state.state != old_state.state:
-            relay_id = new_state.entity_id
-            _LOGGER.info(
-                "%s [%s] Relay state changed: %s → %s (event-based detection)",
-                LOG_PREFIX, self.name, relay_id, new_state.state.upper()
-            )
-
-            # Check all relay states
-            relay_states = []
-            for r_id in self._relay_entities:
-                r_state = self.hass.states.get(r_id)
-                if r_state:
-                    relay_states.append(r_state.state == "on")
+        _LOGGER.info(
+            "%s [%s] Relay state changed: %s → %s (event-based detection)",
+            LOG_PREFIX, self.name, entity_id, "ON" if is_on else "OFF"
+        )
 
-            actual_heating = any(relay_states) if relay_states else False
+        # Any relay on (cached bitmask)
+        actual_heating = self._relay_on_mask != 0
 
-            if actual_heating != self._is_heating:
-                _LOGGER.warning(
-                    "%s [%s] MANUAL OVERRIDE DETECTED! Expected=%s, Actual=%s → Synchronizing",
-                    LOG_PREFIX, self.name, self._is_heating, actual_heating
-                )
+        if actual_heating != self._is_heating:
+            _LOGGER.warning(
+                "%s [%s] MANUAL OVERRIDE DETECTED! Expected=%s, Actual=%s → Synchronizing",
+                LOG_PREFIX, self.name, self._is_heating, actual_heating
+            )
 
-                self._is_heating = actual_heating
+            self._is_heating = actual_heating
+            self._counters.increment(self.name, COUNTER_MANUAL_OVERRIDES)
+            self._heating_time.set_on(self.name, actual_heating)
+            self._save_runtime_state()
 
-                # Boiler coordination
-                if actual_heating and self._boiler_entity:
-                    await self._boiler.turn_on(self._boiler_entity, zone=self.name)
-                elif not actual_heating and self._boiler_entity:
-                    await self._boiler.turn_off(self._boiler_entity, zone=self.name)
+            # Boiler coordination
+            if actual_heating and self._boiler_entity:
+                await self._boiler.turn_on(self._boiler_entity, zone=self.name)
+            elif not actual_heating and self._boiler_entity:
+                await self._boiler.turn_off(self._boiler_entity, zone=self.name)
 
-                self.async_write_ha_state()
+            self._schedule_state_write()
 
     # ==================================================================================
     # SENSOR CALLBACKS
     # ==================================================================================
 
-    @callback
-    async def _sensor_changed(self, event):
-        """Temperature sensor change."""
-        new_state = event.data.get("new_state")
-        if not new_state:
+    async def _sensor_changed(self, entity_id: str, temp: Optional[float], old_temp: Optional[float]):
+        """Temperature sensor change (value parsed by the dispatcher)."""
+        if temp is None:
+            state = self.hass.states.get(entity_id)
+            _LOGGER.warning(
+                "%s [%s] Sensor unavailable or invalid: %s",
+                LOG_PREFIX, self.name, state.state if state else None
+            )
             return
 
-        if new_state.state in ["unavailable", "unknown", "none"]:
-            _LOGGER.warning("%s [%s] Sensor unavailable", LOG_PREFIX, self.name)
-            return
+        self._raw_temp = temp
+        self._current_temp = self._filtered(temp)
+        _LOGGER.debug("%s [%s] Sensor: %.2f°C (filtered: %.2f°C)", LOG_PREFIX, self.name, temp, self._current_temp)
 
-        try:
-            self._current_temp = float(new_state.state)
-            _LOGGER.debug("%s [%s] Sensor: %.2f°C", LOG_PREFIX, self.name, self._current_temp)
+        # Overheat protection runs on every raw reading (no filter / deadband / rate limit)
+        await self._check_overheat_protection()
 
-            await self._check_overheat_protection()
-            await self._auto_heat_restart()
-            await self._evaluate_heating()
+        # NEW v1.10.0: drop redundant evaluations
+        if (
+            self._last_eval_temp is not None
+            and abs(self._current_temp - self._last_eval_temp) < self._sensor_deadband
+        ):
+            self._eval_stats["skipped_deadband"] += 1
+            return
 
-        except (ValueError, TypeError):
-            _LOGGER.error("%s [%s] Invalid sensor value: %s", LOG_PREFIX, self.name, new_state.state)
+        if self._last_eval_at is not None and self._min_eval_interval > 0:
+            remaining = self._min_eval_interval - (self.hass.loop.time() - self._last_eval_at)
+            if remaining > 0:
+                # Trailing edge: the latest reading is evaluated when the interval ends
+                self._eval_stats["skipped_rate_limit"] += 1
+                if not self._registry.active(CATEGORY_TIMER, TIMER_DEFERRED_EVALUATION):
+                    self._registry.track(
+                        CATEGORY_TIMER, TIMER_DEFERRED_EVALUATION,
+                        async_call_later(self.hass, remaining, self._deferred_evaluation)
+                    )
+                return
 
-    @callback
-    async def _outdoor_sensor_changed(self, event):
-        """Outdoor temperature change."""
-        new_state = event.data.get("new_state")
-        if not new_state or new_state.state in ["unavailable", "unknown", "none"]:
-            return
+        fired = SENSOR_EVENT_FIRED.get()
+        if fired is not None:
+            self._metrics.observe(METRIC_EVENT_TO_DECISION, (time.time() - fired) * 1000, self.name)
 
-        try:
-            old_outdoor = self._outdoor_temp
-            self._outdoor_temp = float(new_state.state)
-            _LOGGER.debug("%s [%s] Outdoor: %.2f°C", LOG_PREFIX, self.name, self._outdoor_temp)
+        await self._auto_heat_restart()
+        await self._evaluate_heating()
 
-            if old_outdoor is not None and abs(self._outdoor_temp - old_outdoor) > 5.0:
-                _LOGGER.info(
-                    "%s [%s] Significant outdoor change: %.1f → %.1f°C, re-evaluating",
-                    LOG_PREFIX, self.name, old_outdoor, self._outdoor_temp
-                )
-                await self._evaluate_heating()
+    def _filtered(self, temp: Optional[float]) -> Optional[float]:
+        """Pass a raw reading through the zone filter."""
+        if temp is None or self._filter is None:
+            return temp
+        return self._filter.update(temp)
 
-        except (ValueError, TypeError):
-            pass
+    async def _deferred_evaluation(self, _now=None):
+        """Rate-limited evaluation with the latest sensor reading."""
+        self._registry.forget(CATEGORY_TIMER, TIMER_DEFERRED_EVALUATION)
+        if self._zone_removed:
+            return
+        await self._auto_heat_restart()
+        await self._evaluate_heating()
 
     @callback
-    async def _door_changed(self, event):
+    def _cancel_deferred_evaluation(self):
+        self._registry.release(CATEGORY_TIMER, TIMER_DEFERRED_EVALUATION)
+
+    async def _door_changed(self, entity_id: str, is_open: Optional[bool], was_open: Optional[bool]):
         """Door/window sensor change."""
-        new_state = event.data.get("new_state")
-        if new_state and new_state.state == "on":
+        bit = self._door_bits.get(entity_id, 0)
+        if is_open:
+            self._door_open_mask |= bit
+        else:
+            self._door_open_mask &= ~bit
+
+        if is_open:
             _LOGGER.warning("%s [%s] Door/window open – heating paused", LOG_PREFIX, self.name)
             await self._set_heating(False, reason="Door/window open")
-        elif new_state and new_state.state == "off":
+        elif is_open is False:
             _LOGGER.info("%s [%s] Door/window closed – re-evaluating", LOG_PREFIX, self.name)
             await self._evaluate_heating()
 
@@ -504,17 +793,27 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
     # OVERHEAT PROTECTION
     # ==================================================================================
 
+    def _raw_overheated(self) -> bool:
+        """Raw sensor reading at or above the overheat limit."""
+        return self._raw_temp is not None and self._raw_temp >= self._overheat_temp
+
     async def _check_overheat_protection(self):
         """Overheat protection check."""
-        if self._current_temp is None:
+        # Raw reading: a filter must not delay the emergency shutdown
+        temp = self._raw_temp if self._raw_temp is not None else self._current_temp
+        if temp is None:
             return
 
-        if self._current_temp >= self._overheat_temp:
+        if temp >= self._overheat_temp:
             if self._is_heating:
+                self._trace.record(
+                    temp, self._target_temp, None, None, OUTCOME_OFF, ERR_OVERHEAT
+                )
                 _LOGGER.error(
                     "%s [%s] OVERHEAT! Current=%.2f°C >= Limit=%.1f°C → Emergency shutdown",
-                    LOG_PREFIX, self.name, self._current_temp, self._overheat_temp
+                    LOG_PREFIX, self.name, temp, self._overheat_temp
                 )
+                self._counters.increment(self.name, COUNTER_OVERHEAT_TRIPS)
                 await self._set_heating(False, reason=ERR_OVERHEAT)
 
     # ==================================================================================
@@ -541,7 +840,7 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
                     LOG_PREFIX, self.name, self._current_temp, adjusted_target
                 )
                 self._hvac_mode = HVACMode.HEAT
-                self.async_write_ha_state()
+                self._schedule_state_write()
 
     # ==================================================================================
     # TEMPERATURE OFFSET (v1.7.0 - Radiator vs Wall Thermostat)
@@ -558,16 +857,15 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
         Returns:
             Adjusted target temperature in °C
         """
+        return self._adjust_target(self._target_temp)
+
+    def _adjust_target(self, target: float) -> float:
+        """Thermostat type compensation for any setpoint."""
         if self._thermostat_type == THERMOSTAT_TYPE_RADIATOR:
-            adjusted = self._target_temp + self._temp_offset
-            _LOGGER.debug(
-                "%s [%s] Adjusted target: %.1f°C (base) + %.1f°C (offset) = %.1f°C (radiator thermostat)",
-                LOG_PREFIX, self.name, self._target_temp, self._temp_offset, adjusted
-            )
-            return adjusted
+            return target + self._temp_offset
         else:
             # Wall thermostat - no adjustment needed
-            return self._target_temp
+            return target
 
     # ==================================================================================
     # ADAPTIVE HYSTERESIS
@@ -583,21 +881,180 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
         if not self._adaptive_hysteresis_enabled or self._outdoor_temp is None:
             return self._base_hysteresis
 
-        multiplier = 1.0
-        for temp_threshold, mult in sorted(ADAPTIVE_HYSTERESIS_MULTIPLIERS.items()):
-            if self._outdoor_temp < temp_threshold:
-                multiplier = mult
-                break
+        # NEW v1.10.0: band multiplier precomputed by OutdoorTemperatureService
+        return self._base_hysteresis * self._hyst_multiplier
+
+    def apply_outdoor_band(self, outdoor_temp: Optional[float], multiplier: float) -> bool:
+        """
+        Receive outdoor temperature and hysteresis band from the outdoor service.
 
-        effective_hyst = self._base_hysteresis * multiplier
+        Returns True if the effective hysteresis of this zone changed.
+        """
+        old_hysteresis = self._get_effective_hysteresis()
+        self._outdoor_temp = outdoor_temp
+        self._hyst_multiplier = multiplier
+        return self._get_effective_hysteresis() != old_hysteresis
 
+    def _sync_outdoor_registration(self) -> bool:
+        """(Un)register with the outdoor service. Returns True if registered."""
+        if self._outdoor_sensor and self._adaptive_hysteresis_enabled:
+            # Track first: replacing an existing handle unregisters the zone
+            self._registry.track(
+                CATEGORY_SERVICE, "outdoor", lambda: self._outdoor_service.unregister_zone(self.name)
+            )
+            self._outdoor_service.register_zone(self.name, self)
+            return True
+        if not self._registry.release(CATEGORY_SERVICE, "outdoor"):
+            self._outdoor_service.unregister_zone(self.name)
+        self._outdoor_temp = None
+        self._hyst_multiplier = 1.0
+        return False
+
+    def apply_common_settings(self, settings: dict):
+        """Apply updated common settings in place (no reload)."""
+        self._boiler_entity = settings.get(CONF_BOILER_MAIN)
+        self._base_hysteresis = settings.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS)
+        self._overheat_temp = settings.get(CONF_OVERHEAT_PROTECTION, DEFAULT_OVERHEAT_TEMP)
+        self._outdoor_sensor = settings.get(CONF_OUTDOOR_SENSOR)
+        self._adaptive_hysteresis_enabled = settings.get(CONF_ADAPTIVE_HYSTERESIS, DEFAULT_ADAPTIVE_HYSTERESIS)
+        self._sync_outdoor_registration()
+        self._schedule_state_write()
         _LOGGER.debug(
-            "%s [%s] Adaptive hyst: %.2f × %.2f = %.2f (outdoor=%.1f°C)",
-            LOG_PREFIX, self.name, self._base_hysteresis, multiplier,
-            effective_hyst, self._outdoor_temp
+            "%s [%s] Common settings applied: Hyst=%.2f°C | Overheat=%.1f°C | Adaptive=%s",
+            LOG_PREFIX, self.name, self._base_hysteresis, self._overheat_temp, self._adaptive_hysteresis_enabled
         )
 
-        return effective_hyst
+    # ==================================================================================
+    # OPTIONS HOT-APPLY (v1.10.0)
+    # ==================================================================================
+
+    def options_reload_reason(self, zone_data) -> Optional[str]:
+        """Why the new zone options cannot be applied in place (None = they can)."""
+        if zone_data.get(CONF_SENSOR) != self._sensor_entity_id:
+            # Filter history, deadband reference and learned session belong to the old sensor
+            return "temperature sensor changed"
+        return None
+
+    async def async_apply_zone_options(self, zone_data) -> list[str]:
+        """
+        Apply changed zone options to the running entity (no reload).
+
+        Each option is diffed against the entity; subscriptions are moved only
+        for doors / relays that were added or removed. Returns the changed
+        option names (one evaluation follows if anything changed).
+        """
+        changed = []
+
+        schedule = zone_data.get(CONF_SCHEDULE, [])
+        if schedule != self._schedule:
+            self._schedule = schedule
+            self._compiled_schedule = CompiledSchedule(schedule)
+            for error in self._compiled_schedule.errors:
+                _LOGGER.warning("%s [%s] Invalid schedule block: %s", LOG_PREFIX, self.name, error)
+            changed.append(CONF_SCHEDULE)
+
+        heating_mode = zone_data.get(CONF_HEATING_MODE, DEFAULT_HEATING_MODE)
+        if heating_mode != self._heating_mode:
+            self._heating_mode = heating_mode
+            changed.append(CONF_HEATING_MODE)
+
+        thermostat_type = zone_data.get(CONF_THERMOSTAT_TYPE, DEFAULT_THERMOSTAT_TYPE)
+        if thermostat_type != self._thermostat_type:
+            self._thermostat_type = thermostat_type
+            changed.append(CONF_THERMOSTAT_TYPE)
+
+        temp_offset = zone_data.get(CONF_TEMP_OFFSET, DEFAULT_TEMP_OFFSET)
+        if temp_offset != self._temp_offset:
+            self._temp_offset = temp_offset
+            changed.append(CONF_TEMP_OFFSET)
+
+        sensor_deadband = float(zone_data.get(CONF_SENSOR_DEADBAND, DEFAULT_SENSOR_DEADBAND))
+        if sensor_deadband != self._sensor_deadband:
+            self._sensor_deadband = sensor_deadband
+            changed.append(CONF_SENSOR_DEADBAND)
+
+        min_eval_interval = float(zone_data.get(CONF_MIN_EVAL_INTERVAL, DEFAULT_MIN_EVAL_INTERVAL))
+        if min_eval_interval != self._min_eval_interval:
+            self._min_eval_interval = min_eval_interval
+            changed.append(CONF_MIN_EVAL_INTERVAL)
+
+        sensor_filter = zone_data.get(CONF_SENSOR_FILTER, DEFAULT_SENSOR_FILTER)
+        filter_window = zone_data.get(CONF_FILTER_WINDOW, DEFAULT_FILTER_WINDOW)
+        if (sensor_filter, filter_window) != (self._sensor_filter_type, self._filter_window):
+            self._sensor_filter_type = sensor_filter
+            self._filter_window = filter_window
+            self._filter = create_filter(sensor_filter, filter_window)
+            # New filter starts from the current value (no cold start)
+            self._current_temp = self._filtered(self._current_temp if self._filter else self._raw_temp)
+            changed.append(CONF_SENSOR_FILTER)
+
+        preheat_enabled = zone_data.get(CONF_PREHEAT_ENABLED, DEFAULT_PREHEAT_ENABLED)
+        if preheat_enabled != self._preheat_enabled:
+            self._preheat_enabled = preheat_enabled
+            changed.append(CONF_PREHEAT_ENABLED)
+
+        doors = list(zone_data.get(CONF_DOOR_SENSORS, []))
+        if doors != self._door_sensors:
+            self._resubscribe(self._door_sensors, doors, self._door_changed)
+            self._door_sensors = doors
+            self._door_bits = {door: 1 << i for i, door in enumerate(doors)}
+            changed.append(CONF_DOOR_SENSORS)
+
+        relays = list(zone_data.get(CONF_ZONE_RELAYS, []))
+        if relays != self._relay_entities:
+            await self._apply_relay_list(relays)
+            changed.append(CONF_ZONE_RELAYS)
+
+        if not changed:
+            return changed
+
+        if CONF_DOOR_SENSORS in changed or CONF_ZONE_RELAYS in changed:
+            self._verify_state_cache()
+
+        # Schedule / pre-heat: current block re-applied, transition timer re-armed
+        if self._preset_mode == PRESET_AUTO and (CONF_SCHEDULE in changed or CONF_PREHEAT_ENABLED in changed):
+            self._cancel_schedule_timer()
+            if self._schedule:
+                self._apply_current_schedule_block()
+                self._schedule_next_transition()
+        elif not self._preheat_enabled:
+            self._cancel_preheat_timer()
+
+        _LOGGER.info("%s [%s] Options applied in place: %s", LOG_PREFIX, self.name, ", ".join(changed))
+        await self._evaluate_heating()
+        self._schedule_state_write()
+        return changed
+
+    def _resubscribe(self, old: list[str], new: list[str], handler):
+        """Move dispatcher subscriptions from the old entity list to the new one."""
+        for entity_id in set(old) - set(new):
+            self._unsubscribe(entity_id, handler)
+        for entity_id in new:
+            self._subscribe(entity_id, KIND_BINARY, handler)
+
+    async def _apply_relay_list(self, relays: list[str]):
+        """
+        Replace the zone relays.
+
+        Removed relays are switched off (the zone no longer controls them)
+        unless another heating zone shares them; added relays follow the
+        current heating state.
+        """
+        removed = [relay for relay in self._relay_entities if relay not in relays]
+        added = [relay for relay in relays if relay not in self._relay_entities]
+        shared = self._boiler.relays_heated_by_others(self.name)
+
+        self._resubscribe(self._relay_entities, relays, self._relay_state_changed)
+        self._relay_entities = relays
+        self._relay_bits = {relay: 1 << i for i, relay in enumerate(relays)}
+
+        calls = [self._relay_queue.async_switch([r for r in removed if r not in shared], False, zone=self.name)]
+        if self._is_heating:
+            calls.append(self._relay_queue.async_switch(added, True, zone=self.name))
+        await asyncio.gather(*calls)
+        _LOGGER.debug(
+            "%s [%s] Relays updated: +%s -%s", LOG_PREFIX, self.name, added, removed
+        )
 
     # ==================================================================================
     # PRESET MODES
@@ -622,19 +1079,13 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
         if preset_mode == PRESET_AUTO:
             if self._schedule:
                 self._apply_current_schedule_block()
-                if not self._schedule_tracker:
-                    self._schedule_tracker = async_track_time_interval(
-                        self.hass,
-                        self._check_schedule,
-                        timedelta(minutes=15)
-                    )
+                if not self._registry.active(CATEGORY_TIMER, TIMER_SCHEDULE):
+                    self._schedule_next_transition()
             else:
                 _LOGGER.warning("%s [%s] AUTO preset but no schedule configured!", LOG_PREFIX, self.name)
 
         elif preset_mode == PRESET_MANUAL:
-            if self._schedule_tracker:
-                self._schedule_tracker()
-                self._schedule_tracker = None
+            self._cancel_schedule_timer()
 
         elif preset_mode in [PRESET_COMFORT, PRESET_ECO, PRESET_AWAY]:
             self._target_temp = PRESET_TEMPERATURES[preset_mode]
@@ -643,12 +1094,10 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
                 LOG_PREFIX, self.name, preset_mode, self._target_temp
             )
 
-            if self._schedule_tracker:
-                self._schedule_tracker()
-                self._schedule_tracker = None
+            self._cancel_schedule_timer()
 
         await self._evaluate_heating()
-        self.async_write_ha_state()
+        self._schedule_state_write()
 
     @property
     def preset_mode(self) -> Optional[str]:
@@ -663,37 +1112,152 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
     # ==================================================================================
 
     def _apply_current_schedule_block(self):
-        """Apply current schedule block."""
-        if not self._schedule or self._preset_mode != PRESET_AUTO:
-            return
-
-        now = datetime.now().time()
-        for block in self._schedule:
-            try:
-                start_time = datetime.strptime(str(block["start"])[:5], "%H:%M").time()
-                end_time = datetime.strptime(str(block["end"])[:5], "%H:%M").time()
-
-                if start_time <= end_time:
-                    if start_time <= now < end_time:
-                        self._target_temp = float(block["temp"])
-                        _LOGGER.info(
-                            "%s [%s] Schedule: %s (%.1f°C)",
-                            LOG_PREFIX, self.name, block.get("label", "Period"), self._target_temp
-                        )
-                        return
-                else:
-                    if now >= start_time or now < end_time:
-                        self._target_temp = float(block["temp"])
-                        _LOGGER.info(
-                            "%s [%s] Schedule: %s (%.1f°C)",
-                            LOG_PREFIX, self.name, block.get("label", "Period"), self._target_temp
-                        )
-                        return
-            except (KeyError, ValueError, TypeError) as e:
-                _LOGGER.warning("%s [%s] Invalid schedule block: %s", LOG_PREFIX, self.name, e)
+        """Apply current schedule block (O(1) lookup in the compiled schedule)."""
+        if not self._compiled_schedule or self._preset_mode != PRESET_AUTO:
+            return
+
+        now = dt_util.now()
+        block = self._compiled_schedule.block_at(now.hour * 60 + now.minute)
+        self._preheat_block = None
+        if block is not None:
+            self._target_temp = block.temp
+            _LOGGER.info(
+                "%s [%s] Schedule: %s (%.1f°C)",
+                LOG_PREFIX, self.name, block.label, self._target_temp
+            )
+
+    def _schedule_next_transition(self):
+        """Arm a single timer for the next schedule block transition."""
+        self._cancel_schedule_timer()
+
+        now = dt_util.now()
+        delta = self._compiled_schedule.minutes_until_next_transition(now.hour * 60 + now.minute)
+        if delta is None:
+            return
+
+        when = now.replace(second=0, microsecond=0) + timedelta(minutes=delta)
+        self._registry.track(
+            CATEGORY_TIMER, TIMER_SCHEDULE,
+            async_track_point_in_time(self.hass, self._schedule_transition, when)
+        )
+        _LOGGER.debug("%s [%s] Next schedule transition at %s", LOG_PREFIX, self.name, when)
+
+        if self._preheat_enabled:
+            self._schedule_preheat(now, when)
+
+    @callback
+    def _cancel_schedule_timer(self):
+        """Cancel the pending schedule transition (and pre-heat) timer."""
+        self._registry.release(CATEGORY_TIMER, TIMER_SCHEDULE)
+        self._cancel_preheat_timer()
+        self._preheat_block = None
+
+    # ==================================================================================
+    # PREDICTIVE PRE-HEAT (v1.10.0)
+    # ==================================================================================
+
+    def _schedule_preheat(self, now, transition):
+        """Arm the pre-heat check for the block starting at `transition`."""
+        self._cancel_preheat_timer()
+        minute = transition.hour * 60 + transition.minute
+        block = self._compiled_schedule.block_at(minute)
+        if block is None or block.temp <= self._target_temp or self._current_temp is None:
+            return
+
+        rise = self._adjust_target(block.temp) - self._current_temp
+        lead = self._heat_model.lead_minutes(rise, self._outdoor_service.temperature)
+        if lead is None:
+            _LOGGER.debug("%s [%s] Pre-heat: heat-up rate not learned yet", LOG_PREFIX, self.name)
+            return
+
+        start = transition - timedelta(minutes=lead)
+        if start <= now:
+            self._start_preheat(block, lead)
+            return
+
+        # Re-check shortly before the start: the room temperature still changes
+        recheck = timedelta(minutes=PREHEAT_RECHECK_MINUTES)
+        check_at = start if start - now <= recheck else start - recheck
+        self._registry.track(
+            CATEGORY_TIMER, TIMER_PREHEAT,
+            async_track_point_in_time(self.hass, self._preheat_check, check_at)
+        )
+        _LOGGER.debug(
+            "%s [%s] Pre-heat for '%s' (%.1f°C): lead %.0f min, check at %s",
+            LOG_PREFIX, self.name, block.label, block.temp, lead, check_at
+        )
+
+    async def _preheat_check(self, now):
+        """Pre-heat timer fired: start now or re-arm with a fresh lead time."""
+        self._registry.forget(CATEGORY_TIMER, TIMER_PREHEAT)
+        if self._preset_mode != PRESET_AUTO or not self._registry.active(CATEGORY_TIMER, TIMER_SCHEDULE):
+            return
+        now = dt_util.now()
+        delta = self._compiled_schedule.minutes_until_next_transition(now.hour * 60 + now.minute)
+        if delta is None:
+            return
+        transition = now.replace(second=0, microsecond=0) + timedelta(minutes=delta)
+        self._schedule_preheat(now, transition)
+
+    def _start_preheat(self, block, lead: float):
+        """Raise the setpoint to the next block's temperature ahead of time."""
+        self._preheat_block = block
+        self._target_temp = block.temp
+        _LOGGER.info(
+            "%s [%s] Pre-heat started for '%s' → %.1f°C (%.0f min ahead)",
+            LOG_PREFIX, self.name, block.label, block.temp, lead
+        )
+        self.hass.async_create_task(self._async_preheat_started())
+
+    async def _async_preheat_started(self):
+        if self._zone_removed:
+            return
+        await self._evaluate_heating()
+        self._schedule_state_write()
+
+    @callback
+    def _cancel_preheat_timer(self):
+        self._registry.release(CATEGORY_TIMER, TIMER_PREHEAT)
+
+    def _heating_state_changed(self, enable: bool):
+        """Track relay-on periods and learn the heat-up rate when one ends."""
+        self._heating_time.set_on(self.name, enable)
+        self._save_runtime_state()
+        now = self.hass.loop.time()
+        if enable:
+            if self._current_temp is not None:
+                self._heat_session = HeatingSession(now, self._current_temp, self._outdoor_service.temperature)
+            return
+
+        session, self._heat_session = self._heat_session, None
+        if session is None or self._current_temp is None:
+            return
+        rate = session.rate(now, self._current_temp)
+        if rate is None:
+            return
+
+        outdoor_end = self._outdoor_service.temperature
+        if session.start_outdoor is None or outdoor_end is None:
+            outdoor = session.start_outdoor if outdoor_end is None else outdoor_end
+        else:
+            outdoor = (session.start_outdoor + outdoor_end) / 2
+        self._heat_model.update(rate, outdoor)
+        self._preheat_store.set(self.name, self._heat_model.as_dict())
+        _LOGGER.debug(
+            "%s [%s] Heat-up rate learned: %.2f°C/h (outdoor %s, samples %d)",
+            LOG_PREFIX, self.name, rate, outdoor, self._heat_model.samples
+        )
+
+    async def _schedule_transition(self, now):
+        """Schedule transition timer fired."""
+        self._registry.forget(CATEGORY_TIMER, TIMER_SCHEDULE)
+        if self._preset_mode != PRESET_AUTO:
+            return
+        await self._check_schedule(now)
+        self._schedule_next_transition()
 
     async def _check_schedule(self, now):
-        """Schedule check (periodic)."""
+        """Schedule check (on block transitions)."""
         if self._preset_mode != PRESET_AUTO:
             return
 
@@ -706,7 +1270,7 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
                 LOG_PREFIX, self.name, old_target, self._target_temp
             )
             await self._evaluate_heating()
-            self.async_write_ha_state()
+            self._schedule_state_write()
 
     # ==================================================================================
     # HEATING CONTROL (v1.6.0 - Underfloor vs Radiator)
@@ -714,47 +1278,159 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
 
     async def _evaluate_heating(self):
         """Evaluate heating need."""
+        self._mark_evaluated()
+
         if self._hvac_mode == HVACMode.OFF:
+            self._trace.record(self._current_temp, self._target_temp, None, None, OUTCOME_OFF, "HVAC OFF")
             if self._is_heating:
                 await self._set_heating(False, reason="HVAC OFF")
             return
 
         if self._current_temp is None:
+            self._trace.record(None, self._target_temp, None, None, OUTCOME_SKIP, "No temperature")
             _LOGGER.debug("%s [%s] Waiting for temperature...", LOG_PREFIX, self.name)
             return
 
         # Door/window check
-        for door in self._door_sensors:
-            state = self.hass.states.get(door)
-            if state and state.state == "on":
-                if self._is_heating:
-                    await self._set_heating(False, reason="Door/window open")
-                return
+        if self._door_open_mask:
+            self._trace.record(
+                self._current_temp, self._target_temp, None, None, OUTCOME_OFF, "Door/window open"
+            )
+            if self._is_heating:
+                await self._set_heating(False, reason="Door/window open")
+            return
+
+        # Filtered value may lag behind an overheating raw reading
+        if self._raw_overheated():
+            self._trace.record(
+                self._current_temp, self._target_temp, None, None, OUTCOME_OFF, ERR_OVERHEAT
+            )
+            if self._is_heating:
+                await self._set_heating(False, reason=ERR_OVERHEAT)
+            return
 
         # NEW v1.7.0: Get adjusted target temperature (compensates for radiator thermostats)
         adjusted_target = self._get_adjusted_target_temp()
         effective_hysteresis = self._get_effective_hysteresis()
-        diff = adjusted_target - self._current_temp
 
-        _LOGGER.debug(
-            "%s [%s] Evaluate: current=%.2f target=%.2f adjusted_target=%.2f diff=%.2f hyst=%.2f mode=%s thermostat=%s",
-            LOG_PREFIX, self.name, self._current_temp, self._target_temp, adjusted_target,
-            diff, effective_hysteresis, self._heating_mode, self._thermostat_type
+        # NEW v1.6.0: Different logic for underfloor vs radiator (control.decide_heating)
+        outcome, reason = decide_heating(
+            self._current_temp, adjusted_target, effective_hysteresis,
+            self._heating_mode == HEATING_MODE_UNDERFLOOR,
         )
 
-        # NEW v1.6.0: Different logic for underfloor vs radiator
-        if self._heating_mode == HEATING_MODE_UNDERFLOOR:
-            # Underfloor: NO hysteresis - instant on/off
-            if self._current_temp < adjusted_target:
-                await self._set_heating(True, reason="Underfloor needs heat (no hysteresis)")
-            elif self._current_temp >= adjusted_target:
-                await self._set_heating(False, reason="Underfloor target reached (no hysteresis)")
+        self._trace.record(
+            self._current_temp, self._target_temp, adjusted_target, effective_hysteresis, outcome, reason
+        )
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s [%s] Evaluate: current=%.2f target=%.2f adjusted_target=%.2f diff=%.2f hyst=%.2f mode=%s thermostat=%s → %s (%s)",
+                LOG_PREFIX, self.name, self._current_temp, self._target_temp, adjusted_target,
+                adjusted_target - self._current_temp, effective_hysteresis, self._heating_mode, self._thermostat_type, outcome, reason
+            )
+
+        if outcome != OUTCOME_HOLD:
+            await self._set_heating(outcome == OUTCOME_ON, reason=reason)
+
+    def _mark_evaluated(self):
+        """Any evaluation resets the deadband / rate limit reference."""
+        self._cancel_deferred_evaluation()
+        self._last_eval_at = self.hass.loop.time()
+        self._last_eval_temp = self._current_temp
+        self._eval_stats["evaluated"] += 1
+        self._counters.increment(self.name, COUNTER_EVALUATIONS)
+        self._save_runtime_state()
+
+    # ==================================================================================
+    # BATCHED EVALUATION (v1.10.0 - driven by BoilerManager.async_evaluate_all)
+    # ==================================================================================
+
+    def snapshot_row(self) -> tuple:
+        """(name, current, adjusted_target, hysteresis, flags, block_reason) for ZoneSnapshot."""
+        flags = FLAG_UNDERFLOOR if self._heating_mode == HEATING_MODE_UNDERFLOOR else 0
+
+        block_reason = None
+        if self._hvac_mode == HVACMode.OFF:
+            block_reason = "HVAC OFF"
+        elif self._current_temp is None:
+            flags |= FLAG_NO_TEMP
+        elif self._door_open_mask:
+            block_reason = "Door/window open"
+        elif self._raw_overheated():
+            block_reason = ERR_OVERHEAT
+        if block_reason:
+            flags |= FLAG_FORCE_OFF
+
+        return (
+            self.name, self._current_temp, self._get_adjusted_target_temp(),
+            self._get_effective_hysteresis(), flags, block_reason,
+        )
+
+    def apply_batch_decision(self, outcome: str, reason: str, adjusted_target: float, hysteresis: float) -> bool:
+        """
+        Take over a decision of the batched pass.
+
+        Returns True if the heating state changes; relays and boiler are then
+        switched by the BoilerManager in one consolidated command set.
+        """
+        self._mark_evaluated()
+        self._trace.record(self._current_temp, self._target_temp, adjusted_target, hysteresis, outcome, reason)
+        if outcome not in (OUTCOME_ON, OUTCOME_OFF):
+            return False
+        enable = outcome == OUTCOME_ON
+        if enable == self._is_heating:
+            return False
+        self._is_heating = enable
+        return True
+
+    def finish_batch_switch(self, results: dict[str, str], reason: str) -> bool:
+        """
+        Record the result of the consolidated relay command.
+
+        `results` are the relay queue results of the batch. Returns False when
+        the zone was switched on but none of its relays is confirmed on (the
+        boiler is not requested for it).
+        """
+        action = "turn_on" if self._is_heating else "turn_off"
+        self._last_relay_result = self._relay_result(action, results)
+        commanded = sum(1 for relay in self._relay_entities if results.get(relay) != RELAY_SKIPPED)
+        self._counters.increment(self.name, COUNTER_RELAY_COMMANDS, commanded)
+
+        relays_ok = not self._relay_entities or bool(self._last_relay_result["succeeded"])
+        if self._is_heating and not relays_ok and not self._last_relay_result["superseded"]:
+            self._is_heating = False
+            _LOGGER.error(
+                "%s [%s] No zone relay switched on (%s, batched) – heating stays OFF",
+                LOG_PREFIX, self.name, reason
+            )
+        elif self._is_heating and not relays_ok:
+            # A newer command owns the relays; the reconciliation sweep settles the boiler demand
+            self._heating_state_changed(True)
+            _LOGGER.warning(
+                "%s [%s] Heating ON (%s, batched) – relays taken over by a newer command: %s",
+                LOG_PREFIX, self.name, reason, ", ".join(self._last_relay_result["superseded"])
+            )
         else:
-            # Radiator: WITH hysteresis
-            if diff > effective_hysteresis:
-                await self._set_heating(True, reason=f"Needs heat (diff={diff:.2f}°C)")
-            elif diff < -effective_hysteresis:
-                await self._set_heating(False, reason=f"Too warm (diff={diff:.2f}°C)")
+            self._heating_state_changed(self._is_heating)
+            _LOGGER.info(
+                "%s [%s] Heating %s (%s, batched)",
+                LOG_PREFIX, self.name, "ON" if self._is_heating else "OFF", reason
+            )
+        self._schedule_state_write()
+        return relays_ok
+
+    @property
+    def relay_entities(self) -> list[str]:
+        return self._relay_entities
+
+    @property
+    def is_heating(self) -> bool:
+        return self._is_heating
+
+    @property
+    def boiler_entity(self) -> Optional[str]:
+        return self._boiler_entity
 
     async def _set_heating(self, enable: bool, reason: Optional[str] = None):
         """Control relays and boiler."""
@@ -762,37 +1438,81 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
             return
 
         self._is_heating = enable
+        self._heating_state_changed(enable)
         state_txt = "ON" if enable else "OFF"
 
-        if enable:
-            for relay in self._relay_entities:
-                await self._call_switch_service("turn_on", relay)
-            if self._boiler_entity:
+        # Relays are switched (and confirmed) first; the boiler follows only afterwards
+        result = await self._switch_relays("turn_on" if enable else "turn_off")
+
+        if self._is_heating != enable:
+            # A newer heating change took over meanwhile - it drives the relays and the boiler
+            _LOGGER.debug("%s [%s] Heating %s superseded (%s)", LOG_PREFIX, self.name, state_txt, reason)
+            return
+
+        if enable and self._relay_entities and not result["succeeded"] and result["superseded"]:
+            # Relays taken over by another command (batch / sweep); the sweep settles the boiler demand
+            _LOGGER.warning(
+                "%s [%s] Heating ON (%s) – relays taken over by a newer command, boiler request left to the sweep: %s",
+                LOG_PREFIX, self.name, reason, ", ".join(result["superseded"])
+            )
+            self._schedule_state_write()
+            return
+
+        if enable and self._relay_entities and not result["succeeded"]:
+            # Nothing heats - do not report heating (the next evaluation retries)
+            self._is_heating = False
+            self._heating_state_changed(False)
+            _LOGGER.error(
+                "%s [%s] No zone relay switched on – heating stays OFF, boiler request withheld",
+                LOG_PREFIX, self.name
+            )
+            self._schedule_state_write()
+            return
+
+        if self._boiler_entity:
+            if enable:
                 await self._boiler.turn_on(self._boiler_entity, zone=self.name)
-        else:
-            for relay in self._relay_entities:
-                await self._call_switch_service("turn_off", relay)
-            if self._boiler_entity:
+            else:
                 await self._boiler.turn_off(self._boiler_entity, zone=self.name)
 
-        _LOGGER.info(
-            "%s [%s] Heating %s %s",
-            LOG_PREFIX, self.name, state_txt, f"({reason})" if reason else ""
-        )
-        self.async_write_ha_state()
+        _LOGGER.info("%s [%s] Heating %s (%s)", LOG_PREFIX, self.name, state_txt, reason)
+        self._schedule_state_write()
 
-    async def _call_switch_service(self, action: str, entity_id: str):
-        """Call switch service."""
-        try:
-            await self.hass.services.async_call(
-                "switch",
-                action,
-                {"entity_id": entity_id},
-                blocking=True,
+    async def _switch_relays(self, action: str) -> dict:
+        """
+        Switch every zone relay through the relay command queue.
+
+        Returns one combined result for the zone:
+            {"action": ..., "succeeded": [...], "superseded": [...], "failed": [...]}
+        """
+        results = await self._relay_queue.async_switch(self._relay_entities, action == "turn_on", zone=self.name)
+        result = self._last_relay_result = self._relay_result(action, results)
+
+        if result["failed"]:
+            _LOGGER.warning(
+                "%s [%s] switch.%s: %d/%d relays OK, failed: %s",
+                LOG_PREFIX, self.name, action, len(result["succeeded"]),
+                len(self._relay_entities), ", ".join(result["failed"])
             )
-            _LOGGER.debug("%s [%s] switch.%s → %s", LOG_PREFIX, self.name, action, entity_id)
-        except Exception as e:
-            _LOGGER.warning("%s [%s] Failed relay control %s: %s", LOG_PREFIX, self.name, entity_id, e)
+        return result
+
+    def _relay_result(self, action: str, results: dict[str, str]) -> dict:
+        """
+        Zone relay result from the queue results.
+
+        Confirmed and skipped relays are in the commanded state; superseded
+        ones follow a newer command, so they are neither success nor failure.
+        """
+        result = {"action": action, "succeeded": [], "superseded": [], "failed": []}
+        for relay in self._relay_entities:
+            outcome = results.get(relay)
+            if outcome in (RELAY_CONFIRMED, RELAY_SKIPPED):
+                result["succeeded"].append(relay)
+            elif outcome == RELAY_SUPERSEDED:
+                result["superseded"].append(relay)
+            else:
+                result["failed"].append(relay)
+        return result
 
     # ==================================================================================
     # THERMOSTAT INTERFACE (v1.6.0 - Always HEAT mode when adjusting)
@@ -812,9 +1532,7 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
             _LOGGER.info("%s [%s] Manual adjustment → MANUAL preset", LOG_PREFIX, self.name)
             self._preset_mode = PRESET_MANUAL
 
-            if self._schedule_tracker:
-                self._schedule_tracker()
-                self._schedule_tracker = None
+            self._cancel_schedule_timer()
 
         # NEW v1.6.0: Always set to HEAT mode when adjusting temperature
         if self._hvac_mode == HVACMode.OFF:
@@ -826,7 +1544,7 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
             LOG_PREFIX, self.name, old_target, self._target_temp
         )
         await self._evaluate_heating()
-        self.async_write_ha_state()
+        self._schedule_state_write()
 
     async def async_set_hvac_mode(self, hvac_mode: str) -> None:
         """Set HVAC mode (explicit OFF control)."""
@@ -834,6 +1552,65 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
         self._hvac_mode = hvac_mode
         _LOGGER.info("%s [%s] HVAC: %s → %s", LOG_PREFIX, self.name, old_mode, hvac_mode)
         await self._evaluate_heating()
+        self._schedule_state_write()
+
+    # ==================================================================================
+    # DECISION TRACE (v1.10.0)
+    # ==================================================================================
+
+    async def async_dump_decision_trace(self) -> ServiceResponse:
+        """Service: return the recorded control decisions (oldest first)."""
+        return {"zone": self.name, "evaluations": dict(self._eval_stats), "records": self._trace.dump()}
+
+    def diagnostics(self) -> dict:
+        """Runtime state, latest decisions and latency histograms (diagnostics download)."""
+        return {
+            "hvac_mode": self._hvac_mode,
+            "preset_mode": self._preset_mode,
+            "is_heating": self._is_heating,
+            "current_temp": self._current_temp,
+            "raw_temp": self._raw_temp,
+            "target_temp": self._target_temp,
+            "adjusted_target_temp": self._get_adjusted_target_temp(),
+            "effective_hysteresis": self._get_effective_hysteresis(),
+            "outdoor_temp": self._outdoor_temp,
+            "heating_mode": self._heating_mode,
+            "thermostat_type": self._thermostat_type,
+            "temp_offset": self._temp_offset,
+            "sensor_filter": self._sensor_filter_type,
+            "sensor_deadband": self._sensor_deadband,
+            "min_eval_interval": self._min_eval_interval,
+            "preheat_enabled": self._preheat_enabled,
+            "preheat_block": self._preheat_block.label if self._preheat_block is not None else None,
+            "heat_model": self._heat_model.as_dict(),
+            "schedule_errors": list(self._compiled_schedule.errors),
+            "open_doors": [door for door, bit in self._door_bits.items() if self._door_open_mask & bit],
+            "relays_on": [relay for relay, bit in self._relay_bits.items() if self._relay_on_mask & bit],
+            "last_relay_result": self._last_relay_result,
+            "evaluations": dict(self._eval_stats),
+            "subscriptions": self._registry.counts(),
+            "recent_decisions": self._trace.dump()[-DIAGNOSTICS_TRACE_RECORDS:],
+            "latency": self._metrics.zone_as_dict(self.name),
+        }
+
+    # ==================================================================================
+    # STATE WRITES (v1.10.0 - coalesced)
+    # ==================================================================================
+
+    @callback
+    def _schedule_state_write(self):
+        """Mark the state dirty; it is written at most once per event-loop iteration."""
+        if self._state_write_pending:
+            return
+        self._state_write_pending = True
+        self.hass.loop.call_soon(self._flush_state_write)
+
+    @callback
+    def _flush_state_write(self):
+        """Write the pending state (skipped if the entity was removed meanwhile)."""
+        self._state_write_pending = False
+        if self.hass is None or self.entity_id is None or self._zone_removed:
+            return
         self.async_write_ha_state()
 
     # ==================================================================================
@@ -861,7 +1638,25 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
 
     @property
     def extra_state_attributes(self):
-        """Extra attributes."""
+        """Extra attributes (cached, rebuilt only when an input changed)."""
+        failed_relays = tuple(self._last_relay_result["failed"]) if self._last_relay_result else ()
+        raw_temp = self._raw_temp if self._filter is not None else None
+        preheat_label = self._preheat_block.label if self._preheat_block is not None else None
+        heat_rate = None
+        if self._preheat_enabled:
+            rate = self._heat_model.predict(self._outdoor_temp)
+            heat_rate = round(rate, 2) if rate is not None else None
+        # User-visible values only: the evaluation and subscription counters are in
+        # the diagnostics / decision trace dump (they would rewrite the attributes on every evaluation)
+        key = (
+            self._preset_mode, self._heating_mode, self._thermostat_type, self._temp_offset,
+            self._target_temp, self._overheat_temp, self._base_hysteresis,
+            self._adaptive_hysteresis_enabled, self._outdoor_temp, self._hyst_multiplier,
+            failed_relays, raw_temp, preheat_label, heat_rate,
+        )
+        if key == self._attrs_key:
+            return self._attrs_cache
+
         attrs = {
             "preset_mode": self._preset_mode,
             "heating_mode": self._heating_mode,
@@ -876,4 +1671,22 @@ class SmartHeatZoneClimate(ClimateEntity, RestoreEntity):
             attrs["outdoor_temperature"] = self._outdoor_temp
             attrs["effective_hysteresis"] = self._get_effective_hysteresis()
 
+        if failed_relays:
+            attrs["failed_relays"] = list(failed_relays)
+
+        # NEW v1.10.0: sensor filter
+        if self._filter is not None:
+            attrs["sensor_filter"] = self._sensor_filter_type
+            attrs["raw_temperature"] = raw_temp
+
+        # NEW v1.10.0: predictive pre-heat
+        if self._preheat_enabled:
+            attrs["preheat_active"] = preheat_label is not None
+            if preheat_label is not None:
+                attrs["preheat_block"] = preheat_label
+            if heat_rate is not None:
+                attrs["heat_up_rate"] = heat_rate
+
+        self._attrs_key = key
+        self._attrs_cache = attrs
         return attrs
@@ -2,6 +2,13 @@
 SmartHeatZones - Config Flow
 Version: 1.9.1
 
+NEW in v1.10.0 (in development):
+- Piggyback concurrency field in common settings
+- Boiler coalesce window and minimum on/off time fields in common settings
+- Sensor deadband and minimum evaluation interval fields in zone creation
+- Sensor filter type and window fields in zone creation
+- Predictive pre-heat switch in zone creation
+
 CHANGELOG v1.9.1 (BUGFIX)
 - Fixed: Removing the outdoor temperature sensor is not removed from settings
 
@@ -39,18 +46,37 @@ from .const import (
     CONF_OVERHEAT_PROTECTION,
     CONF_OUTDOOR_SENSOR,
     CONF_ADAPTIVE_HYSTERESIS,
+    CONF_PIGGYBACK_CONCURRENCY,
+    CONF_BOILER_COALESCE_WINDOW,
+    CONF_BOILER_MIN_ON_TIME,
+    CONF_BOILER_MIN_OFF_TIME,
     CONF_HEATING_MODE,
     CONF_THERMOSTAT_TYPE,
     CONF_TEMP_OFFSET,
+    CONF_SENSOR_DEADBAND,
+    CONF_MIN_EVAL_INTERVAL,
+    CONF_SENSOR_FILTER,
+    CONF_FILTER_WINDOW,
+    CONF_PREHEAT_ENABLED,
     CONF_IS_COMMON_SETTINGS,
     DEFAULT_HYSTERESIS,
     DEFAULT_OVERHEAT_TEMP,
     DEFAULT_ADAPTIVE_HYSTERESIS,
+    DEFAULT_PIGGYBACK_CONCURRENCY,
+    DEFAULT_BOILER_COALESCE_WINDOW,
+    DEFAULT_BOILER_MIN_ON_TIME,
+    DEFAULT_BOILER_MIN_OFF_TIME,
     DEFAULT_HEATING_MODE,
     DEFAULT_THERMOSTAT_TYPE,
     DEFAULT_TEMP_OFFSET,
+    DEFAULT_SENSOR_DEADBAND,
+    DEFAULT_MIN_EVAL_INTERVAL,
+    DEFAULT_SENSOR_FILTER,
+    DEFAULT_FILTER_WINDOW,
+    DEFAULT_PREHEAT_ENABLED,
     HEATING_MODES,
     THERMOSTAT_TYPES,
+    SENSOR_FILTERS,
     COMMON_SETTINGS_TITLE,
     ERR_NO_COMMON_SETTINGS,
     LOG_PREFIX,
@@ -158,6 +184,45 @@ class SmartHeatZonesFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_ADAPTIVE_HYSTERESIS,
                     default=DEFAULT_ADAPTIVE_HYSTERESIS
                 ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_PIGGYBACK_CONCURRENCY,
+                    default=DEFAULT_PIGGYBACK_CONCURRENCY
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1, max=32, step=1,
+                        mode="box"
+                    )
+                ),
+                vol.Optional(
+                    CONF_BOILER_COALESCE_WINDOW,
+                    default=DEFAULT_BOILER_COALESCE_WINDOW
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=120, step=1,
+                        unit_of_measurement="s",
+                        mode="box"
+                    )
+                ),
+                vol.Optional(
+                    CONF_BOILER_MIN_ON_TIME,
+                    default=DEFAULT_BOILER_MIN_ON_TIME
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=1800, step=1,
+                        unit_of_measurement="s",
+                        mode="box"
+                    )
+                ),
+                vol.Optional(
+                    CONF_BOILER_MIN_OFF_TIME,
+                    default=DEFAULT_BOILER_MIN_OFF_TIME
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=1800, step=1,
+                        unit_of_measurement="s",
+                        mode="box"
+                    )
+                ),
             }
         )
 
@@ -222,6 +287,48 @@ class SmartHeatZonesFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                         mode="box"
                     )
                 ),
+                vol.Optional(
+                    CONF_SENSOR_DEADBAND,
+                    default=DEFAULT_SENSOR_DEADBAND
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0.0, max=1.0, step=0.01,
+                        unit_of_measurement="°C",
+                        mode="box"
+                    )
+                ),
+                vol.Optional(
+                    CONF_MIN_EVAL_INTERVAL,
+                    default=DEFAULT_MIN_EVAL_INTERVAL
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=300, step=1,
+                        unit_of_measurement="s",
+                        mode="box"
+                    )
+                ),
+                vol.Required(
+                    CONF_SENSOR_FILTER,
+                    default=DEFAULT_SENSOR_FILTER
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=SENSOR_FILTERS,
+                        mode="dropdown"
+                    )
+                ),
+                vol.Optional(
+                    CONF_FILTER_WINDOW,
+                    default=DEFAULT_FILTER_WINDOW
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=2, max=15, step=1,
+                        mode="box"
+                    )
+                ),
+                vol.Optional(
+                    CONF_PREHEAT_ENABLED,
+                    default=DEFAULT_PREHEAT_ENABLED
+                ): selector.BooleanSelector(),
                 vol.Optional(CONF_SENSOR): selector.EntitySelector(
                     selector.EntitySelectorConfig(domain="sensor")
                 ),
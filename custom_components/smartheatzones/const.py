@@ -3,6 +3,31 @@ SmartHeatZones - Constants
 Version: 1.9.1 (HA 2025.10+ compatible)
 Author: forreggbor
 
+NEW in v1.10.0 (in development):
+- SWITCH_CALL_TIMEOUT for concurrent relay actuation
+- CONF_PIGGYBACK_CONCURRENCY common setting (piggyback fan-out limit)
+- Boiler command queue settings: coalesce window, minimum on/off time
+- DATA_DISPATCHER key for the shared event dispatcher
+- DECISION_TRACE_SIZE and SERVICE_DUMP_DECISION_TRACE (control decision trace)
+- Zone sensor deadband and minimum evaluation interval
+- Zone sensor filter (none / EMA / rolling median) and filter window
+- OUTDOOR_JUMP_THRESHOLD for the batched whole-house evaluation
+- Predictive pre-heat: CONF_PREHEAT_ENABLED zone option, learning constants,
+  DATA_PREHEAT_STORE and storage settings
+- COMMON_PLATFORMS: sensor platform on the common settings entry
+- Heating time accumulators: DATA_HEATING_TIME, HEATING_TIME_REFRESH; zone
+  entries set up the sensor platform too
+- Runtime state store (DATA_RUNTIME_STORE); STORE_KEY_BOILER is the boiler's
+  key in the zone keyed stores
+- Startup: DATA_COMMON_READY readiness event, DATA_SETUP_STARTED, wait timeout
+  for the common settings and the zone evaluation batch delay
+- Control loop metrics: DATA_METRICS, METRICS_BUCKETS_MS histogram buckets,
+  DIAGNOSTICS_TRACE_RECORDS (diagnostics download)
+- Control loop counters: DATA_COUNTERS, COUNTER_PUBLISH_INTERVAL
+- Relay command queue: DATA_RELAY_QUEUE, confirmation timeout, attempts,
+  retry backoff and overall command timeout
+- RELAY_CHECK_INTERVAL drives the reconciliation sweep
+
 CHANGELOG v1.9.1 (BUGFIX)
 - Fixed: Removing the outdoor temperature sensor is not removed from settings
 
@@ -53,7 +78,8 @@ CHANGELOG v1.5.1:
 
 DOMAIN = "smartheatzones"
 LOG_PREFIX = "[SmartHeatZones]"
-PLATFORMS = ["climate"]
+PLATFORMS = ["climate", "sensor"]  # NEW v1.10.0: sensor = zone heating time
+COMMON_PLATFORMS = ["sensor"]  # NEW v1.10.0: system sensors on the common settings entry
 INTEGRATION_VERSION = "1.9.1"  # Integration version displayed in UI
 
 # --- Adattároló kulcsok ---------------------------------------------------------
@@ -61,13 +87,24 @@ INTEGRATION_VERSION = "1.9.1"  # Integration version displayed in UI
 DATA_ENTRIES = "entries"
 DATA_ACTIVE_ZONES = "active_zones"
 DATA_BOILER_MAIN = "boiler_manager"
-DATA_OUTDOOR_TEMP = "outdoor_temp_sensor"
+DATA_OUTDOOR_TEMP = "outdoor_temp_sensor"  # v1.10.0: OutdoorTemperatureService instance
 DATA_COMMON_SETTINGS = "common_settings"  # NEW v1.6.0: Common settings entry
+DATA_DISPATCHER = "event_dispatcher"  # NEW v1.10.0: shared state change dispatcher
+DATA_PREHEAT_STORE = "preheat_store"  # NEW v1.10.0: learned heat-up rates (ZoneDataStore)
+DATA_HEATING_TIME = "heating_time"  # NEW v1.10.0: HeatingTimeTracker (on-time accumulators)
+DATA_RUNTIME_STORE = "runtime_store"  # NEW v1.10.0: heating / boiler state across restarts (ZoneDataStore)
+DATA_COMMON_READY = "common_ready"  # NEW v1.10.0: asyncio.Event, set when common settings are loaded
+DATA_SETUP_STARTED = "setup_started"  # NEW v1.10.0: loop time of the first entry setup (startup timing)
+DATA_METRICS = "metrics"  # NEW v1.10.0: ControlLoopMetrics (latency histograms)
+DATA_COUNTERS = "counters"  # NEW v1.10.0: ControlCounters (hourly / daily event counts)
+DATA_RELAY_QUEUE = "relay_queue"  # NEW v1.10.0: RelayCommandQueue (confirmed relay commands)
 
 # --- Közös beállítások (v1.6.0) -------------------------------------------------
 
 COMMON_SETTINGS_TITLE = "🔧 Közös beállítások"  # Fixed title for common settings
 CONF_IS_COMMON_SETTINGS = "is_common_settings"  # Flag to identify common settings entry
+COMMON_SETTINGS_WAIT_TIMEOUT = 120  # NEW v1.10.0: s, zones wait this long for common settings
+ZONE_EVALUATION_BATCH_DELAY = 1.0  # NEW v1.10.0: s, zones added while running are evaluated together
 
 # --- Konfigurációs kulcsok ------------------------------------------------------
 
@@ -80,6 +117,11 @@ CONF_SCHEDULE = "schedule"
 CONF_HEATING_MODE = "heating_mode"  # NEW v1.6.0: radiator or underfloor
 CONF_THERMOSTAT_TYPE = "thermostat_type"  # NEW v1.7.0: wall or radiator
 CONF_TEMP_OFFSET = "temp_offset"  # NEW v1.7.0: temperature offset for radiator thermostats
+CONF_SENSOR_DEADBAND = "sensor_deadband"  # NEW v1.10.0: ignore smaller sensor changes (°C)
+CONF_MIN_EVAL_INTERVAL = "min_eval_interval"  # NEW v1.10.0: seconds between evaluations
+CONF_SENSOR_FILTER = "sensor_filter"  # NEW v1.10.0: none, ema or median
+CONF_FILTER_WINDOW = "filter_window"  # NEW v1.10.0: readings in the filter window
+CONF_PREHEAT_ENABLED = "preheat_enabled"  # NEW v1.10.0: start schedule blocks early
 
 # Common settings config keys (v1.6.0)
 CONF_BOILER_MAIN = "boiler_main"
@@ -87,6 +129,10 @@ CONF_HYSTERESIS = "hysteresis"
 CONF_OVERHEAT_PROTECTION = "overheat_temp"
 CONF_OUTDOOR_SENSOR = "outdoor_temp_sensor"
 CONF_ADAPTIVE_HYSTERESIS = "adaptive_hysteresis_enabled"
+CONF_PIGGYBACK_CONCURRENCY = "piggyback_concurrency"  # NEW v1.10.0
+CONF_BOILER_COALESCE_WINDOW = "boiler_coalesce_window"  # NEW v1.10.0
+CONF_BOILER_MIN_ON_TIME = "boiler_min_on_time"  # NEW v1.10.0
+CONF_BOILER_MIN_OFF_TIME = "boiler_min_off_time"  # NEW v1.10.0
 
 # --- Fűtési módok (v1.6.0) ------------------------------------------------------
 
@@ -100,6 +146,13 @@ THERMOSTAT_TYPE_WALL = "wall"
 THERMOSTAT_TYPE_RADIATOR = "radiator"
 THERMOSTAT_TYPES = [THERMOSTAT_TYPE_WALL, THERMOSTAT_TYPE_RADIATOR]
 
+# --- Szenzor szűrők (v1.10.0) ----------------------------------------------------
+
+SENSOR_FILTER_NONE = "none"
+SENSOR_FILTER_EMA = "ema"
+SENSOR_FILTER_MEDIAN = "median"
+SENSOR_FILTERS = [SENSOR_FILTER_NONE, SENSOR_FILTER_EMA, SENSOR_FILTER_MEDIAN]
+
 # --- Preset módok (Better Thermostat kompatibilis) ------------------------------
 
 PRESET_AUTO = "auto"
@@ -134,6 +187,15 @@ DEFAULT_ADAPTIVE_HYSTERESIS = True
 DEFAULT_HEATING_MODE = HEATING_MODE_RADIATOR  # NEW v1.6.0
 DEFAULT_THERMOSTAT_TYPE = THERMOSTAT_TYPE_WALL  # NEW v1.7.0
 DEFAULT_TEMP_OFFSET = 3.0  # NEW v1.7.0: default offset for radiator thermostats
+DEFAULT_PIGGYBACK_CONCURRENCY = 8  # NEW v1.10.0: zones checked in parallel on boiler start
+DEFAULT_BOILER_COALESCE_WINDOW = 5  # NEW v1.10.0: seconds, a boiler stop waits this long (starts are not delayed)
+DEFAULT_BOILER_MIN_ON_TIME = 0  # NEW v1.10.0: seconds, 0 = boiler follows demand immediately
+DEFAULT_BOILER_MIN_OFF_TIME = 60  # NEW v1.10.0: seconds, anti short-cycle guard
+DEFAULT_SENSOR_DEADBAND = 0.05  # NEW v1.10.0: °C, 0 = evaluate every change
+DEFAULT_MIN_EVAL_INTERVAL = 15  # NEW v1.10.0: seconds, 0 = no rate limit (decisions may lag a crossing by this much)
+DEFAULT_SENSOR_FILTER = SENSOR_FILTER_NONE  # NEW v1.10.0
+DEFAULT_FILTER_WINDOW = 5  # NEW v1.10.0: readings
+DEFAULT_PREHEAT_ENABLED = False  # NEW v1.10.0
 
 # --- Adaptív hiszterézis beállítások ---------------------------------------------
 
@@ -145,9 +207,47 @@ ADAPTIVE_HYSTERESIS_MULTIPLIERS = {
                 # 10°C <= outdoor_temp → 1.0x (normál)
 }
 
+# Kültéri ugrás (°C) a legutóbbi kötegelt kiértékelés óta → minden adaptív zóna újraértékelése
+OUTDOOR_JUMP_THRESHOLD = 5.0  # NEW v1.10.0
+
 # --- Relay monitoring -------------------------------------------------------------
 
-RELAY_CHECK_INTERVAL = 30
+RELAY_CHECK_INTERVAL = 30  # v1.10.0: s, desired vs. actual reconciliation sweep (BoilerManager)
+SWITCH_CALL_TIMEOUT = 10  # NEW v1.10.0: per relay service call timeout (s)
+RELAY_CONFIRM_TIMEOUT = 5  # NEW v1.10.0: s, wait for the relay state event after a command
+RELAY_COMMAND_ATTEMPTS = 3  # NEW v1.10.0: attempts per relay command (first one included)
+RELAY_RETRY_BACKOFF = 1.0  # NEW v1.10.0: s before the first retry, doubled per retry
+RELAY_COMMAND_TIMEOUT = 20  # NEW v1.10.0: s, longest a command may hold its relays (all attempts)
+
+# --- Döntési napló (v1.10.0) ------------------------------------------------------
+
+DECISION_TRACE_SIZE = 200  # decisions kept per zone (ring buffer)
+SERVICE_DUMP_DECISION_TRACE = "dump_decision_trace"
+
+# --- Előfűtés (v1.10.0) -------------------------------------------------------------
+
+PREHEAT_MIN_SESSION = 600  # s, shorter heating periods are not learned from
+PREHEAT_MIN_RISE = 0.2  # °C, smaller rises are sensor noise
+PREHEAT_MIN_SAMPLES = 3  # learned periods before pre-heat is used
+PREHEAT_FORGET_FACTOR = 0.95  # weight kept by older samples per new sample
+PREHEAT_MAX_LEAD_MINUTES = 180  # never start earlier than this
+PREHEAT_RECHECK_MINUTES = 15  # lead time re-checked while approaching a block
+
+# --- Tárolás (v1.10.0) ----------------------------------------------------------------
+
+STORAGE_VERSION = 1
+STORE_SAVE_DELAY = 30  # s, debounced writes
+STORE_KEY_BOILER = "__boiler__"  # boiler entry in the zone keyed stores
+
+# --- Fűtési idő (v1.10.0) -------------------------------------------------------------
+
+HEATING_TIME_REFRESH = 60  # s, duration sensor refresh while heating
+
+# --- Mérőszámok és diagnosztika (v1.10.0) ------------------------------------------
+
+METRICS_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)  # histogram bucket bounds
+DIAGNOSTICS_TRACE_RECORDS = 20  # latest decisions per zone in the diagnostics download
+COUNTER_PUBLISH_INTERVAL = 30  # s, counter sensors are updated at most this often
 
 # --- Egyéb állandók --------------------------------------------------------------
 
@@ -0,0 +1,102 @@
+"""
+SmartHeatZones - Control Decisions
+Version: 1.10.0
+
+NEW in v1.10.0:
+- decide_heating(): the zone heating decision as a pure function, shared by the
+  per-zone evaluation and the batched whole-house pass
+- ZoneSnapshot: compact array-backed snapshot of all zones, decided in one pass
+"""
+
+import math
+from array import array
+from typing import Optional, Sequence
+
+from .trace import OUTCOME_HOLD, OUTCOME_OFF, OUTCOME_ON, OUTCOME_SKIP
+
+# Snapshot row flags
+FLAG_UNDERFLOOR = 0x01  # no hysteresis (instant on/off)
+FLAG_NO_TEMP = 0x02  # no valid temperature → skip
+FLAG_FORCE_OFF = 0x04  # HVAC off, door open, overheat → off
+
+# Outcome codes stored in the snapshot result bytearray
+_OUTCOME_CODES = (OUTCOME_OFF, OUTCOME_ON, OUTCOME_HOLD, OUTCOME_SKIP)
+_CODE_OFF, _CODE_ON, _CODE_HOLD, _CODE_SKIP = range(4)
+_CODE_BY_OUTCOME = {outcome: code for code, outcome in enumerate(_OUTCOME_CODES)}
+
+
+def decide_heating(
+    current: float, adjusted_target: float, hysteresis: float, underfloor: bool
+) -> tuple[str, str]:
+    """
+    Heating decision for one zone.
+
+    Returns (outcome, reason); reasons are constant strings (no formatting cost).
+    """
+    if underfloor:
+        # Underfloor: NO hysteresis - instant on/off
+        if current < adjusted_target:
+            return OUTCOME_ON, "Underfloor needs heat (no hysteresis)"
+        return OUTCOME_OFF, "Underfloor target reached (no hysteresis)"
+
+    # Radiator: WITH hysteresis
+    diff = adjusted_target - current
+    if diff > hysteresis:
+        return OUTCOME_ON, "Needs heat"
+    if diff < -hysteresis:
+        return OUTCOME_OFF, "Too warm"
+    return OUTCOME_HOLD, "Within hysteresis"
+
+
+class ZoneSnapshot:
+    """
+    Az összes zóna állapota tömör, tömb alapú formában.
+
+    One row per zone: current / adjusted target / hysteresis in float arrays,
+    flags in a bytearray, forced-off reasons in a sparse dict.
+    """
+
+    __slots__ = ("names", "current", "target", "hysteresis", "flags", "block_reasons")
+
+    def __init__(self, rows: Sequence[tuple]):
+        """rows: (name, current, adjusted_target, hysteresis, flags, block_reason)"""
+        count = len(rows)
+        self.names: list[str] = [row[0] for row in rows]
+        self.current = array("d", (math.nan if row[1] is None else row[1] for row in rows))
+        self.target = array("d", (row[2] for row in rows))
+        self.hysteresis = array("d", (row[3] for row in rows))
+        self.flags = bytearray(row[4] for row in rows)
+        self.block_reasons: dict[int, str] = {
+            i: rows[i][5] for i in range(count) if rows[i][5]
+        }
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def decide(self) -> tuple[bytearray, list[Optional[str]]]:
+        """One pass over all rows → (outcome codes, reasons)."""
+        count = len(self.names)
+        outcomes = bytearray(count)
+        reasons: list[Optional[str]] = [None] * count
+        current, target, hysteresis, flags = self.current, self.target, self.hysteresis, self.flags
+
+        for i in range(count):
+            row_flags = flags[i]
+            if row_flags & FLAG_FORCE_OFF:
+                outcomes[i] = _CODE_OFF
+                reasons[i] = self.block_reasons.get(i)
+                continue
+            if row_flags & FLAG_NO_TEMP:
+                outcomes[i] = _CODE_SKIP
+                reasons[i] = "No temperature"
+                continue
+            outcome, reasons[i] = decide_heating(
+                current[i], target[i], hysteresis[i], bool(row_flags & FLAG_UNDERFLOOR)
+            )
+            outcomes[i] = _CODE_BY_OUTCOME[outcome]
+
+        return outcomes, reasons
+
+    @staticmethod
+    def outcome(code: int) -> str:
+        return _OUTCOME_CODES[code]
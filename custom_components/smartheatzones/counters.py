@@ -0,0 +1,185 @@
+"""
+SmartHeatZones - Control Loop Counters
+Version: 1.10.0
+
+NEW in v1.10.0:
+- In-memory event counters per zone and for the boiler (evaluations, relay
+  commands, boiler starts, piggyback activations, overheat trips, manual
+  overrides, drift corrections) for the current hour and the current day
+- An increment is O(1); a counter rolls over lazily once the hour / day end
+  it remembers has passed (one comparison per increment)
+- Changed counters are published to the diagnostic sensors at most every
+  COUNTER_PUBLISH_INTERVAL; an hourly tick publishes the rollover of idle ones
+- Timers stopped by shutdown() when the last entry unloads
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_change
+from homeassistant.util import dt as dt_util
+
+from .const import COUNTER_PUBLISH_INTERVAL, DATA_COUNTERS, DOMAIN, LOG_PREFIX
+
+_LOGGER = logging.getLogger(__name__)
+
+# Counted events
+COUNTER_EVALUATIONS = "evaluations"
+COUNTER_RELAY_COMMANDS = "relay_commands"
+COUNTER_BOILER_STARTS = "boiler_starts"
+COUNTER_PIGGYBACK_ACTIVATIONS = "piggyback_activations"
+COUNTER_OVERHEAT_TRIPS = "overheat_trips"
+COUNTER_MANUAL_OVERRIDES = "manual_overrides"
+COUNTER_DRIFT_CORRECTIONS = "drift_corrections"
+
+PERIOD_HOUR = "hour"
+PERIOD_DAY = "day"
+
+
+class RollingCounter:
+    """Eseményszámláló az aktuális órára és napra."""
+
+    __slots__ = ("hour", "day", "hour_ends", "day_ends")
+
+    def __init__(self):
+        self.hour = 0
+        self.day = 0
+        self.hour_ends = 0.0  # UTC timestamps of the current period ends
+        self.day_ends = 0.0
+
+    def add(self, now: float, count: int = 1):
+        if now >= self.hour_ends:
+            self.roll(now)
+        self.hour += count
+        self.day += count
+
+    def roll(self, now: float):
+        """Start a new hour (and day) if the current one has ended."""
+        if now < self.hour_ends:
+            return
+        moment = dt_util.as_local(dt_util.utc_from_timestamp(now))
+        self.hour = 0
+        self.hour_ends = (moment.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)).timestamp()
+        if now >= self.day_ends:
+            self.day = 0
+            self.day_ends = dt_util.start_of_local_day(moment.date() + timedelta(days=1)).timestamp()
+
+    def value(self, period: str, now: float) -> int:
+        self.roll(now)
+        return self.hour if period == PERIOD_HOUR else self.day
+
+
+class ControlCounters:
+    """
+    Zónák és a kazán eseményszámlálói.
+
+    Keys are zone names and STORE_KEY_BOILER, like the heating time tracker.
+    Sensors listen per key; notifications are batched by the publish timer.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._counters: dict[str, dict[str, RollingCounter]] = {}
+        self._listeners: dict[str, list[Callable[[], None]]] = {}
+        self._dirty: set[str] = set()
+        self._publish_unsub: Optional[CALLBACK_TYPE] = None
+        self._hourly_unsub: Optional[CALLBACK_TYPE] = None
+        self._start_hourly()
+
+    @callback
+    def _start_hourly(self):
+        if self._hourly_unsub is None:
+            self._hourly_unsub = async_track_time_change(self.hass, self._async_hourly, minute=0, second=0)
+
+    @callback
+    def shutdown(self):
+        """Last entry unloaded: stop the hourly tick and the pending publish."""
+        if self._hourly_unsub is not None:
+            self._hourly_unsub()
+            self._hourly_unsub = None
+        if self._publish_unsub is not None:
+            self._publish_unsub()
+            self._publish_unsub = None
+        self._dirty.clear()
+        _LOGGER.debug("%s Counters stopped", LOG_PREFIX)
+
+    @callback
+    def increment(self, key: str, counter: str, count: int = 1):
+        counters = self._counters.get(key)
+        if counters is None:
+            counters = self._counters[key] = {}
+        rolling = counters.get(counter)
+        if rolling is None:
+            rolling = counters[counter] = RollingCounter()
+        rolling.add(time.time(), count)
+
+        if key in self._listeners:
+            self._dirty.add(key)
+            if self._publish_unsub is None:
+                self._publish_unsub = async_call_later(self.hass, COUNTER_PUBLISH_INTERVAL, self._async_publish)
+
+    def remove_zone(self, key: str):
+        """Deleted zone: drop its counters."""
+        self._counters.pop(key, None)
+        self._dirty.discard(key)
+
+    def value(self, key: str, counter: str, period: str) -> int:
+        rolling = self._counters.get(key, {}).get(counter)
+        return rolling.value(period, time.time()) if rolling is not None else 0
+
+    @callback
+    def async_add_listener(self, key: str, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        listeners = self._listeners.setdefault(key, [])
+        listeners.append(update_callback)
+        # First sensor after shutdown(): publish the rollover again
+        self._start_hourly()
+
+        @callback
+        def remove_listener():
+            if update_callback in listeners:
+                listeners.remove(update_callback)
+            if not listeners:
+                self._listeners.pop(key, None)
+
+        return remove_listener
+
+    def _notify(self, key: str):
+        for update_callback in list(self._listeners.get(key, ())):
+            update_callback()
+
+    @callback
+    def _async_publish(self, _now: datetime):
+        self._publish_unsub = None
+        dirty, self._dirty = self._dirty, set()
+        for key in dirty:
+            self._notify(key)
+
+    @callback
+    def _async_hourly(self, now: datetime):
+        """New hour: every listened key re-reads its (rolled over) counters."""
+        for key in list(self._listeners):
+            self._notify(key)
+        _LOGGER.debug("%s Counters rolled over (%d keys listened)", LOG_PREFIX, len(self._listeners))
+
+    def as_dict(self) -> dict:
+        """{key: {counter: {"hour": n, "day": n}}} for the diagnostics download."""
+        now = time.time()
+        return {
+            key: {
+                counter: {PERIOD_HOUR: rolling.value(PERIOD_HOUR, now), PERIOD_DAY: rolling.value(PERIOD_DAY, now)}
+                for counter, rolling in sorted(counters.items())
+            }
+            for key, counters in sorted(self._counters.items())
+        }
+
+
+def get_counters(hass: HomeAssistant) -> ControlCounters:
+    """Shared counters object (created on first use)."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    counters = domain_data.get(DATA_COUNTERS)
+    if counters is None:
+        counters = domain_data[DATA_COUNTERS] = ControlCounters(hass)
+    return counters
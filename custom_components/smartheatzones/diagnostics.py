@@ -0,0 +1,63 @@
+"""
+SmartHeatZones - Diagnostics
+Version: 1.10.0
+
+NEW in v1.10.0:
+- Diagnostics download for both entry types
+- Zone entry: zone configuration, runtime state, latest control decisions and
+  the zone's latency histograms
+- Common settings entry: boiler state, dispatcher, every zone's runtime state
+  and the integration-wide latency histograms (sensor event → decision, zone
+  handler, switch / boiler service calls, piggyback fan-out) and the hourly /
+  daily control loop counters
+- Relay command queue statistics (depth, retries, failures)
+- Reconciliation sweep: drift corrections and the last correction (boiler state)
+"""
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_IS_COMMON_SETTINGS,
+    DATA_BOILER_MAIN,
+    DATA_DISPATCHER,
+    DOMAIN,
+    INTEGRATION_VERSION,
+)
+from .counters import get_counters
+from .metrics import get_metrics
+from .relay_queue import get_relay_queue
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Diagnosztikai adatok egy bejegyzéshez (zóna vagy közös beállítások)."""
+    domain_data = hass.data.get(DOMAIN, {})
+    boiler = domain_data.get(DATA_BOILER_MAIN)
+
+    diagnostics = {
+        "integration_version": INTEGRATION_VERSION,
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+    }
+
+    if not entry.data.get(CONF_IS_COMMON_SETTINGS):
+        zone = boiler.get_zone_entity(entry.title) if boiler else None
+        diagnostics["zone"] = zone.diagnostics() if zone else None
+        return diagnostics
+
+    dispatcher = domain_data.get(DATA_DISPATCHER)
+    diagnostics["boiler"] = boiler.get_boiler_state() if boiler else None
+    diagnostics["dispatcher"] = {
+        "entities": dispatcher.entity_count,
+        "listeners": dispatcher.listener_count,
+    } if dispatcher else None
+    diagnostics["zones"] = {
+        zone.name: zone.diagnostics() for zone in boiler.get_zone_entities()
+    } if boiler else {}
+    diagnostics["latency"] = get_metrics(hass).as_dict()
+    diagnostics["counters"] = get_counters(hass).as_dict()
+    diagnostics["relay_queue"] = get_relay_queue(hass).as_dict()
+    return diagnostics
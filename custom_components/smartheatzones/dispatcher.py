@@ -0,0 +1,219 @@
+"""
+SmartHeatZones - Event Dispatcher
+Version: 1.10.0
+
+NEW in v1.10.0:
+- Single integration-level state change dispatcher for all zones
+- One Home Assistant listener per entity_id, regardless of how many zones use it
+- Each state is parsed once and the parsed value is fanned out to the zones
+- Per-zone subscription counts and a purge of a zone's leftover subscriptions
+  (leak detection when a zone is removed / re-added)
+- Zone handler durations recorded in the control loop metrics; the fire time
+  of a temperature event is passed to the handlers (SENSOR_EVENT_FIRED) for
+  the sensor event → decision latency
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+from homeassistant.core import HomeAssistant, CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import LOG_PREFIX
+from .metrics import METRIC_ZONE_HANDLER, SENSOR_EVENT_FIRED, get_metrics
+
+_LOGGER = logging.getLogger(__name__)
+
+# Subscription kinds - determines how a state is parsed
+KIND_TEMPERATURE = "temperature"  # float, None if unavailable/invalid
+KIND_BINARY = "binary"  # True (on) / False (off), None if unavailable
+
+INVALID_STATES = ("unavailable", "unknown", "none")
+
+# handler(entity_id, new_value, old_value)
+ZoneHandler = Callable[[str, Any, Any], Awaitable[None]]
+
+
+def parse_temperature(state) -> Optional[float]:
+    """Parse a numeric sensor state."""
+    if state is None or state.state in INVALID_STATES:
+        return None
+    try:
+        return float(state.state)
+    except (ValueError, TypeError):
+        return None
+
+
+def parse_binary(state) -> Optional[bool]:
+    """Parse an on/off state (switch, binary_sensor)."""
+    if state is None:
+        return None
+    if state.state == "on":
+        return True
+    if state.state == "off":
+        return False
+    return None
+
+
+PARSERS = {
+    KIND_TEMPERATURE: parse_temperature,
+    KIND_BINARY: parse_binary,
+}
+
+
+class _Subscription:
+    """One zone handler subscribed to one entity."""
+
+    __slots__ = ("zone", "handler")
+
+    def __init__(self, zone: str, handler: ZoneHandler):
+        self.zone = zone
+        self.handler = handler
+
+
+class ZoneEventDispatcher:
+    """
+    Közös állapotváltozás-elosztó.
+
+    Feladata:
+      - entity_id-nként egyetlen HA listener
+      - entity → zónák index karbantartása
+      - állapot egyszeri feldolgozása, az érték szétosztása a zónáknak
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        # entity_id -> kind -> subscriptions
+        self._index: dict[str, dict[str, list[_Subscription]]] = {}
+        self._listeners: dict[str, CALLBACK_TYPE] = {}
+        self._metrics = get_metrics(hass)
+        _LOGGER.debug("%s Event dispatcher initialized", LOG_PREFIX)
+
+    @callback
+    def subscribe(self, entity_id: str, kind: str, zone: str, handler: ZoneHandler) -> CALLBACK_TYPE:
+        """Subscribe a zone handler to an entity. Returns the unsubscribe callable."""
+        if kind not in PARSERS:
+            raise ValueError(f"Unknown subscription kind: {kind}")
+
+        sub = _Subscription(zone, handler)
+        self._index.setdefault(entity_id, {}).setdefault(kind, []).append(sub)
+
+        if entity_id not in self._listeners:
+            self._listeners[entity_id] = async_track_state_change_event(
+                self.hass, [entity_id], self._state_changed
+            )
+            _LOGGER.debug("%s Dispatcher listening to %s", LOG_PREFIX, entity_id)
+
+        @callback
+        def _unsubscribe():
+            self._unsubscribe(entity_id, kind, sub)
+
+        return _unsubscribe
+
+    @callback
+    def _unsubscribe(self, entity_id: str, kind: str, sub: _Subscription):
+        """Remove a subscription; drop the HA listener with the last one."""
+        kinds = self._index.get(entity_id)
+        if not kinds or sub not in kinds.get(kind, ()):
+            return
+
+        kinds[kind].remove(sub)
+        if not kinds[kind]:
+            del kinds[kind]
+        if not kinds:
+            del self._index[entity_id]
+            unsub = self._listeners.pop(entity_id, None)
+            if unsub:
+                unsub()
+            _LOGGER.debug("%s Dispatcher stopped listening to %s", LOG_PREFIX, entity_id)
+
+    async def _state_changed(self, event):
+        """Parse the state once per kind and fan it out to the subscribed zones."""
+        entity_id = event.data.get("entity_id")
+        kinds = self._index.get(entity_id)
+        if not kinds:
+            return
+
+        new_state = event.data.get("new_state")
+        old_state = event.data.get("old_state")
+
+        calls = []
+        for kind, subs in kinds.items():
+            parser = PARSERS[kind]
+            new_value = parser(new_state)
+            old_value = parser(old_state)
+            calls.extend(
+                (sub, self._timed(sub, sub.handler(entity_id, new_value, old_value))) for sub in list(subs)
+            )
+
+        # Handler tasks inherit the event fire time (sensor event → decision latency)
+        token = SENSOR_EVENT_FIRED.set(event.time_fired_timestamp) if KIND_TEMPERATURE in kinds else None
+        try:
+            results = await asyncio.gather(*(call for _, call in calls), return_exceptions=True)
+        finally:
+            if token is not None:
+                SENSOR_EVENT_FIRED.reset(token)
+        for (sub, _), result in zip(calls, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "%s [%s] Event handler failed for %s: %s",
+                    LOG_PREFIX, sub.zone, entity_id, result
+                )
+
+    async def _timed(self, sub: _Subscription, call: Awaitable[None]):
+        """Run a zone handler and record its duration."""
+        started = self.hass.loop.time()
+        try:
+            await call
+        finally:
+            self._metrics.observe(METRIC_ZONE_HANDLER, (self.hass.loop.time() - started) * 1000, sub.zone)
+
+    # --------------------------------------------------------------------------
+    # Állapot lekérdezés
+    # --------------------------------------------------------------------------
+
+    def zones_for(self, entity_id: str) -> list[str]:
+        """Zones subscribed to an entity."""
+        return sorted({
+            sub.zone
+            for subs in self._index.get(entity_id, {}).values()
+            for sub in subs
+        })
+
+    def zone_subscription_count(self, zone: str) -> int:
+        """Subscriptions currently held by a zone."""
+        return sum(
+            1
+            for kinds in self._index.values()
+            for subs in kinds.values()
+            for sub in subs
+            if sub.zone == zone
+        )
+
+    @callback
+    def release_zone(self, zone: str) -> int:
+        """Drop every subscription of a zone (leaked handles). Returns the number dropped."""
+        leaked = [
+            (entity_id, kind, sub)
+            for entity_id, kinds in self._index.items()
+            for kind, subs in kinds.items()
+            for sub in subs
+            if sub.zone == zone
+        ]
+        for entity_id, kind, sub in leaked:
+            self._unsubscribe(entity_id, kind, sub)
+        return len(leaked)
+
+    @property
+    def entity_count(self) -> int:
+        """Entities with at least one zone subscription."""
+        return len(self._index)
+
+    @property
+    def listener_count(self) -> int:
+        """Number of Home Assistant listeners held by the dispatcher."""
+        return len(self._listeners)
+
+    def __repr__(self):
+        return f"<ZoneEventDispatcher entities={len(self._index)} listeners={len(self._listeners)}>"
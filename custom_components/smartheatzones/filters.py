@@ -0,0 +1,79 @@
+"""
+SmartHeatZones - Sensor Filters
+Version: 1.10.0
+
+NEW in v1.10.0:
+- Streaming filters for noisy zone sensors (radiator TRVs)
+- Exponential moving average: O(1) per reading
+- Rolling median over a fixed-size ring buffer: constant work per reading
+  (window is bounded by the options flow)
+"""
+
+from bisect import bisect_left, insort
+from typing import Optional
+
+from .const import SENSOR_FILTER_EMA, SENSOR_FILTER_MEDIAN
+
+
+class EmaFilter:
+    """Exponential moving average, alpha = 2 / (window + 1)."""
+
+    __slots__ = ("_alpha", "_value")
+
+    def __init__(self, window: int):
+        self._alpha = 2.0 / (max(1, window) + 1)
+        self._value: Optional[float] = None
+
+    def update(self, value: float) -> float:
+        if self._value is None:
+            self._value = value
+        else:
+            self._value += self._alpha * (value - self._value)
+        return self._value
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._value
+
+
+class MedianFilter:
+    """Rolling median over the last `window` readings."""
+
+    __slots__ = ("_ring", "_sorted", "_pos", "_window")
+
+    def __init__(self, window: int):
+        self._window = max(1, window)
+        self._ring: list[float] = []
+        self._sorted: list[float] = []
+        self._pos = 0
+
+    def update(self, value: float) -> float:
+        if len(self._ring) < self._window:
+            self._ring.append(value)
+        else:
+            # Overwrite the oldest slot, keep the sorted copy in sync
+            oldest = self._ring[self._pos]
+            del self._sorted[bisect_left(self._sorted, oldest)]
+            self._ring[self._pos] = value
+            self._pos = (self._pos + 1) % self._window
+        insort(self._sorted, value)
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        count = len(self._sorted)
+        if not count:
+            return None
+        mid = count // 2
+        if count % 2:
+            return self._sorted[mid]
+        return (self._sorted[mid - 1] + self._sorted[mid]) / 2
+
+
+def create_filter(filter_type: Optional[str], window: int):
+    """Filter instance for the zone options (None = raw readings)."""
+    if filter_type == SENSOR_FILTER_EMA:
+        return EmaFilter(int(window))
+    if filter_type == SENSOR_FILTER_MEDIAN:
+        return MedianFilter(int(window))
+    return None
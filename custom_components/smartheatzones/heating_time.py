@@ -0,0 +1,257 @@
+"""
+SmartHeatZones - Heating Time Accumulators
+Version: 1.10.0
+
+NEW in v1.10.0:
+- In-memory on-time totals (today / this week / this month) per zone and for
+  the boiler, updated on heating transitions - replaces recorder-backed
+  history_stats sensors
+- Periods roll over at local midnight / Monday / 1st of the month; an on
+  period spanning a boundary is split at the boundary
+- Persisted through the debounced ZoneDataStore ("heating_time")
+- Timers stopped by shutdown() when the last entry unloads
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change, async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+from .boiler_manager import BoilerManager
+from .const import STORE_KEY_BOILER, HEATING_TIME_REFRESH, LOG_PREFIX
+from .storage import ZoneDataStore
+
+_LOGGER = logging.getLogger(__name__)
+
+PERIOD_DAY = "day"
+PERIOD_WEEK = "week"
+PERIOD_MONTH = "month"
+PERIODS = (PERIOD_DAY, PERIOD_WEEK, PERIOD_MONTH)
+
+
+def _period_keys(moment: datetime) -> tuple[str, str, str]:
+    """(day, ISO week, month) keys of a local time."""
+    iso = moment.isocalendar()
+    return (
+        moment.date().isoformat(),
+        f"{iso[0]}-W{iso[1]:02d}",
+        f"{moment.year}-{moment.month:02d}",
+    )
+
+
+def _next_midnight(moment: datetime) -> datetime:
+    return dt_util.start_of_local_day(moment.date() + timedelta(days=1))
+
+
+class OnTimeAccumulator:
+    """
+    Bekapcsolt idő összesítő egy zónához vagy a kazánhoz.
+
+    Totals are seconds per period; `accounted_at` is the time up to which an
+    ongoing on period has been added to the totals.
+    """
+
+    __slots__ = ("on", "accounted_at", "totals", "keys")
+
+    def __init__(self):
+        self.on = False
+        self.accounted_at: Optional[float] = None  # UTC timestamp
+        self.totals = [0.0, 0.0, 0.0]
+        self.keys: Optional[tuple[str, str, str]] = None
+
+    def advance(self, now: datetime):
+        """Add on-time up to `now` and roll over finished periods."""
+        local_now = dt_util.as_local(now)
+        if self.on and self.accounted_at is not None:
+            start = dt_util.as_local(dt_util.utc_from_timestamp(self.accounted_at))
+            boundary = _next_midnight(start)
+            while boundary <= local_now:
+                # Split at midnight: the old period gets its part before rolling over
+                self._add((boundary - start).total_seconds())
+                self._roll(boundary)
+                start, boundary = boundary, _next_midnight(boundary)
+            self._add((local_now - start).total_seconds())
+        self._roll(local_now)
+        self.accounted_at = now.timestamp()
+
+    def set_on(self, on: bool, now: datetime) -> bool:
+        """Heating transition. Returns True if the state changed."""
+        self.advance(now)
+        if on == self.on:
+            return False
+        self.on = on
+        return True
+
+    def hours(self, period: str) -> float:
+        return self.totals[PERIODS.index(period)] / 3600
+
+    def _add(self, seconds: float):
+        if seconds > 0:
+            self.totals = [total + seconds for total in self.totals]
+
+    def _roll(self, local_moment: datetime):
+        keys = _period_keys(local_moment)
+        if self.keys is not None:
+            self.totals = [
+                total if key == old_key else 0.0
+                for total, key, old_key in zip(self.totals, keys, self.keys)
+            ]
+        self.keys = keys
+
+    def as_dict(self) -> dict:
+        return {
+            "on": self.on,
+            "accounted_at": self.accounted_at,
+            "totals": list(self.totals),
+            "keys": list(self.keys) if self.keys else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> "OnTimeAccumulator":
+        accumulator = cls()
+        if not data:
+            return accumulator
+        try:
+            accumulator.totals = [float(value) for value in data["totals"]][:3]
+            accumulator.keys = tuple(data["keys"]) if data.get("keys") else None
+            accumulator.accounted_at = data.get("accounted_at")
+        except (KeyError, TypeError, ValueError):
+            return cls()
+        # An on period open at shutdown ends where it was last accounted;
+        # the zone reports its real state again after the restart.
+        accumulator.on = False
+        return accumulator
+
+
+class HeatingTimeTracker:
+    """
+    Zónák és a kazán fűtési idejének nyilvántartása.
+
+    Zones report their transitions (set_on); the boiler is followed through
+    the BoilerManager listener. While anything is on, totals are refreshed
+    every HEATING_TIME_REFRESH so the duration sensors keep moving; a midnight
+    timer rolls over the periods of idle accumulators.
+    """
+
+    def __init__(self, hass: HomeAssistant, store: ZoneDataStore):
+        self.hass = hass
+        self._store = store
+        self._accumulators: dict[str, OnTimeAccumulator] = {}
+        self._listeners: dict[str, list[Callable[[], None]]] = {}
+        self._refresh_unsub: Optional[CALLBACK_TYPE] = None
+        self._midnight_unsub: Optional[CALLBACK_TYPE] = None
+        self._boiler_unsub: Optional[CALLBACK_TYPE] = None
+        self._start_midnight()
+
+    @callback
+    def _start_midnight(self):
+        if self._midnight_unsub is None:
+            self._midnight_unsub = async_track_time_change(
+                self.hass, self._async_midnight, hour=0, minute=0, second=0
+            )
+
+    @callback
+    def shutdown(self):
+        """Last entry unloaded: stop the midnight and refresh timers."""
+        if self._midnight_unsub is not None:
+            self._midnight_unsub()
+            self._midnight_unsub = None
+        if self._refresh_unsub is not None:
+            self._refresh_unsub()
+            self._refresh_unsub = None
+        _LOGGER.debug("%s Heating time tracker stopped", LOG_PREFIX)
+
+    def attach_boiler(self, boiler: BoilerManager):
+        """Follow the boiler state through the BoilerManager listener."""
+        if self._boiler_unsub is not None:
+            return
+
+        @callback
+        def _boiler_updated():
+            self.set_on(STORE_KEY_BOILER, boiler.boiler_on)
+
+        self._boiler_unsub = boiler.async_add_listener(_boiler_updated)
+
+    def _get(self, key: str) -> OnTimeAccumulator:
+        accumulator = self._accumulators.get(key)
+        if accumulator is None:
+            accumulator = OnTimeAccumulator.from_dict(self._store.get(key))
+            accumulator.advance(dt_util.utcnow())
+            self._accumulators[key] = accumulator
+        return accumulator
+
+    @callback
+    def set_on(self, key: str, on: bool):
+        """Heating transition of a zone (zone name) or the boiler."""
+        if self._get(key).set_on(on, dt_util.utcnow()):
+            self._save(key)
+            self._update_refresh_timer()
+            self._notify(key)
+
+    @callback
+    def remove_zone(self, key: str):
+        """Deleted zone: drop its totals (memory and store)."""
+        self._accumulators.pop(key, None)
+        self._store.remove(key)
+        self._update_refresh_timer()
+
+    def hours(self, key: str, period: str) -> float:
+        """Current total in hours (ongoing on time included at the last refresh)."""
+        return self._get(key).hours(period)
+
+    def is_on(self, key: str) -> bool:
+        return self._get(key).on
+
+    @callback
+    def async_add_listener(self, key: str, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        listeners = self._listeners.setdefault(key, [])
+        listeners.append(update_callback)
+        # First sensor after shutdown(): roll over at midnight again
+        self._start_midnight()
+
+        @callback
+        def remove_listener():
+            if update_callback in listeners:
+                listeners.remove(update_callback)
+
+        return remove_listener
+
+    def _notify(self, key: str):
+        for update_callback in list(self._listeners.get(key, ())):
+            update_callback()
+
+    def _save(self, key: str):
+        self._store.set(key, self._accumulators[key].as_dict())
+
+    def _update_refresh_timer(self):
+        """Periodic refresh only while something is heating."""
+        any_on = any(accumulator.on for accumulator in self._accumulators.values())
+        if any_on and self._refresh_unsub is None:
+            self._refresh_unsub = async_track_time_interval(
+                self.hass, self._async_refresh, timedelta(seconds=HEATING_TIME_REFRESH)
+            )
+        elif not any_on and self._refresh_unsub is not None:
+            self._refresh_unsub()
+            self._refresh_unsub = None
+
+    @callback
+    def _async_refresh(self, now: datetime):
+        for key, accumulator in self._accumulators.items():
+            if accumulator.on:
+                accumulator.advance(now)
+                self._save(key)
+                self._notify(key)
+
+    @callback
+    def _async_midnight(self, now: datetime):
+        """Roll over the periods of every accumulator (idle ones included)."""
+        for key, accumulator in self._accumulators.items():
+            before = accumulator.keys
+            accumulator.advance(now)
+            if accumulator.keys != before:
+                self._save(key)
+                self._notify(key)
+        _LOGGER.debug("%s Heating time periods rolled over (%d accumulators)", LOG_PREFIX, len(self._accumulators))
@@ -0,0 +1,123 @@
+"""
+SmartHeatZones - Control Loop Metrics
+Version: 1.10.0
+
+NEW in v1.10.0:
+- Fixed-bucket latency histograms (bucket bounds in METRICS_BUCKETS_MS):
+  recording is one bisect and three additions, no samples are kept
+- Integration-wide histograms with per-zone breakdown for sensor event →
+  decision latency, zone handler duration, switch / boiler service call
+  duration, piggyback fan-out duration and reconciliation sweep duration
+- Shown in the diagnostics download (diagnostics.py)
+"""
+
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Optional
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_METRICS, DOMAIN, METRICS_BUCKETS_MS
+
+# Metric names
+METRIC_EVENT_TO_DECISION = "sensor_event_to_decision"
+METRIC_ZONE_HANDLER = "zone_handler"
+METRIC_SWITCH_CALL = "switch_call"
+METRIC_BOILER_CALL = "boiler_call"
+METRIC_PIGGYBACK_FANOUT = "piggyback_fanout"
+METRIC_RECONCILE_SWEEP = "reconcile_sweep"
+
+# Fire time (UTC timestamp) of the sensor event being handled; set by the
+# dispatcher, inherited by the handler tasks it starts
+SENSOR_EVENT_FIRED: ContextVar[Optional[float]] = ContextVar("smartheatzones_sensor_event_fired", default=None)
+
+
+class LatencyHistogram:
+    """Késleltetés hisztogram (ms), fix vödör határokkal."""
+
+    __slots__ = ("bounds", "buckets", "count", "total", "max")
+
+    def __init__(self, bounds: tuple = METRICS_BUCKETS_MS):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)  # last bucket: above the highest bound
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, ms: float):
+        self.buckets[bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (capped at the observed max)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank and n:
+                return min(float(self.bounds[i]), round(self.max, 2)) if i < len(self.bounds) else round(self.max, 2)
+        return round(self.max, 2)
+
+    def as_dict(self) -> dict:
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 2) if self.count else None,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "max_ms": round(self.max, 2),
+            "buckets": {label: n for label, n in zip(labels, self.buckets) if n},
+        }
+
+
+class ControlLoopMetrics:
+    """
+    Integráció szintű mérőszámok.
+
+    Every observation goes to the integration-wide histogram of the metric
+    and, when a zone is given, to that zone's histogram as well.
+    """
+
+    def __init__(self):
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._zones: dict[str, dict[str, LatencyHistogram]] = {}
+
+    def observe(self, metric: str, ms: float, zone: Optional[str] = None):
+        histogram = self._histograms.get(metric)
+        if histogram is None:
+            histogram = self._histograms[metric] = LatencyHistogram()
+        histogram.observe(ms)
+
+        if zone is not None:
+            zone_histograms = self._zones.setdefault(zone, {})
+            histogram = zone_histograms.get(metric)
+            if histogram is None:
+                histogram = zone_histograms[metric] = LatencyHistogram()
+            histogram.observe(ms)
+
+    def remove_zone(self, zone: str):
+        self._zones.pop(zone, None)
+
+    def as_dict(self) -> dict:
+        return {metric: histogram.as_dict() for metric, histogram in sorted(self._histograms.items())}
+
+    def zone_as_dict(self, zone: str) -> dict:
+        return {
+            metric: histogram.as_dict()
+            for metric, histogram in sorted(self._zones.get(zone, {}).items())
+        }
+
+
+def get_metrics(hass: HomeAssistant) -> ControlLoopMetrics:
+    """Shared metrics object (created on first use)."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    metrics = domain_data.get(DATA_METRICS)
+    if metrics is None:
+        metrics = domain_data[DATA_METRICS] = ControlLoopMetrics()
+    return metrics
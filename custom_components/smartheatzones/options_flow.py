@@ -3,6 +3,13 @@ SmartHeatZones - Options Flow
 Version: 1.9.1 (HA 2025.10+)
 Author: forreggbor
 
+NEW in v1.10.0 (in development):
+- Piggyback concurrency field in common settings
+- Boiler coalesce window and minimum on/off time fields in common settings
+- Sensor deadband and minimum evaluation interval fields in zone options
+- Sensor filter type and window fields in zone options
+- Predictive pre-heat switch in zone options
+
 CHANGELOG v1.9.1 (BUGFIX)
 - Fixed: Removing the outdoor temperature sensor is not removed from settings
 
@@ -42,16 +49,34 @@ from .const import (
     CONF_OVERHEAT_PROTECTION,
     CONF_OUTDOOR_SENSOR,
     CONF_ADAPTIVE_HYSTERESIS,
+    CONF_PIGGYBACK_CONCURRENCY,
+    CONF_BOILER_COALESCE_WINDOW,
+    CONF_BOILER_MIN_ON_TIME,
+    CONF_BOILER_MIN_OFF_TIME,
     CONF_HEATING_MODE,
     CONF_THERMOSTAT_TYPE,
     CONF_TEMP_OFFSET,
+    CONF_SENSOR_DEADBAND,
+    CONF_MIN_EVAL_INTERVAL,
+    CONF_SENSOR_FILTER,
+    CONF_FILTER_WINDOW,
+    CONF_PREHEAT_ENABLED,
     CONF_IS_COMMON_SETTINGS,
     DEFAULT_HYSTERESIS,
     DEFAULT_OVERHEAT_TEMP,
     DEFAULT_ADAPTIVE_HYSTERESIS,
+    DEFAULT_PIGGYBACK_CONCURRENCY,
+    DEFAULT_BOILER_COALESCE_WINDOW,
+    DEFAULT_BOILER_MIN_ON_TIME,
+    DEFAULT_BOILER_MIN_OFF_TIME,
     DEFAULT_HEATING_MODE,
     DEFAULT_THERMOSTAT_TYPE,
     DEFAULT_TEMP_OFFSET,
+    DEFAULT_SENSOR_DEADBAND,
+    DEFAULT_MIN_EVAL_INTERVAL,
+    DEFAULT_SENSOR_FILTER,
+    DEFAULT_FILTER_WINDOW,
+    DEFAULT_PREHEAT_ENABLED,
     HEATING_MODES,
     THERMOSTAT_TYPES,
     DATA_COMMON_SETTINGS,
@@ -159,6 +184,45 @@ class SmartHeatZonesOptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_ADAPTIVE_HYSTERESIS,
                     default=self._data.get(CONF_ADAPTIVE_HYSTERESIS, DEFAULT_ADAPTIVE_HYSTERESIS)
                 ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_PIGGYBACK_CONCURRENCY,
+                    default=self._data.get(CONF_PIGGYBACK_CONCURRENCY, DEFAULT_PIGGYBACK_CONCURRENCY)
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1, max=32, step=1,
+                        mode="box"
+                    )
+                ),
+                vol.Optional(
+                    CONF_BOILER_COALESCE_WINDOW,
+                    default=self._data.get(CONF_BOILER_COALESCE_WINDOW, DEFAULT_BOILER_COALESCE_WINDOW)
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=120, step=1,
+                        unit_of_measurement="s",
+                        mode="box"
+                    )
+                ),
+                vol.Optional(
+                    CONF_BOILER_MIN_ON_TIME,
+                    default=self._data.get(CONF_BOILER_MIN_ON_TIME, DEFAULT_BOILER_MIN_ON_TIME)
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=1800, step=1,
+                        unit_of_measurement="s",
+                        mode="box"
+                    )
+                ),
+                vol.Optional(
+                    CONF_BOILER_MIN_OFF_TIME,
+                    default=self._data.get(CONF_BOILER_MIN_OFF_TIME, DEFAULT_BOILER_MIN_OFF_TIME)
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=1800, step=1,
+                        unit_of_measurement="s",
+                        mode="box"
+                    )
+                ),
             }
         )
 
@@ -262,6 +326,58 @@ class SmartHeatZonesOptionsFlowHandler(config_entries.OptionsFlow):
                     )
                 ),
 
+                # Sensor deadband / rate limit (NEW v1.10.0)
+                vol.Optional(
+                    CONF_SENSOR_DEADBAND,
+                    default=self._data.get(CONF_SENSOR_DEADBAND, DEFAULT_SENSOR_DEADBAND)
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0.0, max=1.0, step=0.01,
+                        unit_of_measurement="°C",
+                        mode="box"
+                    )
+                ),
+                vol.Optional(
+                    CONF_MIN_EVAL_INTERVAL,
+                    default=self._data.get(CONF_MIN_EVAL_INTERVAL, DEFAULT_MIN_EVAL_INTERVAL)
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=300, step=1,
+                        unit_of_measurement="s",
+                        mode="box"
+                    )
+                ),
+
+                # Sensor filter (NEW v1.10.0)
+                vol.Required(
+                    CONF_SENSOR_FILTER,
+                    default=self._data.get(CONF_SENSOR_FILTER, DEFAULT_SENSOR_FILTER)
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=[
+                            {"value": "none", "label": "Nincs szűrés"},
+                            {"value": "ema", "label": "Exponenciális mozgóátlag (EMA)"},
+                            {"value": "median", "label": "Mozgó medián"}
+                        ],
+                        mode="dropdown"
+                    )
+                ),
+                vol.Optional(
+                    CONF_FILTER_WINDOW,
+                    default=self._data.get(CONF_FILTER_WINDOW, DEFAULT_FILTER_WINDOW)
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=2, max=15, step=1,
+                        mode="box"
+                    )
+                ),
+
+                # Predictive pre-heat (NEW v1.10.0)
+                vol.Optional(
+                    CONF_PREHEAT_ENABLED,
+                    default=self._data.get(CONF_PREHEAT_ENABLED, DEFAULT_PREHEAT_ENABLED)
+                ): selector.BooleanSelector(),
+
                 # Zone sensor
                 vol.Optional(
                     CONF_SENSOR,
@@ -0,0 +1,171 @@
+"""
+SmartHeatZones - Outdoor Temperature Service
+Version: 1.10.0
+
+NEW in v1.10.0:
+- Single outdoor temperature holder owned by the integration
+- Adaptive hysteresis band (multiplier) computed once per outdoor update
+- Band pushed to all adaptive zones; only zones whose effective hysteresis
+  changed are re-evaluated
+- Band changes and outdoor jumps (OUTDOOR_JUMP_THRESHOLD) are evaluated in one
+  batched BoilerManager pass instead of zone by zone
+"""
+
+import logging
+from bisect import bisect_right
+from typing import Optional, TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, CALLBACK_TYPE
+
+from .const import (
+    ADAPTIVE_HYSTERESIS_MULTIPLIERS,
+    DATA_BOILER_MAIN,
+    DOMAIN,
+    OUTDOOR_JUMP_THRESHOLD,
+    LOG_PREFIX,
+)
+from .dispatcher import KIND_TEMPERATURE, ZoneEventDispatcher, parse_temperature
+
+if TYPE_CHECKING:
+    from .climate import SmartHeatZoneClimate
+
+_LOGGER = logging.getLogger(__name__)
+
+# Precomputed band table: thresholds ascending, one multiplier per band.
+# outdoor < thresholds[i] → multipliers[i]; above the last threshold → 1.0
+_BAND_THRESHOLDS = sorted(ADAPTIVE_HYSTERESIS_MULTIPLIERS)
+_BAND_MULTIPLIERS = [ADAPTIVE_HYSTERESIS_MULTIPLIERS[t] for t in _BAND_THRESHOLDS] + [1.0]
+
+
+def hysteresis_multiplier(outdoor_temp: Optional[float]) -> float:
+    """Adaptive hysteresis multiplier for an outdoor temperature."""
+    if outdoor_temp is None:
+        return 1.0
+    return _BAND_MULTIPLIERS[bisect_right(_BAND_THRESHOLDS, outdoor_temp)]
+
+
+class OutdoorTemperatureService:
+    """
+    Kültéri hőmérséklet szolgáltatás.
+
+    Feladata:
+      - kültéri szenzor egyszeri követése (dispatcheren keresztül)
+      - aktív hiszterézis sáv (szorzó) kiszámítása frissítésenként egyszer
+      - a sáv szétosztása az adaptív zónáknak
+    """
+
+    SUBSCRIBER = "outdoor_service"
+
+    def __init__(self, hass: HomeAssistant, dispatcher: ZoneEventDispatcher):
+        self.hass = hass
+        self._dispatcher = dispatcher
+        self._sensor_entity_id: Optional[str] = None
+        self._unsub: Optional[CALLBACK_TYPE] = None
+        self._temp: Optional[float] = None
+        self._multiplier = 1.0
+        self._evaluated_temp: Optional[float] = None  # outdoor temp at the last batched pass
+        self._zones: dict[str, "SmartHeatZoneClimate"] = {}
+
+    def configure(self, sensor_entity_id: Optional[str]):
+        """(Re)attach the outdoor sensor from common settings."""
+        if sensor_entity_id == self._sensor_entity_id:
+            return
+
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+
+        self._sensor_entity_id = sensor_entity_id
+        self._temp = None
+        self._evaluated_temp = None
+        self._multiplier = 1.0
+
+        if sensor_entity_id:
+            self._unsub = self._dispatcher.subscribe(
+                sensor_entity_id, KIND_TEMPERATURE, self.SUBSCRIBER, self._outdoor_changed
+            )
+            self._temp = parse_temperature(self.hass.states.get(sensor_entity_id))
+            self._evaluated_temp = self._temp
+            self._multiplier = hysteresis_multiplier(self._temp)
+            _LOGGER.info(
+                "%s Outdoor sensor attached: %s (%s°C, band ×%.1f)",
+                LOG_PREFIX, sensor_entity_id, self._temp, self._multiplier
+            )
+
+        for zone in self._zones.values():
+            zone.apply_outdoor_band(self._temp, self._multiplier)
+
+    # --------------------------------------------------------------------------
+    # Zóna regisztráció
+    # --------------------------------------------------------------------------
+
+    def register_zone(self, zone_name: str, entity: "SmartHeatZoneClimate"):
+        """Register an adaptive zone and push the current band to it."""
+        self._zones[zone_name] = entity
+        entity.apply_outdoor_band(self._temp, self._multiplier)
+
+    def unregister_zone(self, zone_name: str):
+        """Unregister a zone."""
+        self._zones.pop(zone_name, None)
+
+    # --------------------------------------------------------------------------
+    # Frissítés
+    # --------------------------------------------------------------------------
+
+    async def _outdoor_changed(self, entity_id: str, temp: Optional[float], old_temp: Optional[float]):
+        """Outdoor update: compute the band once, batch-evaluate the affected zones."""
+        if temp is None:
+            return
+
+        self._temp = temp
+        multiplier = hysteresis_multiplier(temp)
+        band_changed = multiplier != self._multiplier
+        self._multiplier = multiplier
+
+        woken = [
+            name for name, zone in self._zones.items()
+            if zone.apply_outdoor_band(temp, multiplier)
+        ]
+
+        jumped = (
+            self._evaluated_temp is not None
+            and abs(temp - self._evaluated_temp) > OUTDOOR_JUMP_THRESHOLD
+        )
+        if self._evaluated_temp is None:
+            self._evaluated_temp = temp
+
+        if band_changed:
+            _LOGGER.info(
+                "%s Outdoor %.1f°C → hysteresis band ×%.1f (%d zones affected)",
+                LOG_PREFIX, temp, multiplier, len(woken)
+            )
+
+        boiler_manager = self.hass.data.get(DOMAIN, {}).get(DATA_BOILER_MAIN)
+        if boiler_manager is None:
+            return
+
+        if jumped:
+            _LOGGER.info(
+                "%s Outdoor jump %.1f°C → %.1f°C - evaluating all adaptive zones",
+                LOG_PREFIX, self._evaluated_temp, temp
+            )
+            self._evaluated_temp = temp
+            await boiler_manager.async_evaluate_all("Outdoor temperature jump", list(self._zones))
+        elif woken:
+            self._evaluated_temp = temp
+            await boiler_manager.async_evaluate_all("Adaptive hysteresis band changed", woken)
+
+    # --------------------------------------------------------------------------
+    # Állapot lekérdezés
+    # --------------------------------------------------------------------------
+
+    @property
+    def temperature(self) -> Optional[float]:
+        return self._temp
+
+    @property
+    def multiplier(self) -> float:
+        return self._multiplier
+
+    def __repr__(self):
+        return f"<OutdoorTemperatureService sensor={self._sensor_entity_id} temp={self._temp} band=×{self._multiplier}>"
@@ -0,0 +1,116 @@
+"""
+SmartHeatZones - Predictive Pre-heat
+Version: 1.10.0
+
+NEW in v1.10.0:
+- Per-zone heat-up rate learned online from the zone's own heating periods
+- Incremental least squares: rate (°C/h) = a + b × outdoor temperature,
+  with exponential forgetting so the model follows the season
+- Lead time for the next schedule block derived from the predicted rate
+"""
+
+from typing import Optional
+
+from .const import (
+    PREHEAT_FORGET_FACTOR,
+    PREHEAT_MAX_LEAD_MINUTES,
+    PREHEAT_MIN_RISE,
+    PREHEAT_MIN_SAMPLES,
+    PREHEAT_MIN_SESSION,
+)
+
+
+class HeatRateModel:
+    """
+    Fűtési sebesség modell (°C/óra a kültéri hőmérséklet függvényében).
+
+    Only weighted sufficient statistics are kept, so an update is O(1) and the
+    state is a handful of floats (persisted as a dict).
+    """
+
+    __slots__ = ("n", "sx", "sy", "sxx", "sxy", "samples", "nx", "syx")
+
+    def __init__(self, n=0.0, sx=0.0, sy=0.0, sxx=0.0, sxy=0.0, samples=0, nx=None, syx=None):
+        self.n = n  # weighted sample count
+        self.sx = sx  # Σ outdoor
+        self.sy = sy  # Σ rate
+        self.sxx = sxx  # Σ outdoor²
+        self.sxy = sxy  # Σ outdoor × rate
+        self.samples = samples  # accepted samples (unweighted)
+        # Samples with an outdoor reading (the outdoor sums cover only these);
+        # models stored before the split counted every sample
+        self.nx = n if nx is None else nx  # weighted count
+        self.syx = sy if syx is None else syx  # Σ rate
+
+    def update(self, rate: float, outdoor: Optional[float]):
+        """Add one observed heat-up rate (older samples are discounted)."""
+        f = PREHEAT_FORGET_FACTOR
+        self.n = self.n * f + 1.0
+        self.sy = self.sy * f + rate
+        self.nx *= f
+        self.syx *= f
+        self.sx *= f
+        self.sxx *= f
+        self.sxy *= f
+        if outdoor is not None:
+            # No outdoor reading: the sample only counts towards the mean rate
+            self.nx += 1.0
+            self.syx += rate
+            self.sx += outdoor
+            self.sxx += outdoor * outdoor
+            self.sxy += outdoor * rate
+        self.samples += 1
+
+    def predict(self, outdoor: Optional[float]) -> Optional[float]:
+        """Predicted heat-up rate (°C/h), None until enough samples were seen."""
+        if self.samples < PREHEAT_MIN_SAMPLES or self.n <= 0:
+            return None
+
+        rate = self.sy / self.n
+        if outdoor is not None and self.nx > 0:
+            mean_outdoor = self.sx / self.nx
+            variance = self.sxx / self.nx - mean_outdoor ** 2
+            # Outdoor spread too small for a slope - keep the mean rate
+            if variance >= 1.0:
+                mean_rate = self.syx / self.nx
+                slope = (self.sxy / self.nx - mean_outdoor * mean_rate) / variance
+                rate = mean_rate + slope * (outdoor - mean_outdoor)
+
+        return rate if rate > 0 else None
+
+    def lead_minutes(self, rise: float, outdoor: Optional[float]) -> Optional[float]:
+        """Minutes needed to raise the zone by `rise` °C (capped), None if unknown."""
+        if rise <= 0:
+            return 0.0
+        rate = self.predict(outdoor)
+        if rate is None:
+            return None
+        return min(rise / rate * 60, PREHEAT_MAX_LEAD_MINUTES)
+
+    def as_dict(self) -> dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> "HeatRateModel":
+        if not data:
+            return cls()
+        return cls(**{slot: data[slot] for slot in cls.__slots__ if slot in data})
+
+
+class HeatingSession:
+    """One relay-on period being observed."""
+
+    __slots__ = ("started_at", "start_temp", "start_outdoor")
+
+    def __init__(self, started_at: float, start_temp: float, start_outdoor: Optional[float]):
+        self.started_at = started_at
+        self.start_temp = start_temp
+        self.start_outdoor = start_outdoor
+
+    def rate(self, ended_at: float, end_temp: float) -> Optional[float]:
+        """Observed °C/h, None if the period is too short or the rise too small."""
+        duration = ended_at - self.started_at
+        rise = end_temp - self.start_temp
+        if duration < PREHEAT_MIN_SESSION or rise < PREHEAT_MIN_RISE:
+            return None
+        return rise / (duration / 3600)
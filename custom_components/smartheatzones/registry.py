@@ -0,0 +1,102 @@
+"""
+SmartHeatZones - Subscription Registry
+Version: 1.10.0
+
+NEW in v1.10.0:
+- Per-zone registry of every listener, timer and service registration the
+  zone holds, keyed by purpose - re-registering a key releases the old handle
+  first, so a handle can never be orphaned
+- Everything is released together when the zone is removed
+- Live counts per category (zone diagnostics) make leaks visible
+"""
+
+import logging
+from collections import Counter
+from typing import Hashable
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .const import LOG_PREFIX
+
+_LOGGER = logging.getLogger(__name__)
+
+# Handle categories
+CATEGORY_STATE = "state"  # dispatcher state subscriptions
+CATEGORY_TIMER = "timer"  # point-in-time / call-later timers
+CATEGORY_SERVICE = "service"  # registrations with shared services (boiler, outdoor)
+
+
+class SubscriptionRegistry:
+    """
+    Egy zóna összes feliratkozásának és időzítőjének nyilvántartása.
+
+    Handles are release callables (the unsubscribe / cancel callable HA
+    returns). A timer that fired on its own is dropped with `forget`.
+    """
+
+    def __init__(self, owner: str):
+        self._owner = owner
+        self._handles: dict[tuple[str, Hashable], CALLBACK_TYPE] = {}
+        self._released = 0
+
+    @callback
+    def track(self, category: str, key: Hashable, release: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Register a handle; an existing handle under the same key is released first."""
+        previous = self._handles.pop((category, key), None)
+        if previous is not None:
+            _LOGGER.debug("%s [%s] Replacing %s handle %s", LOG_PREFIX, self._owner, category, key)
+            previous()
+            self._released += 1
+        self._handles[(category, key)] = release
+        return release
+
+    @callback
+    def release(self, category: str, key: Hashable) -> bool:
+        """Release one handle. Returns True if it was registered."""
+        release = self._handles.pop((category, key), None)
+        if release is None:
+            return False
+        release()
+        self._released += 1
+        return True
+
+    @callback
+    def forget(self, category: str, key: Hashable):
+        """Drop a handle that is already spent (fired timer) without calling it."""
+        self._handles.pop((category, key), None)
+
+    def active(self, category: str, key: Hashable) -> bool:
+        return (category, key) in self._handles
+
+    @callback
+    def release_all(self) -> int:
+        """Release every handle (zone removal). Returns the number released."""
+        handles = list(self._handles.items())
+        self._handles.clear()
+        for (category, key), release in handles:
+            try:
+                release()
+            except Exception as e:
+                _LOGGER.warning(
+                    "%s [%s] Releasing %s handle %s failed: %s", LOG_PREFIX, self._owner, category, key, e
+                )
+        self._released += len(handles)
+        return len(handles)
+
+    def count(self, category: str) -> int:
+        return sum(1 for handle_category, _ in self._handles if handle_category == category)
+
+    def counts(self) -> dict[str, int]:
+        """Live handles per category."""
+        return dict(Counter(category for category, _ in self._handles))
+
+    @property
+    def released(self) -> int:
+        """Handles released so far (replacements included)."""
+        return self._released
+
+    def __len__(self):
+        return len(self._handles)
+
+    def __repr__(self):
+        return f"<SubscriptionRegistry {self._owner} {self.counts()}>"
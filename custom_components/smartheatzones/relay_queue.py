@@ -0,0 +1,302 @@
+"""
+SmartHeatZones - Relay Command Queue
+Version: 1.10.0
+
+NEW in v1.10.0:
+- Every relay command goes through one integration-wide queue, serialized
+  per relay; a command still waiting for its relay is dropped when a newer
+  one arrives (latest command wins)
+- Commands whose target already matches the relay state are skipped
+- A command counts as done only when the relay reports the target state
+  (state event / state machine) within RELAY_CONFIRM_TIMEOUT; unconfirmed
+  relays are retried with exponential backoff (RELAY_COMMAND_ATTEMPTS,
+  RELAY_RETRY_BACKOFF); a command holds its relays for at most
+  RELAY_COMMAND_TIMEOUT
+- Relays of one request are switched with a single service call per attempt
+- Queue depth, retries and failures are reported (diagnostics)
+- State subscriptions released by shutdown() when the last entry unloads
+"""
+
+import asyncio
+import logging
+from typing import Iterable, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import (
+    DATA_DISPATCHER,
+    DATA_RELAY_QUEUE,
+    DOMAIN,
+    LOG_PREFIX,
+    RELAY_COMMAND_ATTEMPTS,
+    RELAY_COMMAND_TIMEOUT,
+    RELAY_CONFIRM_TIMEOUT,
+    RELAY_RETRY_BACKOFF,
+    SWITCH_CALL_TIMEOUT,
+)
+from .counters import COUNTER_RELAY_COMMANDS, get_counters
+from .dispatcher import KIND_BINARY, parse_binary
+from .metrics import METRIC_SWITCH_CALL, get_metrics
+
+_LOGGER = logging.getLogger(__name__)
+
+# Command results
+RELAY_CONFIRMED = "confirmed"  # relay reported the target state
+RELAY_SKIPPED = "skipped"  # relay was already in the target state
+RELAY_SUPERSEDED = "superseded"  # a newer command for the relay took over
+RELAY_FAILED = "failed"  # not confirmed after every attempt / within RELAY_COMMAND_TIMEOUT
+
+# Dispatcher subscriber name of the queue
+QUEUE_SUBSCRIBER = "relay_queue"
+
+
+class _Relay:
+    """Per-relay queue state."""
+
+    __slots__ = ("generation", "lock", "pending", "expected", "confirmation", "failures")
+
+    def __init__(self):
+        self.generation = 0  # bumped by every command; older commands yield to the newest
+        self.lock = asyncio.Lock()
+        self.pending = 0  # commands queued or in flight
+        self.expected: Optional[bool] = None
+        self.confirmation: Optional[asyncio.Future] = None
+        self.failures = 0
+
+
+class RelayCommandQueue:
+    """
+    Relé parancssor: relénként sorosított, megerősített, újrapróbált parancsok.
+
+    Callers get a result per relay: CONFIRMED / SKIPPED - the relay is in the
+    commanded state; FAILED - it is not; SUPERSEDED - the command was dropped
+    for a newer one, whose outcome decides the relay state.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._relays: dict[str, _Relay] = {}
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}  # dispatcher subscriptions per relay
+        self._metrics = get_metrics(hass)
+        self._counters = get_counters(hass)
+        self._depth = 0
+        self._max_depth = 0
+        self._stats = {
+            "requests": 0,
+            "service_calls": 0,
+            "confirmed": 0,
+            "skipped": 0,
+            "superseded": 0,
+            "retries": 0,
+            "failures": 0,
+        }
+        self._last_failed: list[str] = []
+
+    def _relay(self, entity_id: str) -> _Relay:
+        relay = self._relays.get(entity_id)
+        if relay is None:
+            relay = self._relays[entity_id] = _Relay()
+        if entity_id not in self._unsubs:
+            # State events confirm the commands (one subscription per relay, kept until shutdown)
+            self._unsubs[entity_id] = self.hass.data[DOMAIN][DATA_DISPATCHER].subscribe(
+                entity_id, KIND_BINARY, QUEUE_SUBSCRIBER, self._relay_changed
+            )
+        return relay
+
+    @callback
+    def shutdown(self):
+        """Last entry unloaded: release the state subscriptions of the relays."""
+        for unsub in self._unsubs.values():
+            unsub()
+        released = len(self._unsubs)
+        self._unsubs.clear()
+        self._relays = {entity_id: relay for entity_id, relay in self._relays.items() if relay.pending}
+        _LOGGER.debug("%s Relay queue stopped (%d subscriptions released)", LOG_PREFIX, released)
+
+    async def _relay_changed(self, entity_id: str, is_on: Optional[bool], was_on: Optional[bool]):
+        relay = self._relays.get(entity_id)
+        if relay is not None and relay.confirmation is not None and is_on == relay.expected:
+            if not relay.confirmation.done():
+                relay.confirmation.set_result(True)
+
+    def is_pending(self, entity_ids: Iterable[str]) -> bool:
+        """True while a command for any of the relays is queued or in flight."""
+        for entity_id in entity_ids:
+            relay = self._relays.get(entity_id)
+            if relay is not None and relay.pending:
+                return True
+        return False
+
+    def _is_on(self, entity_id: str) -> Optional[bool]:
+        return parse_binary(self.hass.states.get(entity_id))
+
+    async def async_switch(self, entity_ids: Iterable[str], on: bool, zone: Optional[str] = None) -> dict[str, str]:
+        """
+        Switch relays on/off and wait for the outcome.
+
+        Returns {entity_id: result}. Relays are locked in sorted order, so
+        overlapping requests cannot deadlock; each lock is released as soon as
+        its relay is settled.
+        """
+        entity_ids = sorted(set(entity_ids))
+        if not entity_ids:
+            return {}
+
+        relays = {entity_id: self._relay(entity_id) for entity_id in entity_ids}
+        generations = {}
+        for entity_id, relay in relays.items():
+            relay.generation += 1
+            relay.pending += 1
+            generations[entity_id] = relay.generation
+        self._stats["requests"] += 1
+        self._depth += len(relays)
+        self._max_depth = max(self._max_depth, self._depth)
+
+        results: dict[str, str] = {}
+        locked: list[str] = []
+
+        def settle(entity_id: str, result: str):
+            results[entity_id] = result
+            self._stats[result if result != RELAY_FAILED else "failures"] += 1
+            if entity_id in locked:
+                locked.remove(entity_id)
+                relays[entity_id].lock.release()
+
+        try:
+            for entity_id in entity_ids:
+                await relays[entity_id].lock.acquire()
+                locked.append(entity_id)
+            deadline = self.hass.loop.time() + RELAY_COMMAND_TIMEOUT
+
+            # Latest command wins; a relay already in the target state is left alone
+            active = []
+            for entity_id in entity_ids:
+                if relays[entity_id].generation != generations[entity_id]:
+                    settle(entity_id, RELAY_SUPERSEDED)
+                elif self._is_on(entity_id) == on:
+                    settle(entity_id, RELAY_SKIPPED)
+                else:
+                    active.append(entity_id)
+
+            attempt = 0
+            while active:
+                confirmed = await self._attempt(active, relays, on, zone, deadline)
+                for entity_id in [entity_id for entity_id in active if entity_id in confirmed]:
+                    active.remove(entity_id)
+                    relays[entity_id].failures = 0
+                    settle(entity_id, RELAY_CONFIRMED)
+                if not active:
+                    break
+
+                attempt += 1
+                backoff = RELAY_RETRY_BACKOFF * 2 ** (attempt - 1)
+                if attempt >= RELAY_COMMAND_ATTEMPTS or self.hass.loop.time() + backoff >= deadline:
+                    for entity_id in active:
+                        relays[entity_id].failures += 1
+                        settle(entity_id, RELAY_FAILED)
+                    self._last_failed = list(active)
+                    _LOGGER.warning(
+                        "%s [%s] switch.%s not confirmed after %d attempts: %s",
+                        LOG_PREFIX, zone or "batch", "turn_on" if on else "turn_off",
+                        attempt, ", ".join(active)
+                    )
+                    break
+
+                self._stats["retries"] += 1
+                _LOGGER.debug(
+                    "%s [%s] %d relays not confirmed - retry %d in %.1fs",
+                    LOG_PREFIX, zone or "batch", len(active), attempt, backoff
+                )
+                await asyncio.sleep(backoff)
+                for entity_id in [e for e in active if relays[e].generation != generations[e]]:
+                    active.remove(entity_id)
+                    settle(entity_id, RELAY_SUPERSEDED)
+        finally:
+            for entity_id in locked:
+                relays[entity_id].lock.release()
+            for relay in relays.values():
+                relay.pending -= 1
+            self._depth -= len(relays)
+
+        return results
+
+    async def _attempt(
+        self, active: list[str], relays: dict[str, _Relay], on: bool, zone: Optional[str], deadline: float
+    ) -> set[str]:
+        """
+        One service call for the active relays, then wait for their state events.
+
+        Both waits are cut short at the command deadline.
+
+        Returns the confirmed relays. A relay is confirmed by its state event
+        (so every subscriber has seen it before the command completes); the
+        state machine is the fallback when the event was missed.
+        """
+        loop = self.hass.loop
+        for entity_id in active:
+            relay = relays[entity_id]
+            relay.expected = on
+            relay.confirmation = loop.create_future()
+
+        self._stats["service_calls"] += 1
+        if zone is not None:
+            self._counters.increment(zone, COUNTER_RELAY_COMMANDS, len(active))
+        started = loop.time()
+        call_timeout = min(SWITCH_CALL_TIMEOUT, max(deadline - started, 0))
+        sent = False
+        try:
+            async with asyncio.timeout(call_timeout):
+                await self.hass.services.async_call(
+                    "switch", "turn_on" if on else "turn_off", {"entity_id": list(active)}, blocking=True
+                )
+            sent = True
+        except TimeoutError:
+            _LOGGER.warning(
+                "%s [%s] Relay control timed out after %.0fs: %s",
+                LOG_PREFIX, zone or "batch", call_timeout, ", ".join(active)
+            )
+        except Exception as e:
+            _LOGGER.warning("%s [%s] Failed relay control %s: %s", LOG_PREFIX, zone or "batch", ", ".join(active), e)
+        finally:
+            self._metrics.observe(METRIC_SWITCH_CALL, (loop.time() - started) * 1000, zone)
+
+        try:
+            confirm_timeout = min(RELAY_CONFIRM_TIMEOUT, deadline - loop.time())
+            if sent and confirm_timeout > 0:
+                await asyncio.wait(
+                    [relays[entity_id].confirmation for entity_id in active], timeout=confirm_timeout
+                )
+            return {
+                entity_id for entity_id in active
+                if relays[entity_id].confirmation.done() or self._is_on(entity_id) == on
+            }
+        finally:
+            for entity_id in active:
+                relay = relays[entity_id]
+                relay.expected = None
+                relay.confirmation = None
+
+    @property
+    def depth(self) -> int:
+        """Relay commands queued or in flight."""
+        return self._depth
+
+    def as_dict(self) -> dict:
+        return {
+            "depth": self._depth,
+            "max_depth": self._max_depth,
+            **self._stats,
+            "last_failed": list(self._last_failed),
+            "failing_relays": {
+                entity_id: relay.failures for entity_id, relay in sorted(self._relays.items()) if relay.failures
+            },
+        }
+
+
+def get_relay_queue(hass: HomeAssistant) -> RelayCommandQueue:
+    """Shared relay command queue (created on first use)."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    queue = domain_data.get(DATA_RELAY_QUEUE)
+    if queue is None:
+        queue = domain_data[DATA_RELAY_QUEUE] = RelayCommandQueue(hass)
+    return queue
@@ -0,0 +1,113 @@
+"""
+SmartHeatZones - Compiled Schedule
+Version: 1.10.0
+
+NEW in v1.10.0:
+- Schedule blocks are parsed once per configuration into a minutes-of-day table
+- Midnight-wrapping blocks (e.g. 22:00 → 06:00) handled at compile time
+- O(1) active block lookup, next transition via bisect on precomputed minutes
+"""
+
+from bisect import bisect_right
+from datetime import datetime
+from typing import Optional
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def _parse_minute_of_day(value) -> int:
+    """'HH:MM[:SS]' → minute of day."""
+    parsed = datetime.strptime(str(value)[:5], "%H:%M")
+    return parsed.hour * 60 + parsed.minute
+
+
+class ScheduleBlock:
+    """One validated schedule block."""
+
+    __slots__ = ("label", "temp", "start", "end")
+
+    def __init__(self, label: str, temp: float, start: int, end: int):
+        self.label = label
+        self.temp = temp
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return f"<ScheduleBlock {self.label} {self.start // 60:02d}:{self.start % 60:02d}-{self.end // 60:02d}:{self.end % 60:02d} {self.temp}°C>"
+
+
+class CompiledSchedule:
+    """
+    Napi ütemezés előfordított formában.
+
+    Every minute of the day points at the block active in that minute (the first
+    matching block wins, like the original block-by-block scan). Transition
+    minutes - where the active block changes - are precomputed for timers.
+    """
+
+    __slots__ = ("blocks", "errors", "_slots", "_transitions")
+
+    def __init__(self, schedule: list):
+        self.blocks: list[ScheduleBlock] = []
+        self.errors: list[str] = []
+        slots: list[Optional[int]] = [None] * MINUTES_PER_DAY
+
+        for raw in schedule or []:
+            try:
+                start = _parse_minute_of_day(raw["start"])
+                end = _parse_minute_of_day(raw["end"])
+                block = ScheduleBlock(raw.get("label", "Period"), float(raw["temp"]), start, end)
+            except (KeyError, ValueError, TypeError, AttributeError) as e:
+                self.errors.append(f"{raw}: {e}")
+                continue
+
+            index = len(self.blocks)
+            self.blocks.append(block)
+
+            if start <= end:
+                minutes = range(start, end)
+            else:
+                # Wraps midnight
+                minutes = list(range(start, MINUTES_PER_DAY)) + list(range(0, end))
+
+            for minute in minutes:
+                if slots[minute] is None:
+                    slots[minute] = index
+
+        self._slots = slots
+        # slots[-1] is the last minute of the previous day → circular comparison
+        self._transitions = [
+            minute for minute in range(MINUTES_PER_DAY)
+            if slots[minute] != slots[minute - 1]
+        ]
+
+    def __bool__(self) -> bool:
+        return bool(self.blocks)
+
+    def block_at(self, minute_of_day: int) -> Optional[ScheduleBlock]:
+        """Active block at the given minute of day (None if no block covers it)."""
+        index = self._slots[minute_of_day % MINUTES_PER_DAY]
+        return None if index is None else self.blocks[index]
+
+    def next_transition(self, minute_of_day: int) -> Optional[int]:
+        """
+        Minute of day of the next block change strictly after `minute_of_day`.
+
+        Returns None if the active block never changes (empty or all-day schedule).
+        """
+        if not self._transitions:
+            return None
+        pos = bisect_right(self._transitions, minute_of_day)
+        if pos < len(self._transitions):
+            return self._transitions[pos]
+        return self._transitions[0]
+
+    def minutes_until_next_transition(self, minute_of_day: int) -> Optional[int]:
+        """Minutes from `minute_of_day` to the next block change (1..1440)."""
+        nxt = self.next_transition(minute_of_day)
+        if nxt is None:
+            return None
+        return (nxt - minute_of_day - 1) % MINUTES_PER_DAY + 1
+
+    def __repr__(self):
+        return f"<CompiledSchedule blocks={len(self.blocks)} transitions={len(self._transitions)}>"
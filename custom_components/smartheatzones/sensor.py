@@ -0,0 +1,276 @@
+"""
+SmartHeatZones - System Sensors
+Version: 1.10.0
+
+NEW in v1.10.0:
+- Sensor platform on the common settings entry
+- Active zone count (with heating zone list), boiler status and boiler on-since
+  published straight from the BoilerManager
+- Push updates only: the BoilerManager calls back when a zone's heating state
+  or the boiler state flips - no template re-rendering, no hard-coded zone lists
+- Heating time duration sensors (today / this week / this month) per zone and
+  for the boiler, read from the in-memory HeatingTimeTracker instead of
+  recorder-backed history_stats queries
+- Diagnostic counter sensors (this hour / today) per zone and for the boiler,
+  read from the in-memory ControlCounters; hourly ones disabled by default
+- Drift correction counters (reconciliation sweep) per zone and for the boiler
+"""
+
+import logging
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .boiler_manager import BoilerManager
+from .const import (
+    CONF_IS_COMMON_SETTINGS,
+    DATA_BOILER_MAIN,
+    DATA_HEATING_TIME,
+    DOMAIN,
+    STORE_KEY_BOILER,
+    LOG_PREFIX,
+)
+from .counters import (
+    COUNTER_BOILER_STARTS,
+    COUNTER_DRIFT_CORRECTIONS,
+    COUNTER_EVALUATIONS,
+    COUNTER_MANUAL_OVERRIDES,
+    COUNTER_OVERHEAT_TRIPS,
+    COUNTER_PIGGYBACK_ACTIVATIONS,
+    COUNTER_RELAY_COMMANDS,
+    PERIOD_HOUR,
+    ControlCounters,
+    get_counters,
+)
+from .counters import PERIOD_DAY as COUNTER_PERIOD_DAY
+from .heating_time import PERIOD_DAY, PERIOD_MONTH, PERIOD_WEEK, HeatingTimeTracker
+
+_LOGGER = logging.getLogger(__name__)
+
+BOILER_STATE_ON = "on"
+BOILER_STATE_OFF = "off"
+
+# period → (name suffix, unique id suffix)
+HEATING_TIME_PERIODS = {
+    PERIOD_DAY: ("Today", "today"),
+    PERIOD_WEEK: ("This Week", "this_week"),
+    PERIOD_MONTH: ("This Month", "this_month"),
+}
+
+# counter period → (name suffix, unique id suffix)
+COUNTER_PERIODS = {
+    PERIOD_HOUR: ("This Hour", "this_hour"),
+    COUNTER_PERIOD_DAY: ("Today", "today"),
+}
+
+# counter → (name, icon)
+ZONE_COUNTERS = {
+    COUNTER_EVALUATIONS: ("Evaluations", "mdi:calculator-variant"),
+    COUNTER_RELAY_COMMANDS: ("Relay Commands", "mdi:electric-switch"),
+    COUNTER_PIGGYBACK_ACTIVATIONS: ("Piggyback Activations", "mdi:fire-alert"),
+    COUNTER_OVERHEAT_TRIPS: ("Overheat Trips", "mdi:thermometer-alert"),
+    COUNTER_MANUAL_OVERRIDES: ("Manual Overrides", "mdi:hand-back-right"),
+    COUNTER_DRIFT_CORRECTIONS: ("Drift Corrections", "mdi:sync-alert"),
+}
+BOILER_COUNTERS = {
+    COUNTER_BOILER_STARTS: ("Starts", "mdi:fire"),
+    COUNTER_PIGGYBACK_ACTIVATIONS: ("Piggyback Activations", "mdi:fire-alert"),
+    COUNTER_DRIFT_CORRECTIONS: ("Drift Corrections", "mdi:sync-alert"),
+}
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
+    """Szenzorok létrehozása: rendszer szenzorok (közös beállítások) vagy zóna fűtési idő."""
+    tracker: HeatingTimeTracker = hass.data[DOMAIN][DATA_HEATING_TIME]
+    counters = get_counters(hass)
+
+    if not entry.data.get(CONF_IS_COMMON_SETTINGS):
+        # Zone entry: heating time sensors (entity ids match the former
+        # history_stats helpers, e.g. sensor.living_room_heating_time_today)
+        zone = entry.title
+        zone_id = zone.lower().replace(' ', '_')
+        async_add_entities([
+            HeatingTimeSensor(
+                tracker, zone, period,
+                f"{zone} Heating Time {suffix}",
+                f"{DOMAIN}_{zone_id}_heating_time_{key}",
+            )
+            for period, (suffix, key) in HEATING_TIME_PERIODS.items()
+        ] + [
+            ControlCounterSensor(
+                counters, zone, counter, period, icon,
+                f"{zone} {label} {suffix}",
+                f"{DOMAIN}_{zone_id}_{counter}_{key}",
+            )
+            for counter, (label, icon) in ZONE_COUNTERS.items()
+            for period, (suffix, key) in COUNTER_PERIODS.items()
+        ])
+        return
+
+    boiler: BoilerManager = hass.data[DOMAIN][DATA_BOILER_MAIN]
+    async_add_entities([
+        ActiveZonesSensor(boiler),
+        BoilerStatusSensor(boiler),
+        BoilerOnSinceSensor(boiler),
+    ] + [
+        HeatingTimeSensor(
+            tracker, STORE_KEY_BOILER, period,
+            f"Boiler Runtime {suffix}",
+            f"{DOMAIN}_boiler_runtime_{key}",
+        )
+        for period, (suffix, key) in HEATING_TIME_PERIODS.items()
+    ] + [
+        ControlCounterSensor(
+            counters, STORE_KEY_BOILER, counter, period, icon,
+            f"Boiler {label} {suffix}",
+            f"{DOMAIN}_boiler_{counter}_{key}",
+        )
+        for counter, (label, icon) in BOILER_COUNTERS.items()
+        for period, (suffix, key) in COUNTER_PERIODS.items()
+    ])
+    _LOGGER.info("%s System sensors created", LOG_PREFIX)
+
+
+class SmartHeatZonesSystemSensor(SensorEntity):
+    """Base: state comes from the BoilerManager, written on its callbacks."""
+
+    _attr_should_poll = False
+    _key = ""
+
+    def __init__(self, boiler: BoilerManager):
+        self._boiler = boiler
+        self._attr_unique_id = f"{DOMAIN}_{self._key}"
+
+    async def async_added_to_hass(self):
+        self.async_on_remove(self._boiler.async_add_listener(self._boiler_updated))
+
+    @callback
+    def _boiler_updated(self):
+        self.async_write_ha_state()
+
+
+class ActiveZonesSensor(SmartHeatZonesSystemSensor):
+    """Number of zones currently heating."""
+
+    _key = "active_zones_count"
+    _attr_name = "SmartHeatZones Active Zones Count"
+    _attr_icon = "mdi:radiator"
+    _attr_native_unit_of_measurement = "zones"
+
+    @property
+    def native_value(self) -> int:
+        return len(self._boiler.get_active_zones())
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        return {
+            "total_zones": self._boiler.get_zone_count(),
+            "heating_zones": sorted(self._boiler.get_active_zones()),
+        }
+
+
+class BoilerStatusSensor(SmartHeatZonesSystemSensor):
+    """Commanded boiler state."""
+
+    _key = "boiler_status"
+    _attr_name = "SmartHeatZones Boiler Status"
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = [BOILER_STATE_ON, BOILER_STATE_OFF]
+
+    @property
+    def native_value(self) -> str:
+        return BOILER_STATE_ON if self._boiler.boiler_on else BOILER_STATE_OFF
+
+    @property
+    def icon(self) -> str:
+        return "mdi:fire" if self._boiler.boiler_on else "mdi:fire-off"
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        state = self._boiler.get_boiler_state()
+        return {
+            "boiler_entity": state["boiler_entity"],
+            "boiler_starts": state["boiler_starts"],
+            "avoided_starts": state["avoided_starts"],
+        }
+
+
+class BoilerOnSinceSensor(SmartHeatZonesSystemSensor):
+    """Time the boiler was switched on (unknown while off)."""
+
+    _key = "boiler_on_since"
+    _attr_name = "SmartHeatZones Boiler On Since"
+    _attr_icon = "mdi:fire-circle"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    @property
+    def native_value(self):
+        return self._boiler.boiler_on_since
+
+
+class HeatingTimeSensor(SensorEntity):
+    """On-time of a zone or the boiler in the current day / week / month."""
+
+    _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_suggested_display_precision = 2
+
+    def __init__(self, tracker: HeatingTimeTracker, key: str, period: str, name: str, unique_id: str):
+        self._tracker = tracker
+        self._key = key
+        self._period = period
+        self._attr_name = name
+        self._attr_unique_id = unique_id
+        self._attr_icon = "mdi:fire-circle" if key == STORE_KEY_BOILER else "mdi:clock-time-four"
+
+    async def async_added_to_hass(self):
+        self.async_on_remove(self._tracker.async_add_listener(self._key, self._tracker_updated))
+
+    @callback
+    def _tracker_updated(self):
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> float:
+        return round(self._tracker.hours(self._key, self._period), 4)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        return {"heating": self._tracker.is_on(self._key)}
+
+
+class ControlCounterSensor(SensorEntity):
+    """Control loop event count of a zone or the boiler in the current hour / day."""
+
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(
+        self, counters: ControlCounters, key: str, counter: str, period: str, icon: str, name: str, unique_id: str
+    ):
+        self._counters = counters
+        self._key = key
+        self._counter = counter
+        self._period = period
+        self._attr_name = name
+        self._attr_unique_id = unique_id
+        self._attr_icon = icon
+        # Hourly counts are mostly for alerting - enabled on demand
+        self._attr_entity_registry_enabled_default = period != PERIOD_HOUR
+
+    async def async_added_to_hass(self):
+        self.async_on_remove(self._counters.async_add_listener(self._key, self._counters_updated))
+
+    @callback
+    def _counters_updated(self):
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> int:
+        return self._counters.value(self._key, self._counter, self._period)
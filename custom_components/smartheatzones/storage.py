@@ -0,0 +1,67 @@
+"""
+SmartHeatZones - Persistent Storage
+Version: 1.10.0
+
+NEW in v1.10.0:
+- Zone keyed JSON store on top of Home Assistant's Store helper
+- Loaded once per integration, writes are debounced (async_delay_save) so
+  frequent updates cost one file write per STORE_SAVE_DELAY
+"""
+
+import logging
+from typing import Any, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, LOG_PREFIX, STORAGE_VERSION, STORE_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ZoneDataStore:
+    """
+    Zónánkénti adatok tartós tárolása (.storage/smartheatzones.<name>).
+
+    Data layout: {zone_name: <json serializable>}
+    """
+
+    def __init__(self, hass: HomeAssistant, name: str, save_delay: float = STORE_SAVE_DELAY):
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{name}")
+        self._name = name
+        self._save_delay = save_delay
+        self._data: dict[str, Any] = {}
+        self._loaded = False
+
+    async def async_load(self):
+        """Load stored data (once)."""
+        if self._loaded:
+            return
+        try:
+            self._data = await self._store.async_load() or {}
+        except Exception as e:
+            _LOGGER.warning("%s Could not load %s store, starting empty: %s", LOG_PREFIX, self._name, e)
+            self._data = {}
+        self._loaded = True
+        _LOGGER.debug("%s Store %s loaded (%d zones)", LOG_PREFIX, self._name, len(self._data))
+
+    def get(self, zone: str) -> Optional[Any]:
+        return self._data.get(zone)
+
+    def set(self, zone: str, value: Any):
+        """Update a zone's data and schedule a debounced save."""
+        self._data[zone] = value
+        self._store.async_delay_save(self._data_to_save, self._save_delay)
+
+    def remove(self, zone: str):
+        if self._data.pop(zone, None) is not None:
+            self._store.async_delay_save(self._data_to_save, self._save_delay)
+
+    async def async_remove(self, zone: str):
+        """Remove a zone's data and write it now (store loaded only for this)."""
+        await self.async_load()
+        if self._data.pop(zone, None) is not None:
+            await self._store.async_save(self._data)
+
+    def _data_to_save(self) -> dict:
+        return self._data
@@ -0,0 +1,78 @@
+"""
+SmartHeatZones - Decision Trace
+Version: 1.10.0
+
+NEW in v1.10.0:
+- Compact per-zone ring buffer of control decisions (inputs, hysteresis,
+  outcome, reason, timestamp)
+- Recording costs a single deque append; formatting happens only on dump
+"""
+
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from .const import DECISION_TRACE_SIZE
+
+# Decision outcomes
+OUTCOME_ON = "on"  # heating requested
+OUTCOME_OFF = "off"  # heating released
+OUTCOME_HOLD = "hold"  # inside the hysteresis band, no change
+OUTCOME_SKIP = "skip"  # not evaluated (no temperature, HVAC off, ...)
+
+
+class DecisionRecord:
+    """One control decision."""
+
+    __slots__ = ("ts", "current", "target", "adjusted_target", "hysteresis", "outcome", "reason")
+
+    def __init__(self, ts, current, target, adjusted_target, hysteresis, outcome, reason):
+        self.ts = ts
+        self.current = current
+        self.target = target
+        self.adjusted_target = adjusted_target
+        self.hysteresis = hysteresis
+        self.outcome = outcome
+        self.reason = reason
+
+    def as_dict(self) -> dict:
+        return {
+            "ts": self.ts,
+            "current": self.current,
+            "target": self.target,
+            "adjusted_target": self.adjusted_target,
+            "hysteresis": self.hysteresis,
+            "outcome": self.outcome,
+            "reason": self.reason,
+        }
+
+
+class DecisionTrace:
+    """Bounded ring buffer of DecisionRecords."""
+
+    __slots__ = ("_records", "_clock")
+
+    def __init__(self, maxlen: int = DECISION_TRACE_SIZE, clock: Callable[[], float] = time.time):
+        self._records: deque[DecisionRecord] = deque(maxlen=maxlen)
+        self._clock = clock
+
+    def record(
+        self,
+        current: Optional[float],
+        target: Optional[float],
+        adjusted_target: Optional[float],
+        hysteresis: Optional[float],
+        outcome: str,
+        reason: str,
+    ):
+        """Append a decision (oldest record is dropped when full)."""
+        self._records.append(
+            DecisionRecord(self._clock(), current, target, adjusted_target, hysteresis, outcome, reason)
+        )
+
+    def dump(self) -> list[dict]:
+        """Records as plain dicts, oldest first."""
+        return [record.as_dict() for record in self._records]
+
+    def __len__(self) -> int:
+        return len(self._records)
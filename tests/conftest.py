@@ -0,0 +1,65 @@
+"""
+SmartHeatZones - shared test setup
+
+The tests import the integration (and the local Home Assistant stand-in from
+tools/harness.py), so they need the homeassistant package; without it they
+are not collected. See tools/README.md for the requirements.
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+
+try:
+    import homeassistant  # noqa: F401
+except ModuleNotFoundError:
+    collect_ignore_glob = ["test_*.py"]
+
+# Virtual clock start of the harness runs (a Monday morning in winter)
+VIRTUAL_START = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+def _run_harness(scenario, **harness_options):
+    """
+    Run `await scenario(harness)` on a started Harness and return its result.
+
+    Harness options are passed through; virtual_clock=True runs the scenario
+    on the virtual clock starting at VIRTUAL_START.
+    """
+    import harness as H
+
+    async def run():
+        harness = H.Harness(**harness_options)
+        await harness.async_start()
+        try:
+            return await scenario(harness)
+        finally:
+            await harness.async_stop()
+
+    if harness_options.get("virtual_clock"):
+        return H.run_virtual(run(), VIRTUAL_START)
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def run_harness():
+    return _run_harness
+
+
+@pytest.fixture
+def local_time_zone():
+    """Europe/Budapest as Home Assistant's local time zone (restored afterwards)."""
+    from homeassistant.util import dt as dt_util
+
+    previous = dt_util.DEFAULT_TIME_ZONE
+    time_zone = dt_util.get_time_zone("Europe/Budapest")
+    dt_util.set_default_time_zone(time_zone)
+    yield time_zone
+    dt_util.set_default_time_zone(previous)
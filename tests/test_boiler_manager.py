@@ -0,0 +1,64 @@
+"""
+SmartHeatZones - BoilerManager timers
+
+Runs on the local Home Assistant stand-in (tools/harness.py).
+"""
+
+import asyncio
+
+from harness import BOILER_ENTITY
+
+from custom_components.smartheatzones.const import CONF_BOILER_COALESCE_WINDOW
+from custom_components.smartheatzones.relay_queue import get_relay_queue
+
+
+def test_shutdown_cancels_sweep_and_queued_boiler_command(run_harness):
+    async def scenario(harness):
+        zone = (await harness.async_add_zones(1, min_eval_interval=0))[0]
+        boiler = harness.boiler
+        await boiler.async_startup_evaluation()
+        assert boiler._reconcile_unsub is not None
+
+        # Starts are immediate; the stop waits for the coalesce window
+        harness.set_state(zone.sensor, 18.0)
+        await harness.async_block()
+        assert boiler._boiler_on and boiler._pending_command is None
+        harness.set_state(zone.sensor, 23.0)
+        await harness.async_block()
+        assert boiler._pending_command is not None
+
+        await zone.entity.async_will_remove_from_hass()
+        boiler.shutdown()
+        assert boiler._reconcile_unsub is None
+        assert boiler._pending_command is None
+
+        # The next zone starts the sweep again
+        await harness.async_add_zones(1)
+        assert boiler._reconcile_unsub is not None
+
+    run_harness(scenario, common_settings={CONF_BOILER_COALESCE_WINDOW: 60})
+
+
+def test_sweep_during_relay_command_does_not_start_the_boiler(run_harness):
+    async def scenario(harness):
+        zone = (await harness.async_add_zones(1, min_eval_interval=0))[0]
+        boiler = harness.boiler
+        queue = get_relay_queue(harness.hass)
+        harness.switches.reset()
+
+        # Slow relay: the zone heats, its relay command is still in flight
+        harness.set_state(zone.sensor, 18.0)
+        await asyncio.sleep(1)
+        assert zone.entity.is_heating and queue.is_pending(zone.relays)
+
+        await boiler.async_reconcile()
+        assert zone.name not in boiler.get_active_zones()
+        assert [call.entity_id for call in harness.switches.calls] == zone.relays
+
+        # Relays first, then the boiler
+        await asyncio.sleep(30)
+        assert not queue.is_pending(zone.relays)
+        assert [call.entity_id for call in harness.switches.calls] == zone.relays + [BOILER_ENTITY]
+        assert boiler.boiler_on and zone.name in boiler.get_active_zones()
+
+    run_harness(scenario, virtual_clock=True, service_latency=5.0)
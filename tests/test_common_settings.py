@@ -0,0 +1,45 @@
+"""
+SmartHeatZones - common settings applied in place
+
+Runs on the local Home Assistant stand-in (tools/harness.py).
+"""
+
+from harness import BOILER_ENTITY, OUTDOOR_SENSOR
+
+from custom_components.smartheatzones.const import (
+    CONF_ADAPTIVE_HYSTERESIS,
+    CONF_BOILER_MAIN,
+    CONF_OUTDOOR_SENSOR,
+    DATA_OUTDOOR_TEMP,
+    DOMAIN,
+)
+from custom_components.smartheatzones.registry import CATEGORY_SERVICE
+
+COMMON_SETTINGS = {
+    CONF_BOILER_MAIN: BOILER_ENTITY,
+    CONF_OUTDOOR_SENSOR: OUTDOOR_SENSOR,
+    CONF_ADAPTIVE_HYSTERESIS: True,
+}
+
+
+def test_outdoor_registration_survives_repeated_common_settings_updates(run_harness):
+    async def scenario(harness):
+        zone = (await harness.async_add_zones(1))[0]
+        outdoor = harness.hass.data[DOMAIN][DATA_OUTDOOR_TEMP]
+        assert zone.name in outdoor._zones
+
+        for _ in range(2):
+            zone.entity.apply_common_settings(COMMON_SETTINGS)
+            assert zone.name in outdoor._zones
+            assert zone.entity.subscription_counts.get(CATEGORY_SERVICE) == 2
+
+        # A jump of the outdoor temperature still reaches the zone
+        harness.set_state(OUTDOOR_SENSOR, "-12.0")
+        await harness.async_block()
+        assert zone.entity._outdoor_temp == -12.0
+
+        # Adaptive hysteresis switched off: the zone leaves the service
+        zone.entity.apply_common_settings(dict(COMMON_SETTINGS, **{CONF_ADAPTIVE_HYSTERESIS: False}))
+        assert zone.name not in outdoor._zones
+
+    run_harness(scenario)
@@ -0,0 +1,58 @@
+"""SmartHeatZones - control loop counters."""
+
+from datetime import datetime
+
+from custom_components.smartheatzones.const import DATA_COUNTERS, DOMAIN
+from custom_components.smartheatzones.counters import (
+    COUNTER_EVALUATIONS,
+    PERIOD_DAY,
+    PERIOD_HOUR,
+    RollingCounter,
+    get_counters,
+)
+
+
+def _ts(local_time_zone, *args) -> float:
+    return datetime(*args, tzinfo=local_time_zone).timestamp()
+
+
+def test_hour_rolls_over_day_keeps_counting(local_time_zone):
+    counter = RollingCounter()
+    counter.add(_ts(local_time_zone, 2026, 1, 5, 10, 15))
+    counter.add(_ts(local_time_zone, 2026, 1, 5, 10, 59, 59), 2)
+    assert counter.value(PERIOD_HOUR, _ts(local_time_zone, 2026, 1, 5, 10, 59, 59)) == 3
+
+    counter.add(_ts(local_time_zone, 2026, 1, 5, 11, 0))
+    assert counter.value(PERIOD_HOUR, _ts(local_time_zone, 2026, 1, 5, 11, 0)) == 1
+    assert counter.value(PERIOD_DAY, _ts(local_time_zone, 2026, 1, 5, 11, 0)) == 4
+
+
+def test_idle_counter_reads_zero_after_the_period(local_time_zone):
+    counter = RollingCounter()
+    counter.add(_ts(local_time_zone, 2026, 1, 5, 23, 30), 5)
+    # Read only (no increment) after local midnight: both periods are new
+    assert counter.value(PERIOD_HOUR, _ts(local_time_zone, 2026, 1, 6, 0, 10)) == 0
+    assert counter.value(PERIOD_DAY, _ts(local_time_zone, 2026, 1, 6, 0, 10)) == 0
+
+    counter.add(_ts(local_time_zone, 2026, 1, 6, 0, 20))
+    assert counter.value(PERIOD_DAY, _ts(local_time_zone, 2026, 1, 6, 0, 20)) == 1
+
+
+def test_hourly_tick_notifies_listeners_and_shutdown_stops_it(run_harness):
+    async def scenario(harness):
+        counters = get_counters(harness.hass)
+        assert harness.hass.data[DOMAIN][DATA_COUNTERS] is counters
+        notified = []
+        counters.async_add_listener("Zone", lambda: notified.append(True))
+        counters._async_hourly(None)
+        assert notified == [True]
+
+        counters.increment("Zone", COUNTER_EVALUATIONS)
+        assert counters._publish_unsub is not None
+        counters.shutdown()
+        assert counters._hourly_unsub is None and counters._publish_unsub is None
+
+        counters.async_add_listener("Zone", lambda: None)
+        assert counters._hourly_unsub is not None
+
+    run_harness(scenario)
@@ -0,0 +1,41 @@
+"""SmartHeatZones - streaming sensor filters."""
+
+import random
+import statistics
+
+import pytest
+
+from custom_components.smartheatzones.const import SENSOR_FILTER_EMA, SENSOR_FILTER_MEDIAN
+from custom_components.smartheatzones.filters import EmaFilter, MedianFilter, create_filter
+
+
+def test_ema_starts_at_first_reading_and_follows_alpha():
+    ema = EmaFilter(3)  # alpha = 0.5
+    assert ema.value is None
+    assert ema.update(20.0) == 20.0
+    assert ema.update(22.0) == pytest.approx(21.0)
+    assert ema.update(22.0) == pytest.approx(21.5)
+
+
+def test_median_rejects_single_spikes():
+    median = MedianFilter(3)
+    assert median.update(20.0) == 20.0
+    assert median.update(30.0) == pytest.approx(25.0)  # even count: mean of the middle two
+    assert median.update(20.2) == pytest.approx(20.2)
+    assert median.update(20.4) == pytest.approx(20.4)  # 20.0 left the window
+
+
+def test_median_matches_full_recompute_over_the_ring():
+    rng = random.Random(7)
+    median = MedianFilter(5)
+    readings = []
+    for _ in range(200):
+        reading = round(rng.uniform(18, 24), 1)
+        readings.append(reading)
+        assert median.update(reading) == pytest.approx(statistics.median(readings[-5:]))
+
+
+def test_create_filter():
+    assert isinstance(create_filter(SENSOR_FILTER_EMA, 5), EmaFilter)
+    assert isinstance(create_filter(SENSOR_FILTER_MEDIAN, "5"), MedianFilter)
+    assert create_filter(None, 5) is None
@@ -0,0 +1,61 @@
+"""SmartHeatZones - heating time accumulators."""
+
+from datetime import datetime
+
+import pytest
+
+from custom_components.smartheatzones.const import DATA_HEATING_TIME, DOMAIN
+from custom_components.smartheatzones.heating_time import (
+    PERIOD_DAY,
+    PERIOD_MONTH,
+    PERIOD_WEEK,
+    OnTimeAccumulator,
+)
+
+
+def _hours(accumulator: OnTimeAccumulator) -> tuple[float, float, float]:
+    return tuple(accumulator.hours(period) for period in (PERIOD_DAY, PERIOD_WEEK, PERIOD_MONTH))
+
+
+def test_on_period_is_split_at_midnight(local_time_zone):
+    accumulator = OnTimeAccumulator()
+    # Sunday 23:00 → Monday 01:00: new day and new ISO week, same month
+    accumulator.set_on(True, datetime(2026, 1, 4, 23, 0, tzinfo=local_time_zone))
+    accumulator.advance(datetime(2026, 1, 5, 1, 0, tzinfo=local_time_zone))
+    assert _hours(accumulator) == pytest.approx((1.0, 1.0, 2.0))
+
+
+def test_month_rollover_and_multi_day_gap(local_time_zone):
+    accumulator = OnTimeAccumulator()
+    accumulator.set_on(True, datetime(2026, 1, 31, 23, 30, tzinfo=local_time_zone))
+    accumulator.set_on(False, datetime(2026, 2, 1, 0, 30, tzinfo=local_time_zone))
+    assert _hours(accumulator) == pytest.approx((0.5, 1.0, 0.5))
+
+    # Idle for days: the next advance starts every period from zero
+    accumulator.advance(datetime(2026, 3, 10, 12, 0, tzinfo=local_time_zone))
+    assert _hours(accumulator) == (0.0, 0.0, 0.0)
+
+
+def test_stored_on_period_is_closed_on_restore(local_time_zone):
+    accumulator = OnTimeAccumulator()
+    accumulator.set_on(True, datetime(2026, 1, 5, 8, 0, tzinfo=local_time_zone))
+    accumulator.advance(datetime(2026, 1, 5, 9, 0, tzinfo=local_time_zone))
+    restored = OnTimeAccumulator.from_dict(accumulator.as_dict())
+    assert not restored.on
+    restored.advance(datetime(2026, 1, 5, 12, 0, tzinfo=local_time_zone))
+    assert restored.hours(PERIOD_DAY) == pytest.approx(1.0)
+
+
+def test_shutdown_stops_timers_until_the_next_sensor(run_harness):
+    async def scenario(harness):
+        tracker = harness.hass.data[DOMAIN][DATA_HEATING_TIME]
+        tracker.set_on("Zone", True)
+        assert tracker._midnight_unsub is not None and tracker._refresh_unsub is not None
+
+        tracker.shutdown()
+        assert tracker._midnight_unsub is None and tracker._refresh_unsub is None
+
+        tracker.async_add_listener("Zone", lambda: None)
+        assert tracker._midnight_unsub is not None
+
+    run_harness(scenario)
@@ -0,0 +1,70 @@
+"""SmartHeatZones - predictive pre-heat model."""
+
+import pytest
+
+from custom_components.smartheatzones.const import PREHEAT_MAX_LEAD_MINUTES, PREHEAT_MIN_SAMPLES
+from custom_components.smartheatzones.preheat import HeatingSession, HeatRateModel
+
+
+def _model(samples) -> HeatRateModel:
+    model = HeatRateModel()
+    for rate, outdoor in samples:
+        model.update(rate, outdoor)
+    return model
+
+
+def test_no_prediction_before_enough_samples():
+    model = _model([(2.0, 0.0)] * (PREHEAT_MIN_SAMPLES - 1))
+    assert model.predict(0.0) is None
+    assert model.lead_minutes(1.0, 0.0) is None
+    model.update(2.0, 0.0)
+    assert model.predict(0.0) == pytest.approx(2.0)
+
+
+def test_linear_rate_is_recovered():
+    # rate = 2.0 + 0.1 × outdoor
+    model = _model([(2.0 + 0.1 * outdoor, outdoor) for outdoor in (-10.0, -5.0, 0.0, 5.0, 10.0)] * 4)
+    assert model.predict(-8.0) == pytest.approx(1.2)
+    assert model.predict(8.0) == pytest.approx(2.8)
+
+
+def test_missing_outdoor_reading_does_not_bend_the_slope():
+    samples = [(2.0 + 0.1 * outdoor, outdoor) for outdoor in (-10.0, -5.0, 5.0, 10.0)] * 3
+    reference = _model(samples)
+    # Outdoor sensor briefly unavailable while it was cold (rate 1.0 fits -10 °C)
+    with_gaps = _model(samples + [(1.0, None), (1.0, None)])
+    read_as_zero = _model(samples + [(1.0, 0.0), (1.0, 0.0)])
+    assert with_gaps.nx == pytest.approx(reference.nx * 0.95 ** 2)
+    assert with_gaps.predict(-10.0) == pytest.approx(reference.predict(-10.0))
+    assert with_gaps.predict(10.0) == pytest.approx(reference.predict(10.0))
+    assert read_as_zero.predict(10.0) != pytest.approx(reference.predict(10.0))
+    # ... but they do count towards the mean rate used without an outdoor reading
+    assert with_gaps.predict(None) < reference.predict(None)
+
+
+def test_model_without_outdoor_sensor_uses_the_mean_rate():
+    model = _model([(1.5, None), (2.5, None), (2.0, None)])
+    assert model.predict(None) == pytest.approx(2.0, rel=0.05)
+    assert model.predict(-5.0) == model.predict(None)
+
+
+def test_stored_model_round_trip_and_legacy_data():
+    model = _model([(2.0, -5.0), (3.0, 5.0), (2.5, None)])
+    assert HeatRateModel.from_dict(model.as_dict()).as_dict() == model.as_dict()
+    # Stored before nx / syx existed: every sample had an outdoor term
+    legacy = HeatRateModel.from_dict({"n": 3.0, "sx": 0.0, "sy": 6.0, "sxx": 50.0, "sxy": 5.0, "samples": 3})
+    assert legacy.nx == 3.0 and legacy.syx == 6.0
+
+
+def test_lead_minutes_is_capped():
+    model = _model([(1.0, 0.0)] * PREHEAT_MIN_SAMPLES)
+    assert model.lead_minutes(0.5, 0.0) == pytest.approx(30.0)
+    assert model.lead_minutes(0.0, 0.0) == 0.0
+    assert model.lead_minutes(10.0, 0.0) == PREHEAT_MAX_LEAD_MINUTES
+
+
+def test_session_rate_ignores_short_periods_and_small_rises():
+    session = HeatingSession(started_at=0.0, start_temp=19.0, start_outdoor=0.0)
+    assert session.rate(1800.0, 20.0) == pytest.approx(2.0)
+    assert session.rate(60.0, 20.0) is None
+    assert session.rate(1800.0, 19.05) is None
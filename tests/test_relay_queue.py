@@ -0,0 +1,68 @@
+"""
+SmartHeatZones - relay command queue
+
+Runs on the local Home Assistant stand-in (tools/harness.py), on the virtual clock.
+"""
+
+import asyncio
+
+from custom_components.smartheatzones.const import DATA_DISPATCHER, DOMAIN, RELAY_COMMAND_TIMEOUT
+from custom_components.smartheatzones.relay_queue import (
+    QUEUE_SUBSCRIBER,
+    RELAY_CONFIRMED,
+    RELAY_FAILED,
+    RELAY_SKIPPED,
+    RELAY_SUPERSEDED,
+    get_relay_queue,
+)
+
+
+def _run(run_harness, scenario, latency: float = 0.0):
+    async def run(harness):
+        zone = (await harness.async_add_zones(1, relays_per_zone=2))[0]
+        await scenario(harness, zone, get_relay_queue(harness.hass))
+
+    run_harness(run, virtual_clock=True, service_latency=latency)
+
+
+def test_latest_command_wins_and_superseded_is_reported(run_harness):
+    async def scenario(harness, zone, queue):
+        first, second, third = await asyncio.gather(
+            queue.async_switch(zone.relays, True),
+            queue.async_switch(zone.relays, False),
+            queue.async_switch(zone.relays, True),
+        )
+        assert set(first.values()) == {RELAY_CONFIRMED}
+        assert set(second.values()) == {RELAY_SUPERSEDED}
+        assert set(third.values()) == {RELAY_SKIPPED}
+
+    _run(run_harness, scenario)
+
+
+def test_command_time_is_capped(run_harness):
+    async def scenario(harness, zone, queue):
+        # Slow switch that never reports back
+        harness.switches.stuck = set(zone.relays)
+        started = harness.hass.loop.time()
+        results = await queue.async_switch(zone.relays, True)
+        assert set(results.values()) == {RELAY_FAILED}
+        assert harness.hass.loop.time() - started <= RELAY_COMMAND_TIMEOUT + 0.5
+        assert not queue.is_pending(zone.relays)
+
+    _run(run_harness, scenario, latency=8.0)
+
+
+def test_shutdown_releases_subscriptions(run_harness):
+    async def scenario(harness, zone, queue):
+        await queue.async_switch(zone.relays, True)
+        dispatcher = harness.hass.data[DOMAIN][DATA_DISPATCHER]
+        assert dispatcher.zone_subscription_count(QUEUE_SUBSCRIBER) == 2
+
+        queue.shutdown()
+        assert dispatcher.zone_subscription_count(QUEUE_SUBSCRIBER) == 0
+
+        # Used again: subscribes again
+        await queue.async_switch(zone.relays, False)
+        assert dispatcher.zone_subscription_count(QUEUE_SUBSCRIBER) == 2
+
+    _run(run_harness, scenario)
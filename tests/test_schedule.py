@@ -0,0 +1,53 @@
+"""SmartHeatZones - compiled schedule lookup and transitions."""
+
+from custom_components.smartheatzones.schedule import CompiledSchedule
+
+
+def _minute(hhmm: str) -> int:
+    hours, minutes = hhmm.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+NIGHT_AND_DAY = [
+    {"label": "Night", "start": "22:00", "end": "06:00", "temp": 18},
+    {"label": "Day", "start": "06:00", "end": "22:00", "temp": 21},
+]
+
+
+def test_block_wrapping_midnight_covers_both_days():
+    schedule = CompiledSchedule(NIGHT_AND_DAY)
+    assert not schedule.errors
+    for hhmm in ("22:00", "23:59", "00:00", "05:59"):
+        assert schedule.block_at(_minute(hhmm)).label == "Night"
+    for hhmm in ("06:00", "12:00", "21:59"):
+        assert schedule.block_at(_minute(hhmm)).label == "Day"
+
+
+def test_next_transition_wraps_to_the_next_day():
+    schedule = CompiledSchedule(NIGHT_AND_DAY)
+    assert schedule.next_transition(_minute("21:59")) == _minute("22:00")
+    assert schedule.next_transition(_minute("22:00")) == _minute("06:00")
+    assert schedule.minutes_until_next_transition(_minute("23:00")) == 7 * 60
+    assert schedule.minutes_until_next_transition(_minute("05:59")) == 1
+
+
+def test_uncovered_minutes_and_first_block_wins():
+    schedule = CompiledSchedule([
+        {"label": "Evening", "start": "18:00", "end": "23:00", "temp": 22},
+        {"label": "Late", "start": "21:00", "end": "01:00", "temp": 20},
+        {"label": "Broken", "start": "25:00", "end": "02:00", "temp": 20},
+    ])
+    assert len(schedule.blocks) == 2 and len(schedule.errors) == 1
+    assert schedule.block_at(_minute("21:30")).label == "Evening"
+    assert schedule.block_at(_minute("23:30")).label == "Late"
+    assert schedule.block_at(_minute("00:59")).label == "Late"
+    assert schedule.block_at(_minute("01:00")) is None
+    assert schedule.next_transition(_minute("02:00")) == _minute("18:00")
+
+
+def test_empty_block_and_empty_schedule():
+    # start == end is an empty block, not a whole day
+    schedule = CompiledSchedule([{"label": "Never", "start": "00:00", "end": "00:00", "temp": 20}])
+    assert schedule.block_at(0) is None
+    assert schedule.next_transition(0) is None
+    assert not CompiledSchedule([])
@@ -0,0 +1,20 @@
+"""
+SmartHeatZones - cached zone state attributes
+
+Runs on the local Home Assistant stand-in (tools/harness.py).
+"""
+
+
+def test_attributes_cached_across_evaluations(run_harness):
+    async def scenario(harness):
+        zone = (await harness.async_add_zones(1, sensor_deadband=0, min_eval_interval=0))[0]
+        attrs = zone.entity.extra_state_attributes
+
+        for temp in (20.5, 20.6, 20.7):
+            harness.set_state(zone.sensor, temp)
+            await harness.async_block()
+
+        assert zone.entity._eval_stats["evaluated"] >= 3
+        assert zone.entity.extra_state_attributes is attrs
+
+    run_harness(scenario)
@@ -0,0 +1,25 @@
+"""
+SmartHeatZones - zone options applied in place
+
+Runs on the local Home Assistant stand-in (tools/harness.py).
+"""
+
+
+def test_removed_relay_shared_with_a_heating_zone_stays_on(run_harness):
+    async def scenario(harness):
+        heating, other = await harness.async_add_zones(2, min_eval_interval=0)
+        shared, own = heating.relays[0], other.relays[0]
+        await other.entity._apply_relay_list([own, shared])
+
+        harness.set_state(heating.sensor, 18.0)
+        harness.set_state(other.sensor, 18.0)
+        await harness.async_block()
+        assert heating.entity.is_heating and other.entity.is_heating
+
+        # Both relays leave the other zone: its own one is switched off, the shared one is not
+        await other.entity._apply_relay_list([])
+        await harness.async_block()
+        assert harness.hass.states.get(own).state == "off"
+        assert harness.hass.states.get(shared).state == "on"
+
+    run_harness(scenario)
@@ -0,0 +1,50 @@
+"""
+SmartHeatZones - deleted zone data
+
+Runs on the local Home Assistant stand-in (tools/harness.py).
+"""
+
+from custom_components.smartheatzones import _async_remove_zone_data
+from custom_components.smartheatzones.const import (
+    DATA_HEATING_TIME,
+    DATA_PREHEAT_STORE,
+    DATA_RUNTIME_STORE,
+    DOMAIN,
+)
+from custom_components.smartheatzones.counters import COUNTER_EVALUATIONS, PERIOD_DAY, get_counters
+from custom_components.smartheatzones.storage import ZoneDataStore
+
+
+def test_deleted_zone_leaves_no_stored_data(run_harness):
+    async def scenario(harness):
+        domain_data = harness.hass.data[DOMAIN]
+        zone, other = await harness.async_add_zones(2, min_eval_interval=0)
+        for name in (zone.name, other.name):
+            domain_data[DATA_RUNTIME_STORE].set(name, {"heating": False, "temp": 21.0})
+            domain_data[DATA_PREHEAT_STORE].set(name, {"n": 1.0})
+            domain_data[DATA_HEATING_TIME].set_on(name, True)
+            get_counters(harness.hass).increment(name, COUNTER_EVALUATIONS)
+        for harness_zone in (zone, other):
+            await harness_zone.entity.async_will_remove_from_hass()
+        harness.zones.clear()
+
+        await _async_remove_zone_data(harness.hass, zone.name)
+
+        assert domain_data[DATA_RUNTIME_STORE].get(zone.name) is None
+        assert domain_data[DATA_PREHEAT_STORE].get(zone.name) is None
+        assert domain_data[DATA_HEATING_TIME]._store.get(zone.name) is None
+        assert zone.name not in domain_data[DATA_HEATING_TIME]._accumulators
+        assert get_counters(harness.hass).value(zone.name, COUNTER_EVALUATIONS, PERIOD_DAY) == 0
+        # Other zones are kept
+        assert domain_data[DATA_PREHEAT_STORE].get(other.name) == {"n": 1.0}
+        assert get_counters(harness.hass).value(other.name, COUNTER_EVALUATIONS, PERIOD_DAY) >= 1
+
+        # Integration not loaded: the store file itself is updated
+        preheat = domain_data.pop(DATA_PREHEAT_STORE)
+        await preheat._store.async_save(preheat._data)
+        await _async_remove_zone_data(harness.hass, other.name)
+        reloaded = ZoneDataStore(harness.hass, "preheat")
+        await reloaded.async_load()
+        assert reloaded.get(other.name) is None
+
+    run_harness(scenario)
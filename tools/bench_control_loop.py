@@ -0,0 +1,133 @@
+"""
+SmartHeatZones - Control loop benchmark
+Version: 1.10.0
+
+NEW in v1.10.0:
+- Drives SmartHeatZoneClimate + BoilerManager on the local Home Assistant
+  stand-in (harness.py) with fake switch services
+- Reports per zone count:
+    p50 / p99 sensor event → relay switch call latency
+    switch service calls per sensor event
+    event loop (CPU) time per zone and event
+
+Usage:
+    python tools/bench_control_loop.py
+    python tools/bench_control_loop.py --zones 1 10 100 --rounds 10 --latency-ms 50 --json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+from harness import Harness, quiet_logging
+
+DEFAULT_ZONE_COUNTS = (1, 10, 100, 500)
+
+# Alternating readings around the 21 °C default target (hysteresis 0.3 °C):
+# every reading crosses the band, so every event should switch the zone.
+COLD_TEMP = 19.0
+WARM_TEMP = 23.0
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+async def bench_zone_count(zone_count: int, rounds: int, latency: float, settle: float) -> dict:
+    """One measurement: `rounds` burst rounds, one sensor event per zone per round."""
+    harness = Harness(service_latency=latency)
+    await harness.async_start()
+    try:
+        # No rate limit: every band-crossing reading must reach the relays
+        zones = await harness.async_add_zones(zone_count, initial_temp=21.0, min_eval_interval=0)
+        harness.switches.reset()
+
+        latencies_ms: list[float] = []
+        cpu_seconds = 0.0
+        events = 0
+        missed = 0
+
+        for round_index in range(rounds):
+            temp = COLD_TEMP if round_index % 2 == 0 else WARM_TEMP
+
+            cpu_start = time.process_time()
+            sent_at = time.perf_counter()
+            for zone in zones:
+                harness.set_state(zone.sensor, temp)
+            events += len(zones)
+            await harness.async_block()
+            cpu_seconds += time.process_time() - cpu_start
+
+            for zone in zones:
+                record = harness.switches.first_call_after(zone.relays[0], sent_at)
+                if record is None:
+                    missed += 1
+                    continue
+                latencies_ms.append((record.ts - sent_at) * 1000)
+
+            if settle:
+                await asyncio.sleep(settle)
+
+        calls = len(harness.switches.calls)
+        return {
+            "zones": zone_count,
+            "events": events,
+            "p50_ms": percentile(latencies_ms, 50),
+            "p99_ms": percentile(latencies_ms, 99),
+            "max_ms": max(latencies_ms) if latencies_ms else float("nan"),
+            "calls_per_event": calls / events if events else 0.0,
+            "loop_us_per_zone_event": cpu_seconds / events * 1e6 if events else 0.0,
+            "missed": missed,
+            "boiler_starts": harness.boiler.get_boiler_state()["boiler_starts"],
+        }
+    finally:
+        await harness.async_stop()
+
+
+def print_table(results: list[dict]):
+    header = (
+        f"{'zones':>6} {'events':>7} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} "
+        f"{'calls/ev':>9} {'loop µs/zone·ev':>16} {'missed':>7} {'boiler starts':>14}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['zones']:>6} {r['events']:>7} {r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['max_ms']:>8.2f} "
+            f"{r['calls_per_event']:>9.2f} {r['loop_us_per_zone_event']:>16.1f} {r['missed']:>7} "
+            f"{r['boiler_starts']:>14}"
+        )
+
+
+async def main(args):
+    results = []
+    for zone_count in args.zones:
+        results.append(
+            await bench_zone_count(zone_count, args.rounds, args.latency_ms / 1000, args.settle_ms / 1000)
+        )
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"service latency: {args.latency_ms} ms, rounds: {args.rounds}")
+        print_table(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SmartHeatZones control loop benchmark")
+    parser.add_argument("--zones", type=int, nargs="+", default=list(DEFAULT_ZONE_COUNTS))
+    parser.add_argument("--rounds", type=int, default=6, help="burst rounds (alternating cold/warm)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="fake switch service latency")
+    parser.add_argument("--settle-ms", type=float, default=0.0, help="pause between rounds")
+    parser.add_argument("--json", action="store_true", help="machine readable output")
+    parser.add_argument("--debug", action="store_true", help="integration debug logging")
+    args = parser.parse_args()
+
+    quiet_logging(logging.DEBUG if args.debug else logging.WARNING)
+    asyncio.run(main(args))
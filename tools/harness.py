@@ -0,0 +1,387 @@
+"""
+SmartHeatZones - Local Home Assistant stand-in
+Version: 1.10.0
+
+NEW in v1.10.0:
+- Real Home Assistant core (state machine, event bus, service registry) without
+  config entries, recorder or other integrations
+- Fake switch services with configurable latency; every call is recorded
+- Zones are built the same way as async_setup_entry / climate.async_setup_entry
+  do, then added directly (no entity platform, no restore state)
+- Optional virtual clock: an event loop that jumps to its next timer whenever
+  it is idle, with Home Assistant's wall clock helpers following it
+
+Used by the benchmarks and the thermal simulator in this directory.
+Requires the homeassistant package (same version as the target installation,
+verified on 2024.3.3): pip install -r tools/requirements.txt
+"""
+
+import asyncio
+import logging
+import os
+import selectors
+import sys
+import tempfile
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Optional
+
+try:
+    from homeassistant.core import CoreState, HomeAssistant, ServiceCall
+    from homeassistant.helpers import event as ha_event
+    from homeassistant.util import dt as dt_util
+except ModuleNotFoundError as err:
+    raise ModuleNotFoundError(
+        f"{err} - the developer tools need Home Assistant: pip install -r tools/requirements.txt",
+        name=err.name,
+    ) from err
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from custom_components.smartheatzones.boiler_manager import BoilerManager  # noqa: E402
+from custom_components.smartheatzones.climate import SmartHeatZoneClimate  # noqa: E402
+from custom_components.smartheatzones.const import (  # noqa: E402
+    CONF_BOILER_COALESCE_WINDOW,
+    CONF_BOILER_MIN_OFF_TIME,
+    CONF_BOILER_MIN_ON_TIME,
+    DATA_ACTIVE_ZONES,
+    DATA_BOILER_MAIN,
+    DATA_DISPATCHER,
+    DATA_HEATING_TIME,
+    DATA_RUNTIME_STORE,
+    DATA_OUTDOOR_TEMP,
+    DATA_PREHEAT_STORE,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_OVERHEAT_TEMP,
+    DEFAULT_TEMP_OFFSET,
+    DOMAIN,
+    HEATING_MODE_RADIATOR,
+    THERMOSTAT_TYPE_WALL,
+)
+from custom_components.smartheatzones.dispatcher import ZoneEventDispatcher  # noqa: E402
+from custom_components.smartheatzones.heating_time import HeatingTimeTracker  # noqa: E402
+from custom_components.smartheatzones.outdoor import OutdoorTemperatureService  # noqa: E402
+from custom_components.smartheatzones.storage import ZoneDataStore  # noqa: E402
+
+BOILER_ENTITY = "switch.boiler"
+OUTDOOR_SENSOR = "sensor.outdoor_temperature"
+
+# Boiler settings for measurements: no coalescing / minimum times
+BENCH_COMMON_SETTINGS = {
+    CONF_BOILER_COALESCE_WINDOW: 0,
+    CONF_BOILER_MIN_ON_TIME: 0,
+    CONF_BOILER_MIN_OFF_TIME: 0,
+}
+
+
+# ------------------------------------------------------------------------------
+# Virtual clock
+# ------------------------------------------------------------------------------
+
+
+class _VirtualSelector:
+    """Selector wrapper that never blocks: an idle loop jumps to its next timer."""
+
+    def __init__(self, selector: selectors.BaseSelector):
+        self._selector = selector
+        self.loop: Optional["VirtualClockLoop"] = None
+
+    def select(self, timeout=None):
+        events = self._selector.select(0)
+        if not events and timeout and self.loop is not None:
+            self.loop.advance(timeout)
+        return events
+
+    def __getattr__(self, name):
+        return getattr(self._selector, name)
+
+
+class VirtualClockLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop on virtual time.
+
+    loop.time() only moves when nothing is ready to run, and then straight to
+    the next scheduled timer - a day of timers runs in milliseconds while the
+    order of events stays exactly as on a real loop.
+    """
+
+    def __init__(self, start: datetime):
+        selector = _VirtualSelector(selectors.DefaultSelector())
+        super().__init__(selector)
+        selector.loop = self
+        self._now = 0.0
+        self._start_utc = dt_util.as_utc(start)
+        self._start_ts = self._start_utc.timestamp()
+
+    def time(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float):
+        self._now += seconds
+
+    def utcnow(self) -> datetime:
+        return self._start_utc + timedelta(seconds=self._now)
+
+    def timestamp(self) -> float:
+        return self._start_ts + self._now
+
+
+@contextmanager
+def virtual_wall_clock(loop: VirtualClockLoop):
+    """Point Home Assistant's wall clock helpers (utcnow, now, time.time) at the loop."""
+    patched = [
+        (dt_util, "utcnow", loop.utcnow),
+        (dt_util, "now", lambda time_zone=None: loop.utcnow().astimezone(time_zone or dt_util.DEFAULT_TIME_ZONE)),
+        (time, "time", loop.timestamp),
+        (ha_event, "time_tracker_utcnow", loop.utcnow),
+        (ha_event, "time_tracker_timestamp", loop.timestamp),
+    ]
+    originals = [(module, name, getattr(module, name)) for module, name, _ in patched if hasattr(module, name)]
+    for module, name, value in patched:
+        if hasattr(module, name):
+            setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for module, name, value in originals:
+            setattr(module, name, value)
+
+
+def run_virtual(coro, start: datetime):
+    """Run a coroutine on a VirtualClockLoop starting at `start`."""
+    loop = VirtualClockLoop(start)
+    try:
+        with virtual_wall_clock(loop):
+            return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+# ------------------------------------------------------------------------------
+# Fake switches
+# ------------------------------------------------------------------------------
+
+
+class ServiceCallRecord:
+    """One recorded switch service call."""
+
+    __slots__ = ("ts", "action", "entity_id")
+
+    def __init__(self, ts: float, action: str, entity_id: str):
+        self.ts = ts
+        self.action = action
+        self.entity_id = entity_id
+
+
+class FakeSwitches:
+    """
+    switch.turn_on / switch.turn_off stand-in.
+
+    Calls are recorded when they arrive; the state is updated after `latency`
+    seconds, like a real relay reporting back. Entities in `stuck` accept the
+    call but never change state (relay command failure).
+    """
+
+    def __init__(self, hass: HomeAssistant, latency: float = 0.0):
+        self.hass = hass
+        self.latency = latency
+        self.calls: list[ServiceCallRecord] = []
+        self.record_calls = True
+        self.on_transitions: Counter = Counter()  # off → on switches per entity
+        self.stuck: set[str] = set()
+        for action in ("turn_on", "turn_off"):
+            hass.services.async_register("switch", action, self._handle)
+
+    async def _handle(self, call: ServiceCall):
+        entity_ids = call.data.get("entity_id")
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        if self.record_calls:
+            now = time.perf_counter()
+            for entity_id in entity_ids:
+                self.calls.append(ServiceCallRecord(now, call.service, entity_id))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        new_state = "on" if call.service == "turn_on" else "off"
+        for entity_id in entity_ids:
+            if entity_id in self.stuck:
+                continue
+            old_state = self.hass.states.get(entity_id)
+            if new_state == "on" and (old_state is None or old_state.state != "on"):
+                self.on_transitions[entity_id] += 1
+            self.hass.states.async_set(entity_id, new_state)
+
+    def first_call_after(self, entity_id: str, since: float) -> Optional[ServiceCallRecord]:
+        """First call for an entity at or after `since` (perf_counter)."""
+        for record in self.calls:
+            if record.entity_id == entity_id and record.ts >= since:
+                return record
+        return None
+
+    def reset(self):
+        self.calls.clear()
+        self.on_transitions.clear()
+
+
+class HarnessZone:
+    """Entity ids belonging to one benchmark zone."""
+
+    __slots__ = ("name", "sensor", "relays", "doors", "entity")
+
+    def __init__(self, name: str, sensor: str, relays: list[str], doors: list[str]):
+        self.name = name
+        self.sensor = sensor
+        self.relays = relays
+        self.doors = doors
+        self.entity: Optional[SmartHeatZoneClimate] = None
+
+
+class Harness:
+    """Home Assistant core + SmartHeatZones shared services + zones."""
+
+    def __init__(
+        self,
+        service_latency: float = 0.0,
+        common_settings: Optional[dict] = None,
+        virtual_clock: bool = False,
+    ):
+        self.service_latency = service_latency
+        self.virtual_clock = virtual_clock
+        self.common_settings = dict(BENCH_COMMON_SETTINGS, **(common_settings or {}))
+        self.hass: Optional[HomeAssistant] = None
+        self.switches: Optional[FakeSwitches] = None
+        self.zones: list[HarnessZone] = []
+        self._config_dir: Optional[tempfile.TemporaryDirectory] = None
+
+    async def async_start(self):
+        """Start Home Assistant core and the integration-level services."""
+        self._config_dir = tempfile.TemporaryDirectory(prefix="shz_harness_")
+        hass = HomeAssistant(self._config_dir.name)
+        if self.virtual_clock:
+            # No core timer: a time_changed event every virtual second would
+            # dominate the run. Timers (call_at / track_point_in_time) still work.
+            hass.state = CoreState.running
+        else:
+            await hass.async_start()
+        self.hass = hass
+        self.switches = FakeSwitches(hass, self.service_latency)
+
+        hass.states.async_set(BOILER_ENTITY, "off")
+        hass.states.async_set(OUTDOOR_SENSOR, "5.0")
+
+        # Same shared objects as async_setup_entry creates for the first zone
+        domain_data = hass.data.setdefault(DOMAIN, {})
+        domain_data[DATA_BOILER_MAIN] = BoilerManager(hass)
+        domain_data[DATA_BOILER_MAIN].configure(self.common_settings)
+        domain_data[DATA_DISPATCHER] = ZoneEventDispatcher(hass)
+        domain_data[DATA_OUTDOOR_TEMP] = OutdoorTemperatureService(hass, domain_data[DATA_DISPATCHER])
+        domain_data[DATA_OUTDOOR_TEMP].configure(OUTDOOR_SENSOR)
+        domain_data[DATA_PREHEAT_STORE] = ZoneDataStore(hass, "preheat")
+        await domain_data[DATA_PREHEAT_STORE].async_load()
+        domain_data[DATA_RUNTIME_STORE] = ZoneDataStore(hass, "runtime")
+        await domain_data[DATA_RUNTIME_STORE].async_load()
+        domain_data[DATA_BOILER_MAIN].attach_runtime_store(domain_data[DATA_RUNTIME_STORE])
+        heating_time_store = ZoneDataStore(hass, "heating_time")
+        await heating_time_store.async_load()
+        domain_data[DATA_HEATING_TIME] = HeatingTimeTracker(hass, heating_time_store)
+        domain_data[DATA_HEATING_TIME].attach_boiler(domain_data[DATA_BOILER_MAIN])
+        domain_data.setdefault(DATA_ACTIVE_ZONES, set())
+
+    async def async_add_zones(
+        self,
+        count: int,
+        initial_temp: float = 21.0,
+        relays_per_zone: int = 1,
+        doors_per_zone: int = 0,
+        schedule: Optional[list] = None,
+        adaptive_hysteresis: bool = True,
+        **zone_options,
+    ) -> list[HarnessZone]:
+        """Create `count` zones with their own sensor/relays/doors and add them."""
+        hass = self.hass
+        options = {
+            "heating_mode": HEATING_MODE_RADIATOR,
+            "thermostat_type": THERMOSTAT_TYPE_WALL,
+            "temp_offset": DEFAULT_TEMP_OFFSET,
+            "hysteresis": DEFAULT_HYSTERESIS,
+            "overheat_temp": DEFAULT_OVERHEAT_TEMP,
+            **zone_options,
+        }
+        added = []
+        for _ in range(count):
+            index = len(self.zones)
+            zone = HarnessZone(
+                name=f"Zone {index}",
+                sensor=f"sensor.zone_{index}_temperature",
+                relays=[f"switch.zone_{index}_relay_{r}" for r in range(relays_per_zone)],
+                doors=[f"binary_sensor.zone_{index}_door_{d}" for d in range(doors_per_zone)],
+            )
+            hass.states.async_set(zone.sensor, str(initial_temp))
+            for relay in zone.relays:
+                hass.states.async_set(relay, "off")
+            for door in zone.doors:
+                hass.states.async_set(door, "off")
+
+            entity = SmartHeatZoneClimate(
+                hass=hass,
+                name=zone.name,
+                sensor_entity_id=zone.sensor,
+                relay_entities=zone.relays,
+                door_sensors=zone.doors,
+                schedule=schedule or [],
+                boiler_entity=BOILER_ENTITY,
+                outdoor_sensor=OUTDOOR_SENSOR,
+                adaptive_hysteresis_enabled=adaptive_hysteresis,
+                **options,
+            )
+            entity.entity_id = f"climate.zone_{index}"
+            entity.async_get_last_state = _no_last_state
+            await entity.async_added_to_hass()
+
+            zone.entity = entity
+            self.zones.append(zone)
+            added.append(zone)
+
+        # First evaluation of the added zones (batched, without the batch delay)
+        await self.boiler.async_run_first_evaluation()
+        await hass.async_block_till_done()
+        return added
+
+    def set_state(self, entity_id: str, value):
+        """Change an entity state (fires state_changed like a real sensor)."""
+        self.hass.states.async_set(entity_id, str(value))
+
+    @property
+    def boiler(self) -> BoilerManager:
+        return self.hass.data[DOMAIN][DATA_BOILER_MAIN]
+
+    async def async_block(self):
+        """Wait until all pending work (events, services, state writes) is done."""
+        await self.hass.async_block_till_done()
+
+    async def async_stop(self):
+        """Stop Home Assistant and remove the temporary config dir."""
+        if self.hass is not None:
+            for zone in self.zones:
+                await zone.entity.async_will_remove_from_hass()
+            await self.hass.async_stop(force=True)
+            self.hass = None
+        if self._config_dir is not None:
+            self._config_dir.cleanup()
+            self._config_dir = None
+
+
+async def _no_last_state():
+    """RestoreEntity stand-in: nothing to restore."""
+    return None
+
+
+def quiet_logging(level: int = logging.WARNING):
+    """Keep per-event INFO logs out of measurements."""
+    logging.basicConfig(level=level, format="%(levelname)s %(name)s: %(message)s")
+    logging.getLogger("custom_components.smartheatzones").setLevel(level)
+    logging.getLogger("homeassistant").setLevel(level)
+    # Zones are added without an entity platform on purpose
+    logging.getLogger("homeassistant.helpers.entity").setLevel(max(level, logging.ERROR))
@@ -0,0 +1,347 @@
+"""
+SmartHeatZones - Offline thermal simulator
+Version: 1.10.0
+
+NEW in v1.10.0:
+- Replays whole heating seasons against the real SmartHeatZoneClimate and
+  BoilerManager code on the local Home Assistant stand-in (harness.py) with a
+  virtual clock - a winter takes seconds instead of months
+- Per room lumped thermal model: room air + emitter (radiator or underfloor
+  slab with hours of lag), heat loss to outdoor, extra loss while a door is open
+- Outdoor profile: seasonal trend + daily swing + random weather drift
+- Reports boiler starts, relay cycles, overshoot and comfort-minutes
+
+Usage:
+    python tools/thermal_simulator.py
+    python tools/thermal_simulator.py --days 90 --zones 8 --underfloor 3 --json
+    python tools/thermal_simulator.py --days 30 --preheat --filter ema --deadband 0.1
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+import time
+from datetime import datetime
+
+from harness import BOILER_ENTITY, OUTDOOR_SENSOR, Harness, quiet_logging, run_virtual
+
+from custom_components.smartheatzones.const import (
+    CONF_BOILER_COALESCE_WINDOW,
+    CONF_BOILER_MIN_OFF_TIME,
+    CONF_BOILER_MIN_ON_TIME,
+    CONF_PIGGYBACK_CONCURRENCY,
+    DEFAULT_BOILER_COALESCE_WINDOW,
+    DEFAULT_BOILER_MIN_OFF_TIME,
+    DEFAULT_BOILER_MIN_ON_TIME,
+    DEFAULT_HYSTERESIS,
+    DEFAULT_PIGGYBACK_CONCURRENCY,
+    DEFAULT_SENSOR_DEADBAND,
+    DEFAULT_MIN_EVAL_INTERVAL,
+    DEFAULT_FILTER_WINDOW,
+    HEATING_MODE_RADIATOR,
+    HEATING_MODE_UNDERFLOOR,
+    SENSOR_FILTER_NONE,
+    SENSOR_FILTERS,
+)
+from custom_components.smartheatzones.schedule import CompiledSchedule
+
+STEP_SECONDS = 60  # thermal model / sensor update step
+OUTDOOR_UPDATE_MINUTES = 10
+START = datetime(2025, 12, 1, 0, 0)
+
+# Comfort band around the scheduled target
+COMFORT_BELOW = 0.5
+COMFORT_ABOVE = 1.0
+OVERSHOOT_MARGIN = 0.5
+
+DEFAULT_SCHEDULE = [
+    {"label": "Morning", "start": "06:00", "end": "08:00", "temp": 21.0},
+    {"label": "Day", "start": "08:00", "end": "16:00", "temp": 19.0},
+    {"label": "Evening", "start": "16:00", "end": "22:00", "temp": 21.5},
+    {"label": "Night", "start": "22:00", "end": "06:00", "temp": 18.0},
+]
+
+# Emitter parameters (rates per hour):
+#   supply    - flow temperature while the zone relay and the boiler are on
+#   charge    - emitter approach to the supply temperature
+#   release   - emitter → room exchange (emitter side)
+#   room_gain - emitter → room exchange (room side, smaller: room is heavier)
+EMITTERS = {
+    HEATING_MODE_RADIATOR: {"supply": 60.0, "charge": 6.0, "release": 2.0, "room_gain": 0.08},
+    HEATING_MODE_UNDERFLOOR: {"supply": 40.0, "charge": 0.4, "release": 0.3, "room_gain": 0.1},
+}
+LOSS_RATE = 0.025  # room → outdoor, 1/h
+DOOR_LOSS_RATE = 0.15  # extra loss while a door is open, 1/h
+DOOR_OPENINGS_PER_DAY = 4
+DOOR_OPEN_MINUTES = (1, 10)
+
+
+class Room:
+    """Thermal state of one simulated room (°C)."""
+
+    __slots__ = (
+        "zone", "mode", "emitter", "loss", "air", "emitter_temp", "noise",
+        "reported", "door_close_at", "comfort", "cold", "overshoot_max",
+        "overshoot_degree_minutes", "relay_on_minutes", "samples", "last_target",
+        "setback",
+    )
+
+    def __init__(self, zone, mode: str, rng: random.Random, initial_temp: float, noise: float):
+        self.zone = zone
+        self.mode = mode
+        # ±15 % spread: no two rooms behave exactly the same
+        self.emitter = {key: value * rng.uniform(0.85, 1.15) for key, value in EMITTERS[mode].items()}
+        self.emitter["supply"] = EMITTERS[mode]["supply"]
+        self.loss = LOSS_RATE * rng.uniform(0.85, 1.15)
+        self.air = initial_temp
+        self.emitter_temp = initial_temp
+        self.noise = noise
+        self.reported = None
+        self.door_close_at = None
+        self.comfort = 0
+        self.cold = 0
+        self.overshoot_max = 0.0
+        self.overshoot_degree_minutes = 0.0
+        self.relay_on_minutes = 0
+        self.samples = 0
+        self.last_target = None
+        self.setback = False  # target lowered, room still cooling down to it
+
+    def step(self, hours: float, outdoor: float, heating: bool, door_open: bool):
+        """Explicit Euler step of the two-node model."""
+        p = self.emitter
+        emitter_delta = p["release"] * (self.air - self.emitter_temp)
+        if heating:
+            emitter_delta += p["charge"] * (p["supply"] - self.emitter_temp)
+        loss = self.loss + (DOOR_LOSS_RATE if door_open else 0.0)
+        air_delta = p["room_gain"] * (self.emitter_temp - self.air) - loss * (self.air - outdoor)
+        self.emitter_temp += emitter_delta * hours
+        self.air += air_delta * hours
+
+    def sensor_reading(self, rng: random.Random) -> float:
+        """What the zone sensor would report (noise, 0.1 °C resolution)."""
+        return round(self.air + rng.gauss(0.0, self.noise), 1)
+
+    def score(self, target: float):
+        self.samples += 1
+        if self.last_target is not None and target < self.last_target:
+            self.setback = True
+        self.last_target = target
+        if self.setback and self.air <= target + OVERSHOOT_MARGIN:
+            self.setback = False
+        if self.air < target - COMFORT_BELOW:
+            self.cold += 1
+        elif self.air <= target + COMFORT_ABOVE:
+            self.comfort += 1
+        excess = self.air - (target + OVERSHOOT_MARGIN)
+        if excess > 0 and not self.setback:
+            self.overshoot_degree_minutes += excess * STEP_SECONDS / 60
+            self.overshoot_max = max(self.overshoot_max, excess)
+
+
+class OutdoorProfile:
+    """Seasonal trend + daily swing (coldest around 05:00) + weather drift."""
+
+    def __init__(self, rng: random.Random, mean: float, days: int):
+        self._rng = rng
+        self._mean = mean
+        self._days = max(1, days)
+        self._drift = 0.0
+
+    def temperature(self, elapsed_days: float) -> float:
+        # Coldest in the middle of the simulated period
+        seasonal = self._mean - 3.0 * math.sin(math.pi * min(elapsed_days, self._days) / self._days)
+        hour = (elapsed_days % 1.0) * 24
+        daily = -4.0 * math.cos(2 * math.pi * (hour - 5) / 24)
+        # Mean reverting random walk: weather fronts over a few days
+        self._drift = self._drift * 0.995 + self._rng.gauss(0.0, 0.15)
+        return seasonal + daily + self._drift
+
+
+async def simulate(args) -> dict:
+    rng = random.Random(args.seed)
+    common_settings = {
+        CONF_BOILER_COALESCE_WINDOW: args.coalesce_window,
+        CONF_BOILER_MIN_ON_TIME: args.min_on_time,
+        CONF_BOILER_MIN_OFF_TIME: args.min_off_time,
+        CONF_PIGGYBACK_CONCURRENCY: args.piggyback_concurrency,
+    }
+    harness = Harness(common_settings=common_settings, virtual_clock=True)
+    await harness.async_start()
+    # A season of calls would only grow memory; transitions are still counted
+    harness.switches.record_calls = False
+    try:
+        underfloor = min(args.underfloor, args.zones)
+        zone_options = {
+            "schedule": DEFAULT_SCHEDULE,
+            "doors_per_zone": 1,
+            "initial_temp": args.initial_temp,
+            "hysteresis": args.hysteresis,
+            "sensor_deadband": args.deadband,
+            "min_eval_interval": args.min_eval_interval,
+            "sensor_filter": args.filter,
+            "filter_window": args.filter_window,
+            "preheat_enabled": args.preheat,
+        }
+        zones = await harness.async_add_zones(
+            args.zones - underfloor, heating_mode=HEATING_MODE_RADIATOR, **zone_options
+        )
+        modes = [HEATING_MODE_RADIATOR] * len(zones)
+        if underfloor:
+            zones += await harness.async_add_zones(
+                underfloor, heating_mode=HEATING_MODE_UNDERFLOOR, **zone_options
+            )
+            modes += [HEATING_MODE_UNDERFLOOR] * underfloor
+
+        rooms = [Room(zone, mode, rng, args.initial_temp, args.noise) for zone, mode in zip(zones, modes)]
+        outdoor = OutdoorProfile(rng, args.outdoor_mean, args.days)
+        schedule = CompiledSchedule(DEFAULT_SCHEDULE)
+        states = harness.hass.states
+        harness.switches.reset()
+
+        steps = args.days * 24 * 3600 // STEP_SECONDS
+        warmup_steps = args.warmup_hours * 3600 // STEP_SECONDS
+        hours = STEP_SECONDS / 3600
+        door_chance = DOOR_OPENINGS_PER_DAY / (16 * 60)  # openings spread over 06-22
+        outdoor_temp = outdoor.temperature(0.0)
+        boiler_on_minutes = 0
+        wall_start = time.perf_counter()
+
+        for step in range(steps):
+            minute = step * STEP_SECONDS // 60
+            minute_of_day = minute % (24 * 60)
+            if minute % OUTDOOR_UPDATE_MINUTES == 0:
+                outdoor_temp = outdoor.temperature(minute / (24 * 60))
+                harness.set_state(OUTDOOR_SENSOR, round(outdoor_temp, 1))
+
+            boiler_on = states.is_state(BOILER_ENTITY, "on")
+            boiler_on_minutes += boiler_on
+            target = schedule.block_at(minute_of_day).temp
+            daytime = 6 * 60 <= minute_of_day < 22 * 60
+
+            for room in rooms:
+                zone = room.zone
+                door = zone.doors[0]
+                if room.door_close_at is None:
+                    if daytime and rng.random() < door_chance:
+                        room.door_close_at = minute + rng.randint(*DOOR_OPEN_MINUTES)
+                        harness.set_state(door, "on")
+                elif minute >= room.door_close_at:
+                    room.door_close_at = None
+                    harness.set_state(door, "off")
+
+                relay_on = states.is_state(zone.relays[0], "on")
+                room.relay_on_minutes += relay_on
+                room.step(hours, outdoor_temp, relay_on and boiler_on, room.door_close_at is not None)
+
+                reading = room.sensor_reading(rng)
+                if reading != room.reported:
+                    room.reported = reading
+                    harness.set_state(zone.sensor, reading)
+
+                if step >= warmup_steps:
+                    room.score(target)
+
+            # Virtual time: runs every timer due in the next minute, then jumps
+            await asyncio.sleep(STEP_SECONDS)
+
+        await harness.async_block()
+        wall_seconds = time.perf_counter() - wall_start
+        transitions = harness.switches.on_transitions
+        boiler_state = harness.boiler.get_boiler_state()
+
+        zone_results = []
+        for room in rooms:
+            samples = max(1, room.samples)
+            zone_results.append({
+                "zone": room.zone.name,
+                "mode": room.mode,
+                "relay_cycles": transitions[room.zone.relays[0]],
+                "relay_on_hours": round(room.relay_on_minutes * STEP_SECONDS / 3600, 1),
+                "comfort_minutes": room.comfort * STEP_SECONDS // 60,
+                "comfort_pct": round(room.comfort / samples * 100, 1),
+                "cold_minutes": room.cold * STEP_SECONDS // 60,
+                "overshoot_max": round(room.overshoot_max, 2),
+                "overshoot_degree_minutes": round(room.overshoot_degree_minutes, 1),
+            })
+
+        total_samples = max(1, sum(room.samples for room in rooms))
+        return {
+            "days": args.days,
+            "zones": len(rooms),
+            "underfloor": underfloor,
+            "seed": args.seed,
+            "wall_seconds": round(wall_seconds, 2),
+            "boiler_starts": boiler_state["boiler_starts"],
+            "boiler_switch_ons": transitions[BOILER_ENTITY],
+            "boiler_on_hours": round(boiler_on_minutes * STEP_SECONDS / 3600, 1),
+            "relay_cycles": sum(zone["relay_cycles"] for zone in zone_results),
+            "comfort_pct": round(sum(room.comfort for room in rooms) / total_samples * 100, 1),
+            "cold_minutes": sum(zone["cold_minutes"] for zone in zone_results),
+            "overshoot_max": max((zone["overshoot_max"] for zone in zone_results), default=0.0),
+            "overshoot_degree_minutes": round(sum(zone["overshoot_degree_minutes"] for zone in zone_results), 1),
+            "per_zone": zone_results,
+        }
+    finally:
+        await harness.async_stop()
+
+
+def print_report(result: dict):
+    print(
+        f"{result['days']} days, {result['zones']} zones ({result['underfloor']} underfloor), "
+        f"seed {result['seed']} - simulated in {result['wall_seconds']:.1f} s"
+    )
+    print(
+        f"boiler: {result['boiler_starts']} starts, {result['boiler_on_hours']} h on | "
+        f"relay cycles: {result['relay_cycles']} | comfort: {result['comfort_pct']}% | "
+        f"cold: {result['cold_minutes']} min | overshoot max {result['overshoot_max']} °C, "
+        f"{result['overshoot_degree_minutes']} °C·min"
+    )
+    header = (
+        f"{'zone':<10} {'mode':<11} {'cycles':>7} {'on h':>7} {'comfort %':>10} "
+        f"{'cold min':>9} {'over max':>9} {'over °C·min':>12}"
+    )
+    print(header)
+    print("-" * len(header))
+    for z in result["per_zone"]:
+        print(
+            f"{z['zone']:<10} {z['mode']:<11} {z['relay_cycles']:>7} {z['relay_on_hours']:>7} "
+            f"{z['comfort_pct']:>10} {z['cold_minutes']:>9} {z['overshoot_max']:>9} "
+            f"{z['overshoot_degree_minutes']:>12}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SmartHeatZones offline thermal simulator")
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--zones", type=int, default=6)
+    parser.add_argument("--underfloor", type=int, default=2, help="how many of the zones are underfloor")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--initial-temp", type=float, default=20.0)
+    parser.add_argument("--outdoor-mean", type=float, default=2.0, help="°C, mean of the period")
+    parser.add_argument("--noise", type=float, default=0.05, help="sensor noise σ (°C)")
+    parser.add_argument("--warmup-hours", type=int, default=24, help="excluded from the scores")
+    parser.add_argument("--hysteresis", type=float, default=DEFAULT_HYSTERESIS)
+    parser.add_argument("--deadband", type=float, default=DEFAULT_SENSOR_DEADBAND)
+    parser.add_argument("--min-eval-interval", type=float, default=DEFAULT_MIN_EVAL_INTERVAL)
+    parser.add_argument("--filter", choices=SENSOR_FILTERS, default=SENSOR_FILTER_NONE)
+    parser.add_argument("--filter-window", type=int, default=DEFAULT_FILTER_WINDOW)
+    parser.add_argument("--preheat", action="store_true", help="predictive pre-heat")
+    parser.add_argument("--coalesce-window", type=float, default=DEFAULT_BOILER_COALESCE_WINDOW)
+    parser.add_argument("--min-on-time", type=float, default=DEFAULT_BOILER_MIN_ON_TIME)
+    parser.add_argument("--min-off-time", type=float, default=DEFAULT_BOILER_MIN_OFF_TIME)
+    parser.add_argument("--piggyback-concurrency", type=int, default=DEFAULT_PIGGYBACK_CONCURRENCY)
+    parser.add_argument("--json", action="store_true", help="machine readable output")
+    parser.add_argument("--debug", action="store_true", help="integration debug logging")
+    args = parser.parse_args()
+
+    # Door warnings would flood the output of a season
+    quiet_logging(logging.DEBUG if args.debug else logging.ERROR)
+    result = run_virtual(simulate(args), START)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result)